@@ -0,0 +1,419 @@
+"""
+Pool of authenticated LinkedIn accounts with per-account rate budgets.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import Future, wait as wait_futures, FIRST_COMPLETED
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from loguru import logger
+
+from errors import ThrottledError
+from rate_limiter import RateLimiter, AdaptiveRateController, detect_throttle
+from session_store import SessionStore, create_api_client
+
+
+# API client methods the pool routes, and the rate budget each one draws from
+ENDPOINTS = {
+    "get_profile": "profile",
+    "search_jobs": "jobs",
+    "get_company": "company",
+    "search_people": "people",
+}
+
+# Final URLs showing LinkedIn sent an API request to the login page
+SESSION_REJECTED_URL_MARKERS = ("/login", "/uas/login", "/authwall")
+
+
+def load_accounts(path: str) -> List[Tuple[str, str]]:
+    """
+    Read account credentials from a JSON file.
+
+    The file holds a list of ``{"email": ..., "password": ...}`` objects.
+
+    Args:
+        path: Path to the credentials file
+
+    Returns:
+        List of (email, password) tuples
+
+    Raises:
+        ValueError: If the file is not a list of credentials
+    """
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError("The accounts file must contain a list of accounts")
+
+    accounts = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("email") or not entry.get("password"):
+            raise ValueError("Every account needs an email and a password")
+        accounts.append((entry["email"], entry["password"]))
+    return accounts
+
+
+class Account:
+    """
+    One LinkedIn account of the pool and its health.
+
+    Each account draws from its own RateLimiter, whose rate is adapted to
+    how LinkedIn responds to that account alone.
+    """
+
+    def __init__(self, email: str, password: str, limiter: RateLimiter, session_store: Optional[SessionStore] = None):
+        """
+        Initialize the account.
+
+        Args:
+            email: LinkedIn account email
+            password: LinkedIn account password
+            limiter: The account's own rate budget
+            session_store: Store of the account's saved session
+        """
+        self.email = email
+        self.password = password
+        self.limiter = limiter
+        self.rate_controller = AdaptiveRateController.from_env(limiter)
+        self.session_store = session_store
+        self.client = None
+        self.login: Optional[Future] = None
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.cooldown_until = 0.0
+
+    def available(self, now: float) -> bool:
+        """Whether the account is logged in and not cooling down."""
+        return self.client is not None and self.cooldown_until <= now
+
+    def stats(self, now: float) -> Dict[str, Any]:
+        """
+        Get the account's state.
+
+        Returns:
+            Login and health state, load and current request rates
+        """
+        if self.client is not None:
+            state = "cooling_down" if self.cooldown_until > now else "ready"
+        else:
+            state = "logging_in" if self.login is not None and not self.login.done() else "unavailable"
+        return {
+            "email": self.email,
+            "state": state,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "cooldown_remaining": round(max(0.0, self.cooldown_until - now), 1),
+            "rates": self.rate_controller.metrics()["rates"],
+        }
+
+
+class AccountPool:
+    """
+    Routes API calls across several authenticated LinkedIn accounts.
+
+    Each call goes to the least-loaded healthy account: the one with the
+    fewest requests in flight that has a token of the endpoint's budget
+    available right now, or failing that the one whose budget refills
+    first. Because every account has its own budget, throughput grows with
+    the number of accounts.
+
+    An account that is throttled, or fails ``failure_threshold`` times in a
+    row, cools down for ``cooldown`` seconds (or as long as LinkedIn asked).
+    An account whose session LinkedIn rejects logs in again in the
+    background. Throttled and rejected calls are retried once on another
+    account.
+
+    The pool exposes the routed API client methods (``get_profile``,
+    ``search_jobs``, ``get_company``, ``search_people``), so it can stand in
+    for a single client.
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[Account],
+        factory,
+        failure_threshold: int = 3,
+        cooldown: float = 300.0,
+    ):
+        """
+        Initialize the pool. Call start() to log the accounts in.
+
+        Args:
+            accounts: Accounts of the pool
+            factory: LinkedIn API client class
+            failure_threshold: Consecutive failures before an account cools down
+            cooldown: Seconds an unhealthy account is skipped
+        """
+        self.accounts: List[Account] = list(accounts)
+        if not self.accounts:
+            raise ValueError("An account pool needs at least one account")
+        self.factory = factory
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._state = threading.local()
+
+    @classmethod
+    def from_env(cls, factory) -> Optional["AccountPool"]:
+        """
+        Build a pool from environment variables.
+
+        ``LINKEDIN_ACCOUNTS_FILE`` is the JSON credentials file (see
+        load_accounts). ``ACCOUNT_FAILURE_THRESHOLD`` and
+        ``ACCOUNT_COOLDOWN`` override the defaults. Each account's budget is
+        configured like the scraper's (``RATE_LIMIT_*``) and its session is
+        saved like a single account's (``LINKEDIN_SESSION_*``).
+
+        Args:
+            factory: LinkedIn API client class
+
+        Returns:
+            Configured AccountPool, or None if no accounts file is set
+        """
+        path = os.getenv("LINKEDIN_ACCOUNTS_FILE")
+        if not path:
+            return None
+
+        accounts = []
+        for email, password in load_accounts(path):
+            digest = hashlib.sha256(email.lower().encode("utf-8")).hexdigest()[:16]
+            accounts.append(Account(
+                email,
+                password,
+                RateLimiter.from_env(namespace=f"account:{digest}:"),
+                SessionStore.from_env(password),
+            ))
+        return cls(
+            accounts,
+            factory,
+            failure_threshold=int(os.getenv("ACCOUNT_FAILURE_THRESHOLD", 3)),
+            cooldown=float(os.getenv("ACCOUNT_COOLDOWN", 300)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def start(self):
+        """Log every account in, each on its own background thread."""
+        for account in self.accounts:
+            self._start_login(account)
+
+    def _start_login(self, account: Account, refresh: bool = False):
+        """Log an account in on a background thread."""
+        account.login = Future()
+        threading.Thread(
+            target=self._login,
+            args=(account, account.login, refresh),
+            name="linkedin-login",
+            daemon=True,
+        ).start()
+
+    def _login(self, account: Account, future: Future, refresh: bool):
+        """
+        Log an account in and resolve ``future`` with whether it succeeded.
+
+        A saved session is reused unless ``refresh`` is set, in which case it
+        is discarded and the account logs in with its password.
+        """
+        try:
+            store = account.session_store
+            if refresh and store is not None:
+                store.clear(account.email)
+
+            saved = store.load(account.email) if store is not None else None
+            if saved:
+                cookies, metadata = saved
+                client = create_api_client(self.factory, account.email, account.password, cookies=cookies)
+                client.client.metadata.update(metadata)
+            else:
+                client = create_api_client(self.factory, account.email, account.password)
+                if store is not None:
+                    store.save(account.email, client.client.cookies, client.client.metadata)
+
+            client.client.session.hooks["response"].append(account.rate_controller.requests_hook)
+            client.client.session.hooks["response"].append(self._response_hook)
+            with self._lock:
+                account.client = client
+                account.failures = 0
+            logger.info(f"LinkedIn account {account.email} is ready")
+            future.set_result(True)
+        except Exception as e:
+            logger.warning(f"Could not log in LinkedIn account {account.email}: {e}")
+            future.set_result(False)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until at least one account has logged in.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if an account is logged in, False if every login failed or
+            the timeout passed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = {account.login for account in self.accounts if account.login is not None}
+        while True:
+            if any(account.client is not None for account in self.accounts):
+                return True
+            if not pending:
+                return False
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = wait_futures(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                return False
+
+    def _response_hook(self, response, *args, **kwargs):
+        """Note throttling and session rejection of the current call (requests response hook)."""
+        throttle = detect_throttle(response.status_code, response.headers, response.url)
+        if throttle is not None:
+            self._state.throttle = throttle
+        if response.status_code == 401 or any(marker in str(response.url) for marker in SESSION_REJECTED_URL_MARKERS):
+            self._state.session_rejected = True
+
+    def _checkout(self, endpoint: str, exclude: Iterable[Account] = ()) -> Account:
+        """
+        Pick the least-loaded healthy account and take a token of its budget.
+
+        Args:
+            endpoint: Endpoint whose budget is drawn from
+            exclude: Accounts not to use
+
+        Returns:
+            The chosen account, with the call counted as in flight
+
+        Raises:
+            ThrottledError: If no account is available
+        """
+        now = time.monotonic()
+        with self._lock:
+            healthy = [account for account in self.accounts if account.available(now) and account not in exclude]
+            if not healthy:
+                cooling = [account.cooldown_until - now for account in self.accounts if account.client is not None]
+                raise ThrottledError(
+                    "No LinkedIn account is available",
+                    retry_after=min(cooling) if cooling else None,
+                )
+
+            healthy.sort(key=lambda account: account.in_flight)
+            chosen = next((account for account in healthy if account.limiter.bucket(endpoint).try_acquire()), None)
+            reserved = chosen is not None
+            if chosen is None:
+                chosen = max(healthy, key=lambda account: account.limiter.bucket(endpoint).tokens)
+            chosen.in_flight += 1
+            chosen.requests += 1
+
+        if not reserved:
+            try:
+                chosen.limiter.acquire(endpoint)
+            except BaseException:
+                # The call is never made
+                with self._lock:
+                    chosen.in_flight -= 1
+                    chosen.requests -= 1
+                raise
+        return chosen
+
+    def _cool_down(self, account: Account, seconds: float, reason: str):
+        """Skip an account for ``seconds``."""
+        with self._lock:
+            account.cooldown_until = max(account.cooldown_until, time.monotonic() + seconds)
+        logger.warning(f"LinkedIn account {account.email} {reason}; cooling down for {seconds:.0f}s")
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call an API client method on the least-loaded healthy account.
+
+        Args:
+            method: API client method name (see ENDPOINTS)
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The result of the method
+
+        Raises:
+            ThrottledError: If no account is available
+        """
+        endpoint = ENDPOINTS[method]
+        tried: List[Account] = []
+        while True:
+            account = self._checkout(endpoint, exclude=tried)
+            tried.append(account)
+            self._state.throttle = None
+            self._state.session_rejected = False
+            error = None
+            try:
+                result = getattr(account.client, method)(*args, **kwargs)
+            except Exception as e:
+                error = e
+            finally:
+                with self._lock:
+                    account.in_flight -= 1
+
+            throttle = self._state.throttle
+            if self._state.session_rejected:
+                with self._lock:
+                    account.client = None
+                logger.warning(f"LinkedIn rejected the session of {account.email}; logging in again")
+                self._start_login(account, refresh=True)
+            elif throttle is not None:
+                self._cool_down(account, throttle.retry_after or self.cooldown, "was throttled")
+            elif error is not None:
+                with self._lock:
+                    account.failures += 1
+                    failures = account.failures
+                if failures >= self.failure_threshold:
+                    self._cool_down(account, self.cooldown, f"failed {failures} times in a row")
+                raise error
+            else:
+                with self._lock:
+                    account.failures = 0
+                return result
+
+            # Throttled or rejected: retry once on another account
+            if len(tried) > 1:
+                if error is not None:
+                    raise error
+                raise throttle or ThrottledError("LinkedIn rejected the account sessions")
+
+    def get_profile(self, *args, **kwargs) -> Dict[str, Any]:
+        """Get a profile (see Linkedin.get_profile)."""
+        return self.call("get_profile", *args, **kwargs)
+
+    def search_jobs(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Search jobs (see Linkedin.search_jobs)."""
+        return self.call("search_jobs", *args, **kwargs)
+
+    def get_company(self, *args, **kwargs) -> Dict[str, Any]:
+        """Get a company (see Linkedin.get_company)."""
+        return self.call("get_company", *args, **kwargs)
+
+    def search_people(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Search people (see Linkedin.search_people)."""
+        return self.call("search_people", *args, **kwargs)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Get the state of every account.
+
+        Returns:
+            One dictionary per account (see Account.stats)
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [account.stats(now) for account in self.accounts]
@@ -0,0 +1,640 @@
+"""
+Asyncio LinkedIn scraper implementation.
+"""
+
+import sys
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List, Any, Optional
+from pathlib import Path
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from loguru import logger
+
+from scraper import LinkedInScraper, JOB_PAGE_SIZE, STREAM_CHUNK_SIZE, _job_query, _job_page_key
+from extractors import PROFILE_EXTRACTOR
+from records import JobRecord, PersonRecord
+from utils import (
+    sanitize_url,
+    extract_linkedin_id,
+    encode_cursor,
+    decode_cursor,
+)
+from rate_limiter import rate_limited, detect_throttle
+from retry import retrying, is_caller_error
+from errors import CircuitOpenError, ToolCancelledError
+from cache import SearchResultCache, validate_cache_policy
+from singleflight import AsyncSingleFlight, flight_key
+
+
+class AsyncLinkedInScraper:
+    """
+    An asyncio scraper for extracting data from LinkedIn.
+
+    Web pages are fetched through the scraper's transport without blocking
+    the event loop, and all waiting is done with asyncio.sleep, so one
+    process can keep many lookups in flight. The linkedin_api client is
+    synchronous, so its calls are run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        scraper: Optional[LinkedInScraper] = None,
+    ):
+        """
+        Initialize the async LinkedIn scraper.
+
+        Args:
+            email: LinkedIn account email
+            password: LinkedIn account password
+            scraper: Existing LinkedInScraper to share authentication, rate
+                limits and retry policy with
+        """
+        self.scraper = scraper or LinkedInScraper(email=email, password=password)
+        self.rate_limiter = self.scraper.rate_limiter
+        self.retry_policy = self.scraper.retry_policy
+        self._flights = AsyncSingleFlight()
+        self._refreshes = set()
+
+    @property
+    def api_client(self):
+        """
+        The linkedin_api client of the underlying scraper, if any.
+
+        Call wait_for_login first; this blocks while a login is in progress.
+        """
+        return self.scraper.api_client
+
+    async def wait_for_login(self):
+        """Wait, without blocking the event loop, for a background login to finish."""
+        future = self.scraper.login_pending
+        if future is None:
+            return
+        try:
+            # Shielded so a timeout here does not cancel the login itself
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self.scraper.login_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("LinkedIn login is still in progress. Continuing without the API client.")
+
+    @property
+    def cache(self):
+        """The persistent cache of the underlying scraper, if enabled."""
+        return self.scraper.cache
+
+    @property
+    def search_cache(self):
+        """The search-result cache of the underlying scraper, if enabled."""
+        return self.scraper.search_cache
+
+    async def scrape_profile(self, profile_url: str, cache_policy: str = "use") -> Dict[str, Any]:
+        """
+        Scrape a LinkedIn profile.
+
+        Args:
+            profile_url: LinkedIn profile URL
+            cache_policy: "use" to serve a fresh cached copy, "refresh" to
+                re-fetch and update the cache, "bypass" to skip the cache
+
+        Returns:
+            Dictionary containing profile information
+        """
+        validate_cache_policy(cache_policy)
+        profile_url = sanitize_url(profile_url)
+        profile_id = extract_linkedin_id(profile_url)
+
+        if not profile_id:
+            raise ValueError("Could not extract profile ID from URL")
+
+        return await self._cached("profile", profile_id.lower(), cache_policy, self._fetch_profile, profile_url, profile_id)
+
+    async def scrape_profiles(
+        self,
+        profile_urls: Iterable[str],
+        concurrency: int = 5,
+        cache_policy: str = "use",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape many LinkedIn profiles concurrently.
+
+        URLs naming the same profile are scraped once. At most
+        ``concurrency`` profiles are in flight at a time, and each fetch
+        still waits for the profile rate limiter. Results are yielded as
+        they complete, not in input order; a profile that fails is reported
+        in its result instead of aborting the batch.
+
+        Args:
+            profile_urls: LinkedIn profile URLs
+            concurrency: Maximum number of profiles scraped at once
+            cache_policy: "use", "refresh" or "bypass" (see scrape_profile)
+
+        Yields:
+            Dictionaries with ``url``, ``profile_id`` and ``success``, plus
+            ``profile`` on success or ``error`` on failure
+        """
+        validate_cache_policy(cache_policy)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scrape_one(url: str, profile_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    profile = await self.scrape_profile(url, cache_policy=cache_policy)
+                except Exception as e:
+                    return {"url": url, "profile_id": profile_id, "success": False, "error": str(e)}
+            return {"url": url, "profile_id": profile_id, "success": True, "profile": profile}
+
+        seen = set()
+        tasks = []
+        for url in profile_urls:
+            try:
+                profile_id = extract_linkedin_id(sanitize_url(url))
+                if not profile_id:
+                    raise ValueError("Could not extract profile ID from URL")
+            except ValueError as e:
+                yield {"url": url, "profile_id": None, "success": False, "error": str(e)}
+                continue
+            if profile_id.lower() in seen:
+                continue
+            seen.add(profile_id.lower())
+            tasks.append(asyncio.ensure_future(scrape_one(url, profile_id)))
+
+        logger.info(f"Scraping {len(tasks)} profiles with concurrency {concurrency}")
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer stopped early; don't leave fetches running
+            for task in tasks:
+                task.cancel()
+
+    @retrying
+    @rate_limited("profile")
+    async def _fetch_profile(self, profile_url: str, profile_id: str) -> Dict[str, Any]:
+        """
+        Fetch a profile from LinkedIn.
+
+        Args:
+            profile_url: Sanitized LinkedIn profile URL
+            profile_id: Public profile ID from the URL
+
+        Returns:
+            Dictionary containing profile information
+        """
+        logger.info(f"Scraping profile: {profile_url}")
+
+        try:
+            # Try using API client first
+            await self.wait_for_login()
+            if self.api_client:
+                try:
+                    logger.debug("Using LinkedIn API client")
+                    profile_data = await self._guarded(
+                        "linkedin_api", "profile", self._api, self.api_client.get_profile, profile_id
+                    )
+                    return self.scraper._format_profile_data(profile_data, profile_url)
+                except CircuitOpenError as e:
+                    logger.debug(f"{e}. Using web scraping.")
+                except Exception as e:
+                    logger.warning(f"API client failed: {e}. Falling back to web scraping.")
+
+            # Fallback to web scraping
+            return await self._guarded("web", "profile", self._scrape_profile_web, profile_url)
+
+        except Exception as e:
+            logger.error(f"Error scraping profile {profile_url}: {e}")
+            raise
+
+    async def _cached(self, namespace: str, key: str, cache_policy: str, fetch, *args, **kwargs):
+        """
+        Serve a lookup from the shared persistent cache, fetching on a miss.
+
+        Concurrent fetches of the same entity share one upstream request.
+
+        Args:
+            namespace: Entity type (profile, company)
+            key: Canonical entity identifier
+            cache_policy: "use", "refresh" or "bypass"
+            fetch: Coroutine function fetching the entity from LinkedIn
+            *args: Positional arguments for ``fetch``
+            **kwargs: Keyword arguments for ``fetch``
+
+        Returns:
+            The cached or freshly fetched entity
+        """
+        if self.cache is None or cache_policy == "bypass":
+            return await self._flights.do((namespace, key), fetch, *args, **kwargs)
+
+        # The persistent cache is SQLite with compressed rows; keep it off the event loop
+        if cache_policy == "use":
+            cached = await asyncio.to_thread(self.scraper._cache_lookup, namespace, key)
+            if cached is not None:
+                return cached
+
+        result = await self._flights.do((namespace, key), fetch, *args, **kwargs)
+        if "error" not in result:
+            await asyncio.to_thread(self.cache.set, namespace, key, result)
+        return result
+
+    async def _guarded(self, backend: str, operation: str, func, *args, **kwargs):
+        """
+        Await a backend call through the shared circuit breaker.
+
+        Breaker failures are counted as in LinkedInScraper._guarded.
+
+        Args:
+            backend: Backend name (linkedin_api, web)
+            operation: Operation name (profile, jobs, company, people)
+            func: Coroutine function to call
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of ``func``
+
+        Raises:
+            CircuitOpenError: If the breaker is open and the call was skipped
+        """
+        breaker = self.scraper.circuit_breakers.get(backend, operation)
+        if not breaker.allow_request():
+            raise CircuitOpenError(backend, operation, breaker.retry_in)
+
+        try:
+            result = await func(*args, **kwargs)
+        except ToolCancelledError:
+            breaker.record_ignored()
+            raise
+        except Exception as e:
+            if is_caller_error(e):
+                breaker.record_ignored()
+            else:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_ignored()
+            raise
+
+        breaker.record_success()
+        return result
+
+    async def _cached_search(self, key, cache_policy: str, fetch, *args) -> List[Dict[str, Any]]:
+        """
+        Serve a search from the shared search-result cache, fetching on a miss.
+
+        Stale results are returned immediately while a background task
+        brings the entry up to date.
+
+        Args:
+            key: Normalized query key (see flight_key)
+            cache_policy: "use", "refresh" or "bypass"
+            fetch: Coroutine function running the search on LinkedIn
+            *args: Positional arguments for ``fetch``
+
+        Returns:
+            The cached or freshly fetched results
+        """
+        if self.search_cache is None or cache_policy == "bypass":
+            return await self._flights.do(key, fetch, *args)
+
+        if cache_policy == "use":
+            cached, state = self.search_cache.get(key)
+            if state == SearchResultCache.STALE:
+                self._schedule_refresh(key, fetch, *args)
+            if cached is not None:
+                return cached
+
+        result = await self._flights.do(key, fetch, *args)
+        # Storing checks the API client, which may be logging in
+        await asyncio.to_thread(self.scraper._store_search, key, result)
+        return result
+
+    def _schedule_refresh(self, key, fetch, *args):
+        """Refresh a stale search in a background task, once per key at a time."""
+        if not self.search_cache.begin_refresh(key):
+            return
+
+        async def refresh():
+            try:
+                result = await self._flights.do(key, fetch, *args)
+                await asyncio.to_thread(self.scraper._store_search, key, result)
+            except Exception as e:
+                logger.warning(f"Background refresh of {key[0]} search failed: {e}")
+            finally:
+                self.search_cache.end_refresh(key)
+
+        # Keep a reference so the task is not garbage collected mid-flight
+        task = asyncio.ensure_future(refresh())
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
+
+    async def _api(self, func, *args, **kwargs):
+        """
+        Call the synchronous API client in a worker thread.
+
+        Goes through the scraper's session handling, so a rejected saved
+        session triggers one fresh login.
+        """
+        return await asyncio.to_thread(self.scraper._call_api, func, *args, **kwargs)
+
+    async def _scrape_profile_web(self, profile_url: str) -> Dict[str, Any]:
+        """
+        Scrape profile using web scraping (fallback method).
+
+        Args:
+            profile_url: LinkedIn profile URL
+
+        Returns:
+            Profile data dictionary
+        """
+        logger.debug(f"Web scraping profile: {profile_url}")
+
+        # Stream the body and stop reading once every field has been found
+        response = await self.scraper.transport.get_async(profile_url, timeout=30, endpoint="profile")
+        try:
+            throttle = detect_throttle(response.status_code, response.headers, response.url)
+            if throttle:
+                raise throttle
+            response.raise_for_status()
+
+            extraction = PROFILE_EXTRACTOR.stream(self.scraper.web_profile_fields)
+            async for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if extraction.feed(chunk):
+                    break
+        finally:
+            await response.close()
+
+        return self.scraper._build_web_profile(extraction.close(), profile_url)
+
+    async def search_jobs(
+        self,
+        keywords: str,
+        location: Optional[str] = None,
+        job_type: Optional[str] = None,
+        experience_level: Optional[str] = None,
+        limit: int = 10,
+        cache_policy: str = "use"
+    ) -> List[JobRecord]:
+        """
+        Search for jobs on LinkedIn.
+
+        Recent results are served from the search-result cache, and identical
+        searches already in flight are shared rather than repeated.
+
+        Args:
+            keywords: Search keywords
+            location: Job location
+            job_type: Job type (full-time, part-time, contract, etc.)
+            experience_level: Experience level (entry, mid, senior, etc.)
+            limit: Maximum number of results
+            cache_policy: "use" to serve cached results, "refresh" to re-run
+                the search and update the cache, "bypass" to skip the cache
+
+        Returns:
+            List of job records
+        """
+        validate_cache_policy(cache_policy)
+        key = flight_key(
+            "jobs", keywords=keywords, location=location, job_type=job_type,
+            experience_level=experience_level, limit=limit,
+        )
+        return await self._cached_search(key, cache_policy, self._fetch_jobs, keywords, location, job_type, experience_level, limit)
+
+    @retrying
+    @rate_limited("jobs")
+    async def _fetch_jobs(
+        self,
+        keywords: str,
+        location: Optional[str],
+        job_type: Optional[str],
+        experience_level: Optional[str],
+        limit: int
+    ) -> List[JobRecord]:
+        """Fetch a job search from LinkedIn (see search_jobs)."""
+        logger.info(f"Searching jobs: keywords='{keywords}', location='{location}'")
+
+        try:
+            await self.wait_for_login()
+            if self.api_client:
+                logger.debug("Using LinkedIn API client for job search")
+                jobs = await self._guarded(
+                    "linkedin_api", "jobs", self._api,
+                    self.api_client.search_jobs,
+                    keywords=keywords,
+                    location_name=location,
+                    limit=limit,
+                )
+                return self.scraper._format_jobs(jobs)
+            else:
+                logger.warning("API client not available. Job search requires authentication.")
+                return []
+
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            raise
+
+    async def iter_jobs(
+        self,
+        keywords: str,
+        location: Optional[str] = None,
+        job_type: Optional[str] = None,
+        experience_level: Optional[str] = None,
+        page_size: int = JOB_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        max_results: Optional[int] = None,
+        cache_policy: str = "use"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Page through a job search lazily (see LinkedInScraper.iter_jobs).
+
+        Args:
+            keywords: Search keywords
+            location: Job location
+            job_type: Job type (full-time, part-time, contract, etc.)
+            experience_level: Experience level (entry, mid, senior, etc.)
+            page_size: Jobs per page (at most 49)
+            cursor: ``next_cursor`` of a previous page to resume from
+            max_results: Stop after this many jobs (unbounded if None)
+            cache_policy: "use", "refresh" or "bypass" (see search_jobs)
+
+        Yields:
+            Pages with ``jobs``, and ``next_cursor`` (None on the last page)
+        """
+        if not 1 <= page_size <= 49:
+            raise ValueError("page_size must be between 1 and 49")
+        validate_cache_policy(cache_policy)
+
+        query = _job_query(keywords, location, job_type, experience_level)
+        offset = decode_cursor(cursor, query) if cursor else 0
+        remaining = max_results
+
+        while remaining is None or remaining > 0:
+            count = page_size if remaining is None else min(page_size, remaining)
+            jobs = await self._cached_search(
+                _job_page_key(query, offset, count), cache_policy,
+                self._fetch_jobs_page, keywords, location, offset, count,
+            )
+            offset += len(jobs)
+            if remaining is not None:
+                remaining -= len(jobs)
+
+            # A short page means LinkedIn has no more results
+            next_cursor = encode_cursor(offset, query) if len(jobs) == count else None
+            yield {"jobs": jobs, "next_cursor": next_cursor}
+            if next_cursor is None:
+                return
+
+    @retrying
+    @rate_limited("jobs")
+    async def _fetch_jobs_page(self, keywords: str, location: Optional[str], offset: int, count: int) -> List[JobRecord]:
+        """Fetch and format one page of a job search (see iter_jobs)."""
+        logger.info(f"Fetching jobs page: keywords='{keywords}', offset={offset}")
+
+        await self.wait_for_login()
+        if not self.api_client:
+            logger.warning("API client not available. Job search requires authentication.")
+            return []
+
+        jobs = await self._guarded(
+            "linkedin_api", "jobs", self._api,
+            self.api_client.search_jobs,
+            keywords=keywords,
+            location_name=location,
+            limit=count,
+            offset=offset,
+        )
+        return self.scraper._format_jobs(jobs)
+
+    async def get_company_info(self, company_identifier: str, cache_policy: str = "use") -> Dict[str, Any]:
+        """
+        Get information about a company.
+
+        Args:
+            company_identifier: Company name or LinkedIn company ID
+            cache_policy: "use" to serve a fresh cached copy, "refresh" to
+                re-fetch and update the cache, "bypass" to skip the cache
+
+        Returns:
+            Company information dictionary
+        """
+        validate_cache_policy(cache_policy)
+        key = company_identifier.strip().lower()
+        result = await self._cached("company", key, cache_policy, self._fetch_company_info, company_identifier)
+
+        # Also file the company under its canonical universalName
+        universal_name = (result.get("company_id") or "").lower()
+        if self.cache is not None and cache_policy != "bypass" and universal_name and universal_name != key:
+            await asyncio.to_thread(self.cache.set, "company", universal_name, result)
+
+        return result
+
+    @retrying
+    @rate_limited("company")
+    async def _fetch_company_info(self, company_identifier: str) -> Dict[str, Any]:
+        """
+        Fetch company information from LinkedIn.
+
+        Args:
+            company_identifier: Company name or LinkedIn company ID
+
+        Returns:
+            Company information dictionary
+        """
+        logger.info(f"Fetching company info: {company_identifier}")
+
+        try:
+            await self.wait_for_login()
+            if self.api_client:
+                logger.debug("Using LinkedIn API client for company info")
+                company_data = await self._guarded(
+                    "linkedin_api", "company", self._api, self.api_client.get_company, company_identifier
+                )
+                return self.scraper._format_company_data(company_data)
+            else:
+                logger.warning("API client not available. Company info requires authentication.")
+                return {"error": "Authentication required"}
+
+        except Exception as e:
+            logger.error(f"Error fetching company info: {e}")
+            raise
+
+    async def search_people(
+        self,
+        keywords: str,
+        location: Optional[str] = None,
+        current_company: Optional[str] = None,
+        limit: int = 10,
+        cache_policy: str = "use"
+    ) -> List[PersonRecord]:
+        """
+        Search for people on LinkedIn.
+
+        Recent results are served from the search-result cache, and identical
+        searches already in flight are shared rather than repeated.
+
+        Args:
+            keywords: Search keywords
+            location: Location filter
+            current_company: Filter by current company
+            limit: Maximum number of results
+            cache_policy: "use" to serve cached results, "refresh" to re-run
+                the search and update the cache, "bypass" to skip the cache
+
+        Returns:
+            List of person records
+        """
+        validate_cache_policy(cache_policy)
+        key = flight_key(
+            "people", keywords=keywords, location=location,
+            current_company=current_company, limit=limit,
+        )
+        return await self._cached_search(key, cache_policy, self._fetch_people, keywords, location, current_company, limit)
+
+    @retrying
+    @rate_limited("people")
+    async def _fetch_people(
+        self,
+        keywords: str,
+        location: Optional[str],
+        current_company: Optional[str],
+        limit: int
+    ) -> List[PersonRecord]:
+        """Fetch a people search from LinkedIn (see search_people)."""
+        logger.info(f"Searching people: keywords='{keywords}'")
+
+        try:
+            await self.wait_for_login()
+            if self.api_client:
+                logger.debug("Using LinkedIn API client for people search")
+                people = await self._guarded(
+                    "linkedin_api", "people", self._api,
+                    self.api_client.search_people,
+                    keywords=keywords,
+                    limit=limit,
+                )
+                return [self.scraper._format_person_data(person) for person in people]
+            else:
+                logger.warning("API client not available. People search requires authentication.")
+                return []
+
+        except Exception as e:
+            logger.error(f"Error searching people: {e}")
+            raise
+
+    async def close(self):
+        """Close the underlying scraper and its connections."""
+        for task in list(self._refreshes):
+            task.cancel()
+        self.scraper.close()
+        logger.info("Async LinkedIn scraper closed")
+
+    async def __aenter__(self) -> "AsyncLinkedInScraper":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
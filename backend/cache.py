@@ -0,0 +1,320 @@
+"""
+Persistent cache for scraped LinkedIn data.
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from loguru import logger
+
+from utils import get_data_dir
+from records import json_default
+
+
+# How callers may use the cache: serve fresh entries, refetch and overwrite, or ignore it
+CACHE_POLICIES = ("use", "refresh", "bypass")
+
+# Default time-to-live per entity type, in seconds
+DEFAULT_TTLS: Dict[str, float] = {
+    "profile": 3 * 24 * 3600,
+    "company": 7 * 24 * 3600,
+    "http": 7 * 24 * 3600,
+}
+
+
+def validate_cache_policy(cache_policy: str) -> str:
+    """
+    Validate a cache policy argument.
+
+    Args:
+        cache_policy: One of CACHE_POLICIES
+
+    Returns:
+        The cache policy
+
+    Raises:
+        ValueError: If the policy is unknown
+    """
+    if cache_policy not in CACHE_POLICIES:
+        raise ValueError(f"cache_policy must be one of {', '.join(CACHE_POLICIES)}")
+    return cache_policy
+
+
+class ResponseCache:
+    """
+    A disk-backed TTL cache of JSON-serializable results.
+
+    Entries live in a SQLite file, so every scraper process on the host
+    shares them. Payloads are stored as zlib-compressed JSON. Each entry
+    expires after its namespace's TTL, and once the cache holds more than
+    ``max_entries`` the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, ttls: Optional[Dict[str, float]] = None):
+        """
+        Open (and create if needed) the cache.
+
+        Args:
+            path: Path to the SQLite database file
+            max_entries: Maximum number of entries kept
+            ttls: Mapping of namespace to TTL in seconds, merged over DEFAULT_TTLS
+        """
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, payload BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """
+        Build a cache from environment variables.
+
+        ``CACHE_PATH`` is the SQLite file (defaulting to one in the data
+        directory), or ``off`` to disable caching. ``CACHE_MAX_ENTRIES``,
+        ``CACHE_TTL_PROFILE``, ``CACHE_TTL_COMPANY`` and ``CACHE_TTL_HTTP``
+        (revalidatable pages) override the defaults.
+
+        Returns:
+            Configured ResponseCache, or None if caching is disabled
+        """
+        path = os.getenv("CACHE_PATH") or str(get_data_dir() / "cache.sqlite3")
+        if path == "off":
+            return None
+
+        ttls = {
+            namespace: float(os.getenv(f"CACHE_TTL_{namespace.upper()}", ttl))
+            for namespace, ttl in DEFAULT_TTLS.items()
+        }
+        return cls(path, max_entries=int(os.getenv("CACHE_MAX_ENTRIES", 10000)), ttls=ttls)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Look up a fresh entry.
+
+        Args:
+            namespace: Entity type (profile, company)
+            key: Canonical entity identifier
+
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key),
+            )
+            self._conn.commit()
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store an entry, evicting the least recently used ones if the cache is full.
+
+        Args:
+            namespace: Entity type (profile, company)
+            key: Canonical entity identifier
+            value: JSON-serializable value (records are stored as dictionaries)
+            ttl: Seconds until the entry expires (defaults to the namespace TTL)
+        """
+        now = time.time()
+        ttl = self.ttls.get(namespace, 24 * 3600) if ttl is None else ttl
+        payload = zlib.compress(json.dumps(value, default=json_default).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, payload, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, payload, now + ttl, now),
+            )
+            excess = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE rowid IN "
+                    "(SELECT rowid FROM cache ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+                logger.debug(f"Cache full, evicted {excess} least recently used entries")
+            self._conn.commit()
+
+    def delete(self, namespace: str, key: str):
+        """Remove an entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+
+class SearchResultCache:
+    """
+    An in-memory LRU cache of search results with stale-while-revalidate.
+
+    An entry is fresh for ``ttl`` seconds and then stale until
+    ``stale_ttl`` seconds after it was stored. Fresh and stale hits are both
+    served immediately; a stale hit tells the caller to refresh the entry in
+    the background. Beyond ``max_entries`` the least recently used entries
+    are dropped.
+    """
+
+    FRESH = "fresh"
+    STALE = "stale"
+    MISS = "miss"
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0, stale_ttl: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached searches
+            ttl: Seconds an entry is served as fresh
+            stale_ttl: Seconds an entry is served at all (fresh or stale)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = max(ttl, stale_ttl)
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["SearchResultCache"]:
+        """
+        Build a cache from environment variables.
+
+        ``SEARCH_CACHE_SIZE`` (0 disables the cache), ``SEARCH_CACHE_TTL``
+        and ``SEARCH_CACHE_STALE_TTL`` override the defaults.
+
+        Returns:
+            Configured SearchResultCache, or None if disabled
+        """
+        max_entries = int(os.getenv("SEARCH_CACHE_SIZE", 256))
+        if max_entries <= 0:
+            return None
+        return cls(
+            max_entries=max_entries,
+            ttl=float(os.getenv("SEARCH_CACHE_TTL", 300)),
+            stale_ttl=float(os.getenv("SEARCH_CACHE_STALE_TTL", 3600)),
+        )
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], str]:
+        """
+        Look up a search.
+
+        Args:
+            key: Normalized query key
+
+        Returns:
+            Tuple of (cached value or None, FRESH / STALE / MISS)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] >= self.stale_ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None, self.MISS
+
+            self._entries.move_to_end(key)
+            if now - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1], self.FRESH
+            self.stale_hits += 1
+            return entry[1], self.STALE
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a search result.
+
+        Args:
+            key: Normalized query key
+            value: Search results
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """
+        Claim the background refresh of an entry.
+
+        Returns:
+            False if a refresh of this entry is already running
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+            return True
+
+    def end_refresh(self, key: Hashable):
+        """Release the background refresh claimed with begin_refresh."""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Size, hit/stale-hit/miss counts, background refreshes and hit ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "hit_ratio": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+            }
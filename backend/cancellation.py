@@ -0,0 +1,73 @@
+"""
+Cooperative cancellation of blocking work running on a worker thread.
+
+A thread cannot be interrupted from outside, so blocking code instead
+checks in at the points where it would wait anyway: ``sleep`` replaces
+``time.sleep`` and wakes up early, raising ToolCancelledError, once the
+work it belongs to has been cancelled. Outside a cancellable call both
+functions behave like their plain counterparts.
+"""
+
+import sys
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from errors import ToolCancelledError
+
+
+# Cancellation event of the call running in the current context, if any
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar("cancel_event", default=None)
+
+
+@contextmanager
+def cancel_scope(event: threading.Event) -> Iterator[threading.Event]:
+    """
+    Make ``event`` the cancellation event of the code run inside the block.
+
+    Args:
+        event: Event that is set to cancel the work
+    """
+    token = _cancel_event.set(event)
+    try:
+        yield event
+    finally:
+        _cancel_event.reset(token)
+
+
+def check_cancelled():
+    """
+    Raise if the current call has been cancelled.
+
+    Raises:
+        ToolCancelledError: If the current call's cancellation event is set
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise ToolCancelledError("Call was cancelled")
+
+
+def sleep(seconds: float):
+    """
+    Sleep like ``time.sleep``, but stop early if the current call is cancelled.
+
+    Args:
+        seconds: Seconds to sleep
+
+    Raises:
+        ToolCancelledError: If the current call is cancelled before or while sleeping
+    """
+    event = _cancel_event.get()
+    if event is None:
+        time.sleep(seconds)
+        return
+    if event.wait(seconds):
+        raise ToolCancelledError("Call was cancelled")
@@ -7,8 +7,10 @@ Integrates with Gemini MCP client for conversational AI.
 import asyncio
 import json
 import os
+from functools import partial
 import sys
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -26,12 +28,37 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from gemini_client import GeminiMCPClient
+from mcp_pool import MCPSessionPool, PooledSession
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Warm up the MCP session pool before the first chat connects."""
+    # With MCP_IN_PROCESS set, chats run the tools in this process instead
+    manager.in_process = os.getenv("MCP_IN_PROCESS", "").lower() in ("1", "true", "yes")
+    if manager.in_process:
+        try:
+            yield
+        finally:
+            server = sys.modules.get("server")
+            if server is not None:
+                await server.close_scraper()
+        return
+    
+    manager.session_pool = MCPSessionPool.from_env(str(_backend_dir / "server.py"))
+    manager.session_pool.start()
+    try:
+        yield
+    finally:
+        await manager.session_pool.close()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="LinkedIn Scraper AI",
     description="AI-powered LinkedIn scraper chatbot using Google Gemini and MCP",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -49,6 +76,10 @@ class ConnectionManager:
         self.active_connections: Dict[str, WebSocket] = {}
         self.gemini_clients: Dict[str, GeminiMCPClient] = {}
         self.client_tasks: Dict[str, asyncio.Task] = {}
+        # Pre-started MCP server sessions, checked out per websocket
+        self.session_pool: Optional[MCPSessionPool] = None
+        self.pooled_sessions: Dict[str, PooledSession] = {}
+        self.in_process = False
 
     async def connect(self, websocket: WebSocket, session_id: str):
         """Accept a new WebSocket connection."""
@@ -65,12 +96,18 @@ class ConnectionManager:
             })
             return
         
-        # Get MCP server path from environment or use default
-        server_path = os.getenv("MCP_SERVER_PATH", str(_backend_dir / "server.py"))
-        
         try:
-            client = GeminiMCPClient(api_key, server_path)
-            await client.connect()
+            if self.in_process:
+                client = GeminiMCPClient(api_key, in_process=True)
+                await client.connect()
+            else:
+                # Check out an already started MCP server session (see mcp_pool)
+                client = GeminiMCPClient(api_key)
+                pooled = await self.session_pool.acquire()
+                self.pooled_sessions[session_id] = pooled
+                client.attach_session(pooled.session, pooled.tools)
+            # Show search results as they arrive, before Gemini answers
+            client.on_progress = partial(self.send_message, session_id)
             self.gemini_clients[session_id] = client
             
             # Send success message
@@ -97,6 +134,10 @@ class ConnectionManager:
             await client.cleanup()
             del self.gemini_clients[session_id]
         
+        # Give the MCP session back to the pool for the next chat
+        if session_id in self.pooled_sessions:
+            await self.session_pool.release(self.pooled_sessions.pop(session_id))
+        
         # Remove connection
         if session_id in self.active_connections:
             del self.active_connections[session_id]
@@ -165,7 +206,8 @@ async def health():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "active_connections": len(manager.active_connections)
+        "active_connections": len(manager.active_connections),
+        "mcp_sessions": manager.session_pool.stats() if manager.session_pool else None,
     }
 
 
@@ -0,0 +1,190 @@
+"""
+Circuit breakers for the scraper's backends.
+"""
+
+import os
+import time
+import threading
+from typing import Any, Dict, Tuple
+
+from loguru import logger
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker for one backend operation.
+
+    While closed, calls go through and consecutive failures are counted.
+    After ``failure_threshold`` failures in a row the breaker opens and
+    rejects calls for ``recovery_timeout`` seconds. It then turns half-open
+    and lets up to ``half_open_max_calls`` probe calls through: a successful
+    probe closes it again, a failed one reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 60.0,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Initialize the breaker, closed.
+
+        Args:
+            name: Name used in logs
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds to stay open before probing
+            half_open_max_calls: Concurrent probe calls allowed while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def _update_state(self):
+        """Move from open to half-open once the recovery timeout has passed."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probes = 0
+            logger.info(f"Circuit {self.name} half-open, probing")
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go through, reserving a probe slot if half-open.
+
+        Returns:
+            True if the call should be attempted
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            return False
+
+    def record_success(self):
+        """Record a successful call, closing a half-open breaker."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit {self.name} closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def record_ignored(self):
+        """Record a call whose outcome says nothing about the backend, freeing its probe slot."""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def record_failure(self):
+        """Record a failed call, opening the breaker if needed."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"Circuit {self.name} opened after {self._failures} failure(s); "
+                        f"skipping it for {self.recovery_timeout:.0f}s"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers keyed by (backend, operation), created on first use.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0, half_open_max_calls: int = 1):
+        """
+        Initialize the registry.
+
+        Args:
+            failure_threshold: Consecutive failures that open a breaker
+            recovery_timeout: Seconds a breaker stays open before probing
+            half_open_max_calls: Concurrent probe calls allowed while half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreakerRegistry":
+        """
+        Build a registry from environment variables.
+
+        ``CIRCUIT_FAILURE_THRESHOLD``, ``CIRCUIT_RECOVERY_TIMEOUT`` and
+        ``CIRCUIT_HALF_OPEN_CALLS`` override the defaults.
+
+        Returns:
+            Configured CircuitBreakerRegistry
+        """
+        return cls(
+            failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 5)),
+            recovery_timeout=float(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", 60.0)),
+            half_open_max_calls=int(os.getenv("CIRCUIT_HALF_OPEN_CALLS", 1)),
+        )
+
+    def get(self, backend: str, operation: str) -> CircuitBreaker:
+        """
+        Get the breaker for a backend operation.
+
+        Args:
+            backend: Backend name (linkedin_api, web)
+            operation: Operation name (profile, jobs, company, people)
+
+        Returns:
+            The operation's CircuitBreaker
+        """
+        with self._lock:
+            key = (backend, operation)
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(
+                    f"{backend}/{operation}",
+                    self.failure_threshold,
+                    self.recovery_timeout,
+                    self.half_open_max_calls,
+                )
+            return self._breakers[key]
+
+    def states(self) -> Dict[str, Any]:
+        """
+        Get the state of every breaker.
+
+        Returns:
+            Mapping of "backend/operation" to state
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.state for breaker in breakers}
@@ -0,0 +1,51 @@
+"""
+Exceptions raised by the LinkedIn scraper.
+"""
+
+from typing import Optional
+
+
+class ThrottledError(Exception):
+    """
+    LinkedIn is throttling us (HTTP 429/999, Retry-After or a challenge page).
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Initialize the error.
+
+        Args:
+            message: Description of the throttling response
+            status_code: HTTP status of the response
+            retry_after: Seconds LinkedIn asked us to wait, if given
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """
+    A backend's circuit breaker is open, so the call was not attempted.
+    """
+
+    def __init__(self, backend: str, operation: str, retry_in: float):
+        """
+        Initialize the error.
+
+        Args:
+            backend: Backend whose circuit is open (e.g. linkedin_api)
+            operation: Operation that was skipped (e.g. profile)
+            retry_in: Seconds until the breaker lets a probe request through
+        """
+        super().__init__(f"{backend} is unavailable for {operation} (retrying in {retry_in:.0f}s)")
+        self.backend = backend
+        self.operation = operation
+        self.retry_in = retry_in
+
+
+class ToolCancelledError(Exception):
+    """
+    A tool call was cancelled (the client aborted it or it timed out) while
+    its blocking work was still running.
+    """
@@ -0,0 +1,336 @@
+"""
+Declarative field extraction from LinkedIn pages.
+
+Fields are described once as XPath node steps and compiled when this module
+is imported. For a step such as ``h1[...]`` the extractor builds two
+expressions: ``//h1[...]`` to find candidates, and ``self::h1[...]`` to test
+whether a given element belongs to the field. All fields of an extractor are
+found with a single union query, so adding a field does not add another walk
+over the tree.
+
+Pages can also be extracted while they download: a StreamingExtraction feeds
+chunks to an incremental parser, matches elements as they are completed, and
+reports when every requested field has been found so the caller can stop
+reading.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from lxml import etree
+
+from utils import clean_text
+
+
+def has_class(name: str) -> str:
+    """
+    Build an XPath predicate matching elements with a CSS class.
+
+    Args:
+        name: Class name
+
+    Returns:
+        XPath boolean expression
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def element_text(element) -> str:
+    """Get the whitespace-normalized text content of an element."""
+    return clean_text(" ".join(element.itertext()))
+
+
+class FieldSpec:
+    """
+    A field extracted from a page.
+
+    A scalar field takes the text of the first matching element. A field
+    with ``many=True`` collects every match; if it has ``fields``, each match
+    becomes a dictionary of those sub-fields, evaluated relative to it.
+    """
+
+    def __init__(self, name: str, step: str, many: bool = False, fields: Optional[Dict[str, str]] = None):
+        """
+        Compile a field.
+
+        Args:
+            name: Key of the field in the extracted data
+            step: XPath node step (node test and predicates, no axis)
+            many: Collect all matches instead of the first
+            fields: Sub-field names mapped to XPaths relative to each match
+        """
+        self.name = name
+        self.step = step
+        self.many = many
+        self.matches = etree.XPath(f"self::{step}")
+        self.fields = {key: etree.XPath(f"({path})[1]") for key, path in (fields or {}).items()}
+
+    def value(self, element) -> Any:
+        """
+        Get the field's value from a matching element.
+
+        Args:
+            element: Element matched by this field
+
+        Returns:
+            Text of the element, or a dictionary of its sub-fields
+        """
+        if not self.fields:
+            return element_text(element)
+
+        item = {}
+        for key, path in self.fields.items():
+            found = path(element)
+            if found:
+                text = element_text(found[0]) if etree.iselement(found[0]) else clean_text(str(found[0]))
+                if text:
+                    item[key] = text
+        return item
+
+
+class Extractor:
+    """
+    Extracts a set of fields from a parsed page in one query.
+    """
+
+    def __init__(self, fields: Iterable[FieldSpec]):
+        """
+        Compile an extractor.
+
+        Args:
+            fields: Fields to extract
+        """
+        self.fields: List[FieldSpec] = list(fields)
+        self._find = etree.XPath(" | ".join(f"//{spec.step}" for spec in self.fields))
+        self.matches_any = etree.XPath(" | ".join(f"self::{spec.step}" for spec in self.fields))
+
+    def add(self, data: Dict[str, Any], spec: FieldSpec, element) -> bool:
+        """
+        Record a match of ``spec`` in ``data``.
+
+        Returns:
+            True if the match contributed a value
+        """
+        if not spec.many:
+            if spec.name in data:
+                return False
+            value = spec.value(element)
+            if value:
+                data[spec.name] = value
+            return bool(value)
+
+        value = spec.value(element)
+        if value:
+            data.setdefault(spec.name, []).append(value)
+        return bool(value)
+
+    def match(self, data: Dict[str, Any], element) -> bool:
+        """
+        Dispatch an element to the fields it matches.
+
+        Returns:
+            True if the element matched any field
+        """
+        matched = False
+        for spec in self.fields:
+            if spec.matches(element):
+                self.add(data, spec, element)
+                matched = True
+        return matched
+
+    def extract(self, root) -> Dict[str, Any]:
+        """
+        Extract all fields from a parsed page.
+
+        Args:
+            root: Root element of the page
+
+        Returns:
+            Dictionary of the fields found
+        """
+        data: Dict[str, Any] = {}
+        for element in self._find(root):
+            self.match(data, element)
+        return data
+
+    def stream(self, fields: Optional[Iterable[str]] = None) -> "StreamingExtraction":
+        """
+        Start extracting a page that is still downloading.
+
+        Args:
+            fields: Names of the fields the caller needs (all if None)
+
+        Returns:
+            StreamingExtraction to feed chunks into
+        """
+        return StreamingExtraction(self, fields)
+
+    def extract_stream(self, chunks: Iterable[bytes], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Extract fields from a page read in chunks, stopping once all are found.
+
+        Args:
+            chunks: Page content in chunks; it is not read past the last
+                chunk needed
+            fields: Names of the fields the caller needs (all if None)
+
+        Returns:
+            Dictionary of the fields found
+        """
+        extraction = self.stream(fields)
+        for chunk in chunks:
+            if extraction.feed(chunk):
+                break
+        return extraction.close()
+
+    def extract_html(self, html: bytes) -> Dict[str, Any]:
+        """
+        Parse a page and extract all fields.
+
+        Args:
+            html: Raw page content
+
+        Returns:
+            Dictionary of the fields found
+        """
+        if not html or not html.strip():
+            return {}
+        return self.extract(etree.HTML(html))
+
+
+class StreamingExtraction:
+    """
+    Incremental extraction of one page.
+
+    Elements are matched when their end tag is parsed, so each match sees
+    its complete subtree. A single-valued field is done at its first match;
+    a list field is done when the element containing its first match ends.
+    """
+
+    def __init__(self, extractor: Extractor, fields: Optional[Iterable[str]] = None):
+        """
+        Start an extraction.
+
+        Args:
+            extractor: Extractor whose fields are matched
+            fields: Names of the fields the caller needs (all if None)
+        """
+        self.extractor = extractor
+        self.data: Dict[str, Any] = {}
+        self.pending = set(fields) if fields is not None else {spec.name for spec in extractor.fields}
+        unknown = self.pending - {spec.name for spec in extractor.fields}
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        self._list_parents: Dict[Any, str] = {}
+        self._parser = etree.HTMLPullParser(events=("end",))
+
+    @property
+    def done(self) -> bool:
+        """Whether every requested field has been found."""
+        return not self.pending
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Parse the next chunk of the page.
+
+        Args:
+            chunk: Raw page content
+
+        Returns:
+            True once every requested field has been found
+        """
+        if self.done:
+            return True
+        self._parser.feed(chunk)
+        self._process()
+        return self.done
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish the extraction, parsing whatever was fed last.
+
+        Returns:
+            Dictionary of the fields found
+        """
+        if not self.done:
+            try:
+                self._parser.close()
+            except etree.LxmlError:
+                pass
+            self._process()
+        return self.data
+
+    def _process(self):
+        """Match the elements completed since the last chunk."""
+        for _, element in self._parser.read_events():
+            field = self._list_parents.pop(element, None)
+            if field is not None:
+                self.pending.discard(field)
+
+            # One combined test filters out the elements no field wants
+            if not self.extractor.matches_any(element):
+                continue
+            for spec in self.extractor.fields:
+                if not spec.matches(element):
+                    continue
+                if self.extractor.add(self.data, spec, element) and not spec.many:
+                    self.pending.discard(spec.name)
+                elif spec.many and spec.name not in self._list_parents.values():
+                    parent = element.getparent()
+                    if parent is not None:
+                        self._list_parents[parent] = spec.name
+
+            if self.done:
+                return
+
+
+# Profile fields, covering both the signed-in page and the public profile page
+PROFILE_FIELDS = [
+    FieldSpec(
+        "name",
+        f"*[(self::h1 and {has_class('text-heading-xlarge')}) or {has_class('top-card-layout__title')}]",
+    ),
+    FieldSpec(
+        "headline",
+        f"*[(self::div and {has_class('text-body-medium')}) or {has_class('top-card-layout__headline')}]",
+    ),
+    FieldSpec(
+        "location",
+        f"*[(self::span and {has_class('text-body-small')} and {has_class('inline')})"
+        f" or {has_class('top-card__subline-item')}]",
+    ),
+    FieldSpec(
+        "about",
+        f"*[({has_class('core-section-container__content')} and ancestor::section[{has_class('summary')}])"
+        f" or (self::div and {has_class('pv-about__summary-text')})]",
+    ),
+    FieldSpec(
+        "experience",
+        f"li[{has_class('experience-item')}]",
+        many=True,
+        fields={
+            "title": f".//*[{has_class('experience-item__title')}] | .//h3",
+            "company": f".//*[{has_class('experience-item__subtitle')}] | .//h4",
+            "date_range": f".//*[{has_class('date-range')}]",
+            "location": f".//*[{has_class('experience-item__location')}]",
+        },
+    ),
+    FieldSpec(
+        "education",
+        f"li[{has_class('education__list-item')}]",
+        many=True,
+        fields={
+            "school": ".//h3",
+            "degree": ".//h4",
+            "date_range": f".//*[{has_class('date-range')}]",
+        },
+    ),
+]
+
+PROFILE_EXTRACTOR = Extractor(PROFILE_FIELDS)
@@ -13,12 +13,22 @@ import asyncio
 import os
 import sys
 import json
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional
 from contextlib import AsyncExitStack
+from pathlib import Path
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
 
 # MCP client components
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+try:
+    from mcp.client.streamable_http import streamable_http_client
+except ImportError:  # mcp < 1.24
+    from mcp.client.streamable_http import streamablehttp_client as streamable_http_client
 
 # Google's Gen AI SDK
 from google import genai
@@ -27,6 +37,8 @@ from google.genai.types import Tool, FunctionDeclaration, GenerateContentConfig
 
 from dotenv import load_dotenv
 
+from records import to_plain
+
 # Load environment variables
 load_dotenv()
 
@@ -39,17 +51,34 @@ class GeminiMCPClient:
     Supports conversational context and follow-up questions.
     """
     
-    def __init__(self, api_key: Optional[str] = None, server_path: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        server_path: Optional[str] = None,
+        server_url: Optional[str] = None,
+        in_process: bool = False,
+    ):
         """
         Initialize the Gemini MCP client.
         
         Args:
             api_key: Gemini API key (or reads from GEMINI_API_KEY env var)
             server_path: Path to MCP server script (optional, can connect later)
+            server_url: URL of a shared MCP server running the streamable HTTP
+                transport (e.g. http://127.0.0.1:8001/mcp); used instead of
+                starting ``server_path``
+            in_process: Run the LinkedIn scraper's tools in this process
+                instead of talking to an MCP server (see connect_in_process)
         """
         self.session: Optional[ClientSession] = None
         self.exit_stack = AsyncExitStack()
         self.server_path = server_path
+        self.server_url = server_url
+        self.in_process = in_process
+        # The server module whose tools run in this process, if in-process
+        self.in_process_server = None
+        # Receives {"type": "progress", ...} events with a tool's partial results
+        self.on_progress: Optional[Callable[[dict], Awaitable[None]]] = None
         
         # Get Gemini API key
         gemini_api_key = api_key or os.getenv("GEMINI_API_KEY")
@@ -70,7 +99,13 @@ class GeminiMCPClient:
         print("✓ Gemini MCP Client initialized")
     
     async def connect(self):
-        """Connect to the MCP server using the configured server path."""
+        """Connect to the MCP server using the configured server URL or path."""
+        if self.in_process:
+            await self.connect_in_process()
+            return
+        if self.server_url:
+            await self.connect_to_url(self.server_url)
+            return
         if not self.server_path:
             raise ValueError("No server path configured. Provide server_path in __init__ or call connect_to_server().")
         await self.connect_to_server(self.server_path)
@@ -98,10 +133,68 @@ class GeminiMCPClient:
         
         # Extract read/write streams
         self.stdio, self.write = stdio_transport
+        await self._start_session(self.stdio, self.write)
+    
+    async def connect_to_url(self, server_url: str):
+        """
+        Connect to a shared MCP server over streamable HTTP and list available tools.
+        
+        Unlike connect_to_server, this does not start a server process: the
+        connection shares the server's LinkedIn login, caches and rate limits
+        with every other client.
+        
+        Args:
+            server_url: URL of the server's MCP endpoint (e.g. http://127.0.0.1:8001/mcp)
+        """
+        read_stream, write_stream, _ = await self.exit_stack.enter_async_context(
+            streamable_http_client(server_url)
+        )
+        await self._start_session(read_stream, write_stream)
+    
+    async def connect_in_process(self):
+        """
+        Run the LinkedIn scraper's tools in this process.
+        
+        Tools are called through the server's execute_tool with the same
+        schemas the MCP server publishes, and their results come back as
+        Python objects: no JSON-RPC, no serialization and no IPC per call.
+        All in-process clients share the server module's scraper.
+        """
+        # Imported here: the server module pulls in the MCP server and the scraper
+        import server
+        
+        if server.scraper is None:
+            server.initialize_scraper()
+        tools = await server.list_tools()
+        self.in_process_server = server
+        self.function_declarations = self._convert_mcp_tools_to_gemini(tools)
+        print(f"✓ Running {len(tools)} tools in process\n")
+    
+    def attach_session(self, session: ClientSession, tools):
+        """
+        Use an already initialized MCP session, e.g. one from an MCPSessionPool.
+        
+        The session stays owned by whoever started it: cleanup() does not
+        close it.
+        
+        Args:
+            session: Initialized MCP client session
+            tools: The server's tools, as listed by the session
+        """
+        self.session = session
+        self.function_declarations = self._convert_mcp_tools_to_gemini(tools)
+    
+    async def _start_session(self, read_stream, write_stream):
+        """
+        Start the MCP session on a connected transport and load the server's tools.
         
+        Args:
+            read_stream: Stream of messages from the server
+            write_stream: Stream of messages to the server
+        """
         # Initialize MCP client session
         self.session = await self.exit_stack.enter_async_context(
-            ClientSession(self.stdio, self.write)
+            ClientSession(read_stream, write_stream)
         )
         
         # Initialize the session
@@ -240,6 +333,69 @@ class GeminiMCPClient:
         formatted += "\n💡 You can ask: 'Tell me more about #2' or 'What's the salary for job #3?'\n"
         return formatted
     
+    async def call_tool(self, tool_name: str, tool_args: dict) -> Any:
+        """
+        Execute a tool, in process or through the MCP session.
+        
+        While the tool runs, its partial results are passed to on_progress
+        (if set) as {"type": "progress", "tool", "progress", "total", "items"}.
+        
+        Args:
+            tool_name: Name of the tool
+            tool_args: Arguments for the tool
+            
+        Returns:
+            The tool's result as plain Python values
+        """
+        on_progress = self.on_progress
+        
+        async def report(progress, total, items):
+            await on_progress({
+                "type": "progress",
+                "tool": tool_name,
+                "progress": progress,
+                "total": total,
+                "items": items,
+            })
+        
+        if self.in_process_server is not None:
+            async def progress_callback(done, total, items):
+                await report(done, total, to_plain(items))
+            
+            return to_plain(await self.in_process_server.execute_tool(
+                tool_name, tool_args, progress_callback if on_progress else None,
+            ))
+        
+        async def progress_callback(progress, total, message):
+            # The server sends the finished items as a JSON message
+            try:
+                items = json.loads(message).get("items", []) if message else []
+            except (ValueError, AttributeError):
+                items = []
+            await report(progress, total, items)
+        
+        result = await self.session.call_tool(
+            tool_name, tool_args, progress_callback=progress_callback if on_progress else None,
+        )
+        
+        # Parse MCP result - result.content is a list of TextContent objects
+        parsed_content = []
+        for content_item in result.content:
+            if hasattr(content_item, 'text'):
+                try:
+                    # Try to parse JSON from text
+                    parsed_content.append(json.loads(content_item.text))
+                except json.JSONDecodeError:
+                    # If not JSON, use as-is
+                    parsed_content.append(content_item.text)
+            else:
+                parsed_content.append(str(content_item))
+        
+        # If single item, unwrap it
+        if len(parsed_content) == 1:
+            parsed_content = parsed_content[0]
+        return parsed_content
+    
     async def process_query(self, query: str) -> str:
         """
         Process a user query using Gemini and execute MCP tool calls if needed.
@@ -297,24 +453,7 @@ class GeminiMCPClient:
                             
                             # Execute the tool via MCP
                             try:
-                                result = await self.session.call_tool(tool_name, dict(tool_args))
-                                
-                                # Parse MCP result - result.content is a list of TextContent objects
-                                parsed_content = []
-                                for content_item in result.content:
-                                    if hasattr(content_item, 'text'):
-                                        try:
-                                            # Try to parse JSON from text
-                                            parsed_content.append(json.loads(content_item.text))
-                                        except json.JSONDecodeError:
-                                            # If not JSON, use as-is
-                                            parsed_content.append(content_item.text)
-                                    else:
-                                        parsed_content.append(str(content_item))
-                                
-                                # If single item, unwrap it
-                                if len(parsed_content) == 1:
-                                    parsed_content = parsed_content[0]
+                                parsed_content = await self.call_tool(tool_name, dict(tool_args))
                                 
                                 function_response = {"result": parsed_content}
                                 tool_results = parsed_content  # Store for formatting
@@ -354,6 +493,10 @@ class GeminiMCPClient:
                             if response.candidates[0].content.parts:
                                 response_text = response.candidates[0].content.parts[0].text
                                 
+                                # Job searches list their jobs next to a cursor
+                                if isinstance(tool_results, dict) and "next_cursor" in tool_results:
+                                    tool_results = tool_results["jobs"]
+                                
                                 # Try to parse tool results and format with numbers
                                 if tool_results and isinstance(tool_results, list):
                                     # Detect result type
@@ -12,15 +12,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
 import os
+import json
 from dotenv import load_dotenv
 
-from src.scraper import LinkedInScraper
+from src.scraper import LinkedInScraper, job_cursor, job_cursor_offset
+from src.async_scraper import AsyncLinkedInScraper
+from src.cache import CACHE_POLICIES
+from src.records import json_default, to_dict, to_dicts
 from src.utils import setup_logging
 
 # Load environment variables
@@ -47,6 +52,11 @@ app.add_middleware(
 
 # Initialize scraper
 scraper = None
+async_scraper = None
+
+# Largest job counts served by one search request and one stream
+MAX_JOB_RESULTS = 1000
+MAX_STREAMED_JOBS = 10000
 
 def get_scraper():
     """Get or initialize the LinkedIn scraper."""
@@ -57,6 +67,13 @@ def get_scraper():
         scraper = LinkedInScraper(email=email, password=password)
     return scraper
 
+def get_async_scraper():
+    """Get or initialize the async scraper, sharing the LinkedIn scraper."""
+    global async_scraper
+    if async_scraper is None:
+        async_scraper = AsyncLinkedInScraper(scraper=get_scraper())
+    return async_scraper
+
 
 # Request/Response Models
 class JobSearchRequest(BaseModel):
@@ -65,18 +82,28 @@ class JobSearchRequest(BaseModel):
     job_type: Optional[str] = None
     experience_level: Optional[str] = None
     limit: int = 10
+    cursor: Optional[str] = None
+    cache_policy: str = "use"
 
 class ProfileSearchRequest(BaseModel):
     profile_url: str
+    cache_policy: str = "use"
+
+class BulkProfileRequest(BaseModel):
+    profile_urls: List[str]
+    concurrency: int = 5
+    cache_policy: str = "use"
 
 class CompanySearchRequest(BaseModel):
     company_identifier: str
+    cache_policy: str = "use"
 
 class PeopleSearchRequest(BaseModel):
     keywords: str
     location: Optional[str] = None
     current_company: Optional[str] = None
     limit: int = 10
+    cache_policy: str = "use"
 
 
 # API Endpoints
@@ -115,76 +142,174 @@ async def search_jobs(request: JobSearchRequest):
     - **location**: Location filter (optional)
     - **job_type**: Job type filter (optional)
     - **experience_level**: Experience level (optional)
-    - **limit**: Maximum number of results (default: 10, max: 50)
+    - **limit**: Maximum number of results (default: 10, max: 1000)
+    - **cursor**: `next_cursor` of a previous response to continue from (optional)
+    - **cache_policy**: use / refresh / bypass the search cache (default: use)
     """
     try:
         scraper_instance = get_scraper()
+        limit = min(request.limit, MAX_JOB_RESULTS)
         
-        results = scraper_instance.search_jobs(
-            keywords=request.keywords,
-            location=request.location,
-            job_type=request.job_type,
-            experience_level=request.experience_level,
-            limit=min(request.limit, 50)
-        )
+        if request.cursor is None and limit <= 50:
+            # Run in the thread pool so concurrent requests overlap and identical
+            # lookups can share one upstream fetch
+            results = await run_in_threadpool(
+                scraper_instance.search_jobs,
+                keywords=request.keywords,
+                location=request.location,
+                job_type=request.job_type,
+                experience_level=request.experience_level,
+                limit=limit,
+                cache_policy=request.cache_policy
+            )
+            next_cursor = job_cursor(
+                len(results), request.keywords, request.location, request.job_type, request.experience_level
+            ) if len(results) == limit else None
+        else:
+            # Larger or resumed searches are paged
+            results = []
+            next_cursor = None
+            async for page in get_async_scraper().iter_jobs(
+                request.keywords,
+                location=request.location,
+                job_type=request.job_type,
+                experience_level=request.experience_level,
+                cursor=request.cursor,
+                max_results=limit,
+                cache_policy=request.cache_policy
+            ):
+                results.extend(page["jobs"])
+                next_cursor = page["next_cursor"]
         
-        # Format results
-        formatted_results = []
-        for job in results:
-            formatted_job = {
-                "job_id": job.get("job_id", ""),
-                "title": job.get("title", "Position title not available"),
-                "company": job.get("company") or job.get("companyName") or "Company not specified",
-                "location": job.get("location", "Location not specified"),
-                "description": job.get("description", "")[:200],
-                "posted_at": job.get("posted_at", ""),
-                "job_url": job.get("job_url", ""),
-                "scraped_at": job.get("scraped_at", "")
-            }
-            formatted_results.append(formatted_job)
+        formatted_results = [job.summary() for job in results]
         
         return {
             "success": True,
             "count": len(formatted_results),
-            "jobs": formatted_results
+            "jobs": formatted_results,
+            "next_cursor": next_cursor
         }
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/jobs/stream")
+async def stream_jobs(request: JobSearchRequest):
+    """
+    Stream a job search page by page as newline-delimited JSON.
+    
+    Each line holds one page: its `jobs` and the `next_cursor` to resume
+    from if the stream is interrupted (null after the last page).
+    
+    - **keywords**: Search keywords (required)
+    - **location**: Location filter (optional)
+    - **job_type**: Job type filter (optional)
+    - **experience_level**: Experience level (optional)
+    - **limit**: Maximum number of results (default: 10, max: 10000)
+    - **cursor**: `next_cursor` to continue from (optional)
+    - **cache_policy**: use / refresh / bypass the search cache (default: use)
+    """
+    # Reject bad arguments while an error status can still be sent
+    if request.cache_policy not in CACHE_POLICIES:
+        raise HTTPException(status_code=400, detail=f"cache_policy must be one of {', '.join(CACHE_POLICIES)}")
+    if request.cursor is not None:
+        try:
+            job_cursor_offset(
+                request.cursor, request.keywords, request.location, request.job_type, request.experience_level
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    pages = get_async_scraper().iter_jobs(
+        request.keywords,
+        location=request.location,
+        job_type=request.job_type,
+        experience_level=request.experience_level,
+        cursor=request.cursor,
+        max_results=min(request.limit, MAX_STREAMED_JOBS),
+        cache_policy=request.cache_policy
+    )
+    
+    async def stream():
+        async for page in pages:
+            yield json.dumps({
+                "jobs": [job.summary() for job in page["jobs"]],
+                "next_cursor": page["next_cursor"]
+            }) + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 @app.post("/api/profile/scrape")
 async def scrape_profile(request: ProfileSearchRequest):
     """
     Scrape a LinkedIn profile.
     
     - **profile_url**: LinkedIn profile URL (required)
+    - **cache_policy**: use / refresh / bypass the local cache (default: use)
     """
     try:
         scraper_instance = get_scraper()
-        result = scraper_instance.scrape_profile(request.profile_url)
+        result = await run_in_threadpool(
+            scraper_instance.scrape_profile, request.profile_url, cache_policy=request.cache_policy
+        )
         
         return {
             "success": True,
-            "profile": result
+            "profile": to_dict(result)
         }
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/profiles/scrape")
+async def scrape_profiles(request: BulkProfileRequest):
+    """
+    Scrape many LinkedIn profiles, streaming results as they complete.
+    
+    The response is newline-delimited JSON with one object per unique profile.
+    
+    - **profile_urls**: LinkedIn profile URLs (required, max: 500)
+    - **concurrency**: Profiles scraped at once (default: 5, max: 20)
+    - **cache_policy**: use / refresh / bypass the local cache (default: use)
+    """
+    if not request.profile_urls:
+        raise HTTPException(status_code=400, detail="profile_urls is required")
+    if len(request.profile_urls) > 500:
+        raise HTTPException(status_code=400, detail="At most 500 profile URLs can be scraped per request")
+    if request.cache_policy not in CACHE_POLICIES:
+        raise HTTPException(status_code=400, detail=f"cache_policy must be one of {', '.join(CACHE_POLICIES)}")
+    
+    results = get_async_scraper().scrape_profiles(
+        request.profile_urls,
+        concurrency=max(1, min(request.concurrency, 20)),
+        cache_policy=request.cache_policy
+    )
+    
+    async def stream():
+        async for result in results:
+            yield json.dumps(result, default=json_default) + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 @app.post("/api/company/info")
 async def get_company_info(request: CompanySearchRequest):
     """
     Get company information from LinkedIn.
     
     - **company_identifier**: Company name or LinkedIn company ID (required)
+    - **cache_policy**: use / refresh / bypass the local cache (default: use)
     """
     try:
         scraper_instance = get_scraper()
-        result = scraper_instance.get_company_info(request.company_identifier)
+        result = await run_in_threadpool(
+            scraper_instance.get_company_info, request.company_identifier, cache_policy=request.cache_policy
+        )
         
         return {
             "success": True,
-            "company": result
+            "company": to_dict(result)
         }
     
     except Exception as e:
@@ -199,21 +324,24 @@ async def search_people(request: PeopleSearchRequest):
     - **location**: Location filter (optional)
     - **current_company**: Filter by current company (optional)
     - **limit**: Maximum number of results (default: 10, max: 50)
+    - **cache_policy**: use / refresh / bypass the search cache (default: use)
     """
     try:
         scraper_instance = get_scraper()
         
-        results = scraper_instance.search_people(
+        results = await run_in_threadpool(
+            scraper_instance.search_people,
             keywords=request.keywords,
             location=request.location,
             current_company=request.current_company,
-            limit=min(request.limit, 50)
+            limit=min(request.limit, 50),
+            cache_policy=request.cache_policy
         )
         
         return {
             "success": True,
             "count": len(results),
-            "people": results
+            "people": to_dicts(results)
         }
     
     except Exception as e:
@@ -225,7 +353,12 @@ async def get_stats():
     return {
         "total_requests": "N/A",
         "uptime": "N/A",
-        "status": "operational"
+        "status": "operational",
+        "rate_limits": scraper.rate_metrics() if scraper else None,
+        "circuit_breakers": scraper.circuit_breakers.states() if scraper else None,
+        "search_cache": scraper.search_cache.stats() if scraper and scraper.search_cache else None,
+        "accounts": scraper.account_pool.stats() if scraper and scraper.account_pool else None,
+        "proxies": scraper.proxy_pool.stats() if scraper and scraper.proxy_pool else None
     }
 
 
@@ -234,6 +367,8 @@ async def get_stats():
 async def shutdown_event():
     """Clean up resources on shutdown."""
     global scraper
+    if async_scraper:
+        await async_scraper.close()
     if scraper:
         scraper.close()
 
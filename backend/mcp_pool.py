@@ -0,0 +1,307 @@
+"""
+Pool of pre-started MCP server sessions for the chatbot.
+
+Starting an MCP server over stdio means spawning a Python process, importing
+the scraper and initializing the session, which used to happen while a new
+chat waited for its first answer. The pool keeps a few sessions started and
+initialized ahead of time: a chat checks one out when its websocket
+connects and gives it back when it disconnects.
+
+The MCP client's transports and ClientSession must be entered and exited in
+the same task, so every pooled session is owned by a long-lived task that
+starts it, waits until the pool closes it, and shuts it down.
+"""
+
+import os
+import sys
+import time
+import asyncio
+from collections import deque
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from loguru import logger
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+try:
+    from mcp.client.streamable_http import streamable_http_client
+except ImportError:  # mcp < 1.24
+    from mcp.client.streamable_http import streamablehttp_client as streamable_http_client
+
+
+class PooledSession:
+    """An initialized MCP client session owned by the pool."""
+
+    def __init__(self):
+        self.session: Optional[ClientSession] = None
+        self.tools: List[Any] = []
+        self.uses = 0
+        self.created = time.monotonic()
+        self._ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the session is initialized and its owning task still runs."""
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def close(self, timeout: float = 10.0):
+        """
+        Ask the owning task to shut the session down, and wait for it.
+
+        Args:
+            timeout: Seconds to wait before cancelling the task
+        """
+        self._closing.set()
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        except Exception:
+            pass
+
+
+class MCPSessionPool:
+    """
+    Keeps ``min_idle`` MCP server sessions warm, up to ``max_size`` in total.
+
+    Idle sessions are pinged when checked out, so a session whose server
+    died is replaced instead of being handed to a chat. A session is closed
+    instead of recycled after ``max_uses`` checkouts or when released with
+    ``reset=True``.
+    """
+
+    def __init__(
+        self,
+        server_path: Optional[str] = None,
+        server_url: Optional[str] = None,
+        min_idle: int = 1,
+        max_size: int = 10,
+        max_uses: int = 50,
+        start_timeout: float = 60.0,
+        ping_timeout: float = 5.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            server_path: MCP server script to start over stdio
+            server_url: URL of a shared streamable HTTP MCP server, used
+                instead of ``server_path``
+            min_idle: Sessions kept started and waiting for a chat
+            max_size: Most sessions open at once, idle or checked out
+            max_uses: Checkouts after which a session is replaced
+            start_timeout: Seconds a session may take to initialize
+            ping_timeout: Seconds an idle session may take to answer a ping
+        """
+        if not server_path and not server_url:
+            raise ValueError("MCPSessionPool needs a server_path or a server_url")
+        self.server_path = server_path
+        self.server_url = server_url
+        self.min_idle = min_idle
+        self.max_size = max(max_size, min_idle, 1)
+        self.max_uses = max_uses
+        self.start_timeout = start_timeout
+        self.ping_timeout = ping_timeout
+        self._sessions: Set[PooledSession] = set()
+        self._idle: Deque[PooledSession] = deque()
+        self._checked_out: Set[PooledSession] = set()
+        self._warming = 0
+        self._changed = asyncio.Condition()
+        self._closed = False
+
+    @classmethod
+    def from_env(cls, server_path: Optional[str] = None) -> "MCPSessionPool":
+        """
+        Build a pool from environment variables.
+
+        ``MCP_SERVER_URL`` or ``MCP_SERVER_PATH`` select the server;
+        ``MCP_POOL_MIN_IDLE``, ``MCP_POOL_MAX_SIZE`` and ``MCP_POOL_MAX_USES``
+        override the defaults.
+
+        Args:
+            server_path: Server script used if MCP_SERVER_PATH is not set
+
+        Returns:
+            Configured MCPSessionPool
+        """
+        return cls(
+            server_path=os.getenv("MCP_SERVER_PATH", server_path),
+            server_url=os.getenv("MCP_SERVER_URL"),
+            min_idle=int(os.getenv("MCP_POOL_MIN_IDLE", 1)),
+            max_size=int(os.getenv("MCP_POOL_MAX_SIZE", 10)),
+            max_uses=int(os.getenv("MCP_POOL_MAX_USES", 50)),
+        )
+
+    def start(self):
+        """Start warming the idle sessions (returns without waiting for them)."""
+        self._top_up()
+
+    def _top_up(self):
+        """Start sessions until ``min_idle`` are idle or warming, within ``max_size``."""
+        while (
+            not self._closed
+            and len(self._idle) + self._warming < self.min_idle
+            and len(self._sessions) < self.max_size
+        ):
+            self._spawn(warm=True)
+
+    def _spawn(self, warm: bool) -> PooledSession:
+        """
+        Start a session in its own task.
+
+        Args:
+            warm: Park the session in the idle queue once it is ready (instead
+                of handing it to the caller waiting on it)
+        """
+        pooled = PooledSession()
+        self._sessions.add(pooled)
+        if warm:
+            self._warming += 1
+        pooled._task = asyncio.create_task(self._own(pooled, warm))
+        return pooled
+
+    async def _open_transport(self, stack: AsyncExitStack):
+        """Connect to the server, returning the transport's read and write streams."""
+        if self.server_url:
+            read_stream, write_stream, _ = await stack.enter_async_context(streamable_http_client(self.server_url))
+            return read_stream, write_stream
+        command = sys.executable if self.server_path.endswith(".py") else "node"
+        params = StdioServerParameters(command=command, args=[self.server_path])
+        return await stack.enter_async_context(stdio_client(params))
+
+    async def _own(self, pooled: PooledSession, warm: bool):
+        """
+        Task owning one session: start it, hand it out, and shut it down once
+        the pool closes it.
+        """
+        try:
+            async with AsyncExitStack() as stack:
+                read_stream, write_stream = await self._open_transport(stack)
+                session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+                await asyncio.wait_for(session.initialize(), self.start_timeout)
+                pooled.tools = (await session.list_tools()).tools
+                pooled.session = session
+
+                if warm:
+                    self._warming -= 1
+                    warm = False
+                    if not self._closed:
+                        async with self._changed:
+                            self._idle.append(pooled)
+                            self._changed.notify()
+                pooled._ready.set_result(pooled)
+                await pooled._closing.wait()
+        except Exception as e:
+            logger.warning(f"MCP session failed: {e}")
+            if not pooled._ready.done():
+                pooled._ready.set_exception(e)
+                # Nobody waits on a warming session's start
+                if warm:
+                    pooled._ready.exception()
+        finally:
+            if warm:
+                self._warming -= 1
+            pooled.session = None
+            self._sessions.discard(pooled)
+            if pooled in self._idle:
+                self._idle.remove(pooled)
+            async with self._changed:
+                self._changed.notify_all()
+
+    async def _healthy(self, pooled: PooledSession) -> bool:
+        """Check that an idle session's server still answers."""
+        if not pooled.alive:
+            return False
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), self.ping_timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Idle MCP session did not answer a ping: {e}")
+            return False
+
+    async def acquire(self) -> PooledSession:
+        """
+        Check out a session, waiting if ``max_size`` sessions are in use.
+
+        Returns:
+            Initialized session; give it back with release()
+
+        Raises:
+            RuntimeError: If the pool is closed
+            Exception: If a session had to be started and failed to start
+        """
+        while True:
+            async with self._changed:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("MCP session pool is closed")
+                    if self._idle:
+                        pooled = self._idle.popleft()
+                        break
+                    # Wait for a warming session before starting another one
+                    if not self._warming and len(self._sessions) < self.max_size:
+                        pooled = self._spawn(warm=False)
+                        break
+                    await self._changed.wait()
+
+            self._checked_out.add(pooled)
+            self._top_up()
+            try:
+                if not pooled._ready.done():
+                    # Started for this caller; wait for it
+                    return await pooled._ready
+                if await self._healthy(pooled):
+                    return pooled
+            except BaseException:
+                self._checked_out.discard(pooled)
+                await pooled.close()
+                raise
+            self._checked_out.discard(pooled)
+            await pooled.close()
+
+    async def release(self, pooled: PooledSession, reset: bool = False):
+        """
+        Give a checked-out session back.
+
+        Args:
+            pooled: Session from acquire()
+            reset: Close the session instead of recycling it
+        """
+        self._checked_out.discard(pooled)
+        pooled.uses += 1
+        if reset or self._closed or not pooled.alive or pooled.uses >= self.max_uses:
+            await pooled.close()
+        else:
+            async with self._changed:
+                self._idle.append(pooled)
+                self._changed.notify()
+        self._top_up()
+
+    def stats(self) -> Dict[str, int]:
+        """Open, idle, warming and checked-out sessions."""
+        return {
+            "size": len(self._sessions),
+            "idle": len(self._idle),
+            "warming": self._warming,
+            "in_use": len(self._checked_out),
+        }
+
+    async def close(self):
+        """Close every session; sessions still checked out close when released."""
+        self._closed = True
+        async with self._changed:
+            self._changed.notify_all()
+        self._idle.clear()
+        sessions = [pooled for pooled in self._sessions if pooled not in self._checked_out]
+        await asyncio.gather(*(pooled.close() for pooled in sessions))
@@ -0,0 +1,693 @@
+"""
+Token-bucket rate limiting for LinkedIn requests.
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import asyncio
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from loguru import logger
+
+from errors import ThrottledError
+import cancellation
+from utils import get_data_dir
+
+
+# Endpoints with their own budget, and their default (refill rate per second, burst)
+DEFAULT_LIMITS: Dict[str, Tuple[float, int]] = {
+    "profile": (0.5, 3),
+    "jobs": (0.5, 3),
+    "company": (0.5, 3),
+    "people": (0.5, 3),
+}
+
+# Status codes LinkedIn uses to throttle (999 is its non-standard "request denied")
+THROTTLE_STATUS_CODES = (429, 999)
+
+# URL fragments of the login wall and security-challenge pages
+CHALLENGE_URL_MARKERS = ("/checkpoint/", "/authwall", "/uas/login")
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Each
+    acquire takes one token; when the bucket is empty the caller reserves the
+    next token and waits until it has refilled, so concurrent callers are
+    queued fairly instead of all retrying at once.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _apply(self, op: Callable[[float, float], Tuple[float, object]]):
+        """
+        Refill the bucket and apply ``op`` to its token count atomically.
+
+        Args:
+            op: Function taking the current token count and refill rate, and
+                returning the new token count and a result
+
+        Returns:
+            The result returned by ``op``
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._tokens, result = op(tokens, self.rate)
+            self._updated = now
+            return result
+
+    def _reserve(self) -> float:
+        """
+        Take a token, possibly from the future.
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        def take(tokens, rate):
+            tokens -= 1
+            return tokens, (0.0 if tokens >= 0 else -tokens / rate)
+
+        return self._apply(take)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative when callers are queued)."""
+        return self._apply(lambda tokens, rate: (tokens, tokens))
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token only if one is available right now.
+
+        Returns:
+            True if a token was taken
+        """
+        def take(tokens, rate):
+            if tokens >= 1:
+                return tokens - 1, True
+            return tokens, False
+
+        return self._apply(take)
+
+    def penalize(self, seconds: float):
+        """
+        Empty the bucket so that no token is available for ``seconds``.
+
+        Args:
+            seconds: How long callers must wait for the next token
+        """
+        self._apply(lambda tokens, rate: (min(tokens, 1 - seconds * rate), None))
+
+    def acquire(self) -> float:
+        """
+        Take a token, blocking the thread until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            cancellation.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Take a token, waiting on the event loop until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class SQLiteBucketStore:
+    """
+    Token-bucket state kept in a SQLite file shared by every process on a host.
+
+    Each update runs in an immediate (write-locked) transaction, so processes
+    drawing from the same bucket see each other's spending and the combined
+    request rate stays within the bucket's budget. The store also keeps the
+    rate scales set by AdaptiveRateController, so a process slowing down
+    after throttling slows every process down.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the shared store.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scales (key TEXT PRIMARY KEY, scale REAL NOT NULL)"
+        )
+
+    def _scale(self, key: str) -> float:
+        """Read a rate scale (1.0 if it was never set); the caller holds the lock."""
+        row = self._conn.execute("SELECT scale FROM scales WHERE key = ?", (key,)).fetchone()
+        return 1.0 if row is None else row[0]
+
+    def get_scale(self, key: str) -> float:
+        """
+        Get a shared rate scale.
+
+        Args:
+            key: Scale name (the namespace of the buckets it applies to)
+
+        Returns:
+            The scale, 1.0 if it was never set
+        """
+        with self._lock:
+            return self._scale(key)
+
+    def update_scale(self, key: str, op: Callable[[float], float]) -> float:
+        """
+        Apply ``op`` to a shared rate scale atomically.
+
+        Args:
+            key: Scale name
+            op: Function taking the current scale and returning the new one
+
+        Returns:
+            The new scale
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                scale = self._scale(key)
+                new_scale = op(scale)
+                if new_scale != scale:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO scales (key, scale) VALUES (?, ?)", (key, new_scale)
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return new_scale
+
+    def apply(
+        self,
+        key: str,
+        rate: float,
+        burst: int,
+        op: Callable[[float, float], Tuple[float, object]],
+        scale_key: Optional[str] = None,
+    ):
+        """
+        Refill a bucket and apply ``op`` to its token count atomically.
+
+        Args:
+            key: Bucket name
+            rate: Tokens added per second, before scaling
+            burst: Maximum number of tokens the bucket holds
+            op: Function taking the current token count and refill rate, and
+                returning the new token count and a result
+            scale_key: Shared scale applied to ``rate``, if any
+
+        Returns:
+            The result returned by ``op``
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                if scale_key is not None:
+                    rate *= self._scale(scale_key)
+                row = self._conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    tokens = float(burst)
+                else:
+                    tokens = min(burst, row[0] + max(0.0, now - row[1]) * rate)
+                tokens, result = op(tokens, rate)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                    (key, tokens, now),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return result
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    A token bucket whose state lives in a SQLiteBucketStore.
+
+    Its refill rate is ``rate`` times the shared scale ``scale_key``, read
+    from the store on every refill.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteBucketStore,
+        key: str,
+        rate: float,
+        burst: int = 1,
+        scale_key: Optional[str] = None,
+    ):
+        """
+        Initialize the bucket.
+
+        Args:
+            store: Shared store holding the bucket state
+            key: Bucket name within the store
+            rate: Tokens added per second, before scaling
+            burst: Maximum number of tokens the bucket holds
+            scale_key: Shared scale applied to ``rate``, if any
+        """
+        super().__init__(rate, burst)
+        self.store = store
+        self.key = key
+        self.scale_key = scale_key
+
+    def _apply(self, op: Callable[[float, float], Tuple[float, object]]):
+        return self.store.apply(self.key, self.rate, self.burst, op, self.scale_key)
+
+    async def acquire_async(self) -> float:
+        """
+        Take a token, waiting on the event loop until it is available.
+
+        The store's transaction can block on another process holding the
+        write lock, so it runs on a worker thread.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = await asyncio.to_thread(self._reserve)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Per-endpoint token buckets for the LinkedIn endpoints the scraper uses.
+
+    Buckets are kept in memory, or in a SQLite store when one is given so
+    that every scraper process on the host shares one budget. The rate
+    scale is then shared too.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        store: Optional[str] = None,
+        namespace: str = "",
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            limits: Mapping of endpoint name to (refill rate per second, burst),
+                merged over DEFAULT_LIMITS
+            store: Path to a SQLite file shared between processes, or None to
+                keep buckets in this process only
+            namespace: Prefix of the bucket names in the shared store, so
+                that separate budgets (e.g. per account) can share one file
+        """
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.store = SQLiteBucketStore(store) if store else None
+        self.namespace = namespace
+        self._scale = 1.0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, namespace: str = "", capacity: int = 1) -> "RateLimiter":
+        """
+        Build a limiter from environment variables.
+
+        ``RATE_LIMIT_<ENDPOINT>_RATE`` and ``RATE_LIMIT_<ENDPOINT>_BURST``
+        override the defaults, e.g. ``RATE_LIMIT_JOBS_RATE=1.0``.
+        ``RATE_LIMIT_STORE`` is the shared SQLite file (defaulting to one in
+        the data directory), or ``memory`` to keep budgets per process.
+
+        Args:
+            namespace: Prefix of the bucket names in the shared store
+            capacity: Multiplier of the configured rates and bursts, e.g. the
+                number of accounts whose budgets this limiter covers
+
+        Returns:
+            Configured RateLimiter
+        """
+        limits = {}
+        for endpoint, (rate, burst) in DEFAULT_LIMITS.items():
+            prefix = f"RATE_LIMIT_{endpoint.upper()}"
+            limits[endpoint] = (
+                float(os.getenv(f"{prefix}_RATE", rate)) * capacity,
+                int(os.getenv(f"{prefix}_BURST", burst)) * capacity,
+            )
+
+        store = os.getenv("RATE_LIMIT_STORE") or str(get_data_dir() / "rate_limits.sqlite3")
+        if store == "memory":
+            store = None
+        return cls(limits, store=store, namespace=namespace)
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """
+        Get the bucket for an endpoint, creating it on first use.
+
+        Args:
+            endpoint: Endpoint name (profile, jobs, company, people)
+
+        Returns:
+            The endpoint's TokenBucket
+        """
+        with self._lock:
+            if endpoint not in self._buckets:
+                rate, burst = self.limits.get(endpoint, DEFAULT_LIMITS["profile"])
+                if self.store is not None:
+                    self._buckets[endpoint] = SharedTokenBucket(
+                        self.store, self.namespace + endpoint, rate, burst, scale_key=self.namespace
+                    )
+                else:
+                    self._buckets[endpoint] = TokenBucket(rate * self._scale, burst)
+            return self._buckets[endpoint]
+
+    @property
+    def scale(self) -> float:
+        """Multiplier currently applied to the configured rates."""
+        if self.store is not None:
+            return self.store.get_scale(self.namespace)
+        return self._scale
+
+    def update_scale(self, op: Callable[[float], float]) -> float:
+        """
+        Change the rate scale atomically (across processes with a shared store).
+
+        Args:
+            op: Function taking the current scale and returning the new one
+
+        Returns:
+            The new scale
+        """
+        if self.store is not None:
+            return self.store.update_scale(self.namespace, op)
+
+        with self._lock:
+            self._scale = op(self._scale)
+            for endpoint, bucket in self._buckets.items():
+                rate, _ = self.limits.get(endpoint, DEFAULT_LIMITS["profile"])
+                bucket.rate = rate * self._scale
+            return self._scale
+
+    def set_scale(self, scale: float):
+        """
+        Scale every endpoint's refill rate relative to its configured rate.
+
+        Args:
+            scale: Multiplier applied to the configured rates
+        """
+        self.update_scale(lambda _: scale)
+
+    def penalize(self, seconds: float):
+        """
+        Hold back every endpoint for ``seconds`` (e.g. after a Retry-After).
+
+        Args:
+            seconds: How long callers must wait for the next token
+        """
+        for endpoint in self.limits:
+            self.bucket(endpoint).penalize(seconds)
+
+    def current_rates(self) -> Dict[str, float]:
+        """
+        Get the effective refill rate of each endpoint.
+
+        Returns:
+            Mapping of endpoint name to requests per second
+        """
+        scale = self.scale
+        return {
+            endpoint: rate * scale
+            for endpoint, (rate, _) in self.limits.items()
+        }
+
+    def acquire(self, endpoint: str) -> float:
+        """Take a token for an endpoint, blocking until it is available."""
+        wait = self.bucket(endpoint).acquire()
+        if wait > 0:
+            logger.debug(f"Rate limiting {endpoint}: waited {wait:.2f}s")
+        return wait
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """Take a token for an endpoint without blocking the event loop."""
+        wait = await self.bucket(endpoint).acquire_async()
+        if wait > 0:
+            logger.debug(f"Rate limiting {endpoint}: waited {wait:.2f}s")
+        return wait
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def detect_throttle(status_code: int, headers: Mapping[str, str], url: str = "") -> Optional[ThrottledError]:
+    """
+    Check whether a LinkedIn response means we are being throttled.
+
+    Args:
+        status_code: HTTP status of the response
+        headers: Response headers
+        url: Final URL of the response (after redirects)
+
+    Returns:
+        A ThrottledError describing the throttling, or None for a normal response
+    """
+    retry_after = parse_retry_after(headers.get("Retry-After"))
+
+    if status_code in THROTTLE_STATUS_CODES:
+        return ThrottledError(f"LinkedIn throttled the request (HTTP {status_code})", status_code, retry_after)
+    if retry_after is not None:
+        return ThrottledError(f"LinkedIn asked to retry after {retry_after:.0f}s", status_code, retry_after)
+    if any(marker in str(url) for marker in CHALLENGE_URL_MARKERS):
+        return ThrottledError(f"LinkedIn served a challenge page: {url}", status_code)
+    return None
+
+
+class AdaptiveRateController:
+    """
+    AIMD control of a RateLimiter's request rate.
+
+    Every healthy response raises the rate scale by a fixed step, up to
+    ``max_scale``. A throttling response multiplies it by ``decrease``, down
+    to ``min_scale``, and a Retry-After holds every endpoint back for that
+    long. Decreases are applied at most once per ``decrease_interval``, so a
+    burst of concurrent throttled requests only counts once.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        increase: float = 0.02,
+        decrease: float = 0.5,
+        min_scale: float = 0.1,
+        max_scale: float = 4.0,
+        decrease_interval: float = 2.0,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            limiter: Limiter whose rates are controlled
+            increase: Scale added per healthy response
+            decrease: Factor applied to the scale per throttling response
+            min_scale: Lowest allowed scale of the configured rates
+            max_scale: Highest allowed scale of the configured rates
+            decrease_interval: Minimum seconds between two decreases
+        """
+        self.limiter = limiter
+        self.increase = increase
+        self.decrease = decrease
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.decrease_interval = decrease_interval
+        self.successes = 0
+        self.throttles = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, limiter: RateLimiter) -> "AdaptiveRateController":
+        """
+        Build a controller from environment variables.
+
+        ``RATE_LIMIT_INCREASE``, ``RATE_LIMIT_DECREASE``,
+        ``RATE_LIMIT_MIN_SCALE`` and ``RATE_LIMIT_MAX_SCALE`` override the
+        defaults.
+
+        Args:
+            limiter: Limiter whose rates are controlled
+
+        Returns:
+            Configured AdaptiveRateController
+        """
+        return cls(
+            limiter,
+            increase=float(os.getenv("RATE_LIMIT_INCREASE", 0.02)),
+            decrease=float(os.getenv("RATE_LIMIT_DECREASE", 0.5)),
+            min_scale=float(os.getenv("RATE_LIMIT_MIN_SCALE", 0.1)),
+            max_scale=float(os.getenv("RATE_LIMIT_MAX_SCALE", 4.0)),
+        )
+
+    def on_success(self):
+        """Additively raise the rate after a healthy response."""
+        with self._lock:
+            self.successes += 1
+            self.limiter.update_scale(lambda scale: min(self.max_scale, scale + self.increase))
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """
+        Multiplicatively lower the rate after a throttling response.
+
+        Args:
+            retry_after: Seconds LinkedIn asked us to wait, if given
+        """
+        with self._lock:
+            self.throttles += 1
+            now = time.monotonic()
+            if now - self._last_decrease >= self.decrease_interval:
+                self._last_decrease = now
+                scale = self.limiter.update_scale(lambda scale: max(self.min_scale, scale * self.decrease))
+                logger.warning(f"LinkedIn throttling detected, lowering request rate to {scale:.2f}x")
+
+        if retry_after:
+            self.limiter.penalize(retry_after)
+
+    def observe(self, status_code: int, headers: Mapping[str, str], url: str = "") -> Optional[ThrottledError]:
+        """
+        Update the rate from a LinkedIn response.
+
+        Args:
+            status_code: HTTP status of the response
+            headers: Response headers
+            url: Final URL of the response (after redirects)
+
+        Returns:
+            A ThrottledError if the response was a throttling response
+        """
+        throttle = detect_throttle(status_code, headers, url)
+        if throttle is not None:
+            self.on_throttle(throttle.retry_after)
+        elif 200 <= status_code < 300:
+            self.on_success()
+        return throttle
+
+    def requests_hook(self, response, *args, **kwargs):
+        """requests response hook feeding every response into observe()."""
+        self.observe(response.status_code, response.headers, response.url)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get the controller's current state.
+
+        Returns:
+            Current scale, effective per-endpoint rates and response counters
+        """
+        return {
+            "scale": round(self.limiter.scale, 3),
+            "rates": {endpoint: round(rate, 3) for endpoint, rate in self.limiter.current_rates().items()},
+            "successes": self.successes,
+            "throttles": self.throttles,
+        }
+
+
+def rate_limited(endpoint: str):
+    """
+    Decorator that takes a token from ``self.rate_limiter`` before each call.
+
+    Works on both regular methods and coroutine methods.
+
+    Args:
+        endpoint: Endpoint whose budget the call draws from
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                await self.rate_limiter.acquire_async(endpoint)
+                return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            self.rate_limiter.acquire(endpoint)
+            return func(self, *args, **kwargs)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,176 @@
+"""
+Compact record types for scraped LinkedIn data.
+
+Records keep their fields in ``__slots__`` instead of a per-instance dict,
+which roughly halves the memory of a large result set and avoids building
+a dictionary per record. They support read-only mapping access (``job["title"]``,
+``job.get("company")``, ``"error" in profile``) so code written against the
+old dictionaries keeps working, and are converted to plain dictionaries only
+when results leave the process (see to_dict and json_default).
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Characters of a job description kept by the job formatter and served in a job summary
+JOB_SUMMARY_DESCRIPTION_LENGTH = 200
+
+
+class Record:
+    """
+    Base class of the slotted records.
+
+    Subclasses list their fields in ``__slots__``. Fields left as None are
+    omitted from the mapping view when ``omit_none`` is set.
+    """
+
+    __slots__ = ()
+    omit_none = False
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {', '.join(sorted(fields))}")
+
+    def keys(self) -> Iterator[str]:
+        """Names of the fields present in the mapping view."""
+        for name in self.__slots__:
+            if not self.omit_none or getattr(self, name) is not None:
+                yield name
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """(name, value) pairs of the mapping view."""
+        for name in self.keys():
+            yield name, getattr(self, name)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self.__slots__:
+            return False
+        return not self.omit_none or getattr(self, key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.keys())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field, or ``default`` if it is not present."""
+        return getattr(self, key) if key in self else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record to a plain dictionary."""
+        return dict(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+class ProfileRecord(Record):
+    """
+    A profile, from the API (first/last name, summary, ...) or the web page
+    (name, about, experience, education). Missing fields are omitted.
+    """
+
+    __slots__ = (
+        "url", "profile_id", "first_name", "last_name", "name", "headline", "summary", "about",
+        "location", "industry", "connections", "follower_count", "experience", "education",
+        "scraped_at", "method",
+    )
+    omit_none = True
+
+
+class JobRecord(Record):
+    """A job posting from a job search."""
+
+    __slots__ = ("job_id", "title", "company", "location", "description", "posted_at", "job_url", "scraped_at")
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Convert the job to a dictionary for listing responses.
+
+        Returns:
+            The job's fields, with the description shortened to
+            JOB_SUMMARY_DESCRIPTION_LENGTH characters
+        """
+        data = self.to_dict()
+        data["description"] = (self.description or "")[:JOB_SUMMARY_DESCRIPTION_LENGTH]
+        return data
+
+
+class CompanyRecord(Record):
+    """A company page."""
+
+    __slots__ = (
+        "company_id", "name", "description", "industry", "company_size", "headquarters",
+        "specialties", "website", "follower_count", "scraped_at",
+    )
+
+
+class PersonRecord(Record):
+    """A person from a people search."""
+
+    __slots__ = ("profile_id", "name", "headline", "location", "profile_url", "scraped_at")
+
+
+def to_dict(value: Any) -> Any:
+    """
+    Convert a record to a dictionary, leaving any other value as it is.
+
+    Args:
+        value: Record, or a value that is already plain (e.g. a cached dict)
+
+    Returns:
+        Plain value
+    """
+    return value.to_dict() if isinstance(value, Record) else value
+
+
+def to_dicts(values: Optional[List[Any]]) -> List[Any]:
+    """Convert a list of records (see to_dict)."""
+    return [to_dict(value) for value in values or []]
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Convert records nested anywhere in lists and dicts to dictionaries.
+
+    Args:
+        value: Tool result, e.g. a record or a list of bulk results holding records
+
+    Returns:
+        The same structure made of plain values only
+    """
+    if isinstance(value, Record):
+        value = value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """
+    ``default`` hook for json.dumps that serializes records.
+
+    Raises:
+        TypeError: If the value is not a record
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
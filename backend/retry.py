@@ -0,0 +1,272 @@
+"""
+Retry policy for LinkedIn requests.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Type
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+import aiohttp
+import requests
+from loguru import logger
+
+from errors import ThrottledError
+import cancellation
+
+
+# Errors that are worth another attempt: network trouble, throttling, and
+# LinkedIn answering an API call with an HTML error page instead of JSON
+DEFAULT_RETRYABLE: Tuple[Type[BaseException], ...] = (
+    ThrottledError,
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.JSONDecodeError,
+    json.JSONDecodeError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# Errors that will fail the same way however often they are retried
+DEFAULT_NON_RETRYABLE: Tuple[Type[BaseException], ...] = (
+    ValueError,
+    TypeError,
+    KeyError,
+    AttributeError,
+    PermissionError,
+    NotImplementedError,
+)
+
+# HTTP statuses that indicate a transient failure
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504, 999})
+
+# HTTP statuses that blame the request (e.g. a profile that does not exist)
+CALLER_ERROR_STATUS_CODES = frozenset({400, 404, 410})
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """Get the HTTP status carried by a requests or aiohttp error, if any."""
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status
+    return None
+
+
+def is_caller_error(exc: BaseException) -> bool:
+    """
+    Tell whether an error was caused by the request rather than the backend.
+
+    Bad arguments and missing entities say nothing about the backend's
+    health. Authentication failures, challenges, blocks (401, 403, 429) and
+    unexpected responses do, even though retrying them is pointless.
+
+    Args:
+        exc: The raised exception
+
+    Returns:
+        True if the error is the caller's
+    """
+    status = _status_code(exc)
+    if status is not None:
+        return status in CALLER_ERROR_STATUS_CODES
+    # JSONDecodeError is a ValueError, but means LinkedIn sent an error page
+    if isinstance(exc, (requests.exceptions.JSONDecodeError, json.JSONDecodeError)):
+        return False
+    return isinstance(exc, (ValueError, TypeError))
+
+
+class RetryPolicy:
+    """
+    Decides which failures to retry and how long to wait between attempts.
+
+    Transient errors are retried with full-jitter exponential backoff (a
+    random delay between 0 and ``base_delay * 2 ** attempt``, capped at
+    ``max_delay``), or after the server's Retry-After when one was given.
+    Permanent errors are raised immediately, and no attempt is started once
+    the total ``deadline`` would be exceeded.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        deadline: Optional[float] = 60.0,
+        retryable: Tuple[Type[BaseException], ...] = DEFAULT_RETRYABLE,
+        non_retryable: Tuple[Type[BaseException], ...] = DEFAULT_NON_RETRYABLE,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts: Maximum number of attempts, including the first
+            base_delay: Backoff ceiling for the first retry, in seconds
+            max_delay: Largest backoff ceiling, in seconds
+            deadline: Total seconds allowed for all attempts and waits, or None
+            retryable: Exception classes that are always retried
+            non_retryable: Exception classes that are never retried
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retryable = retryable
+        self.non_retryable = non_retryable
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """
+        Build a policy from environment variables.
+
+        ``RETRY_MAX_ATTEMPTS``, ``RETRY_BASE_DELAY``, ``RETRY_MAX_DELAY`` and
+        ``RETRY_DEADLINE`` override the defaults.
+
+        Returns:
+            Configured RetryPolicy
+        """
+        return cls(
+            max_attempts=int(os.getenv("RETRY_MAX_ATTEMPTS", 3)),
+            base_delay=float(os.getenv("RETRY_BASE_DELAY", 1.0)),
+            max_delay=float(os.getenv("RETRY_MAX_DELAY", 30.0)),
+            deadline=float(os.getenv("RETRY_DEADLINE", 60.0)),
+        )
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """
+        Classify an error as transient or permanent.
+
+        Args:
+            exc: The raised exception
+
+        Returns:
+            True if the operation should be attempted again
+        """
+        status = _status_code(exc)
+        if status is not None:
+            return status in RETRYABLE_STATUS_CODES
+        if isinstance(exc, self.retryable):
+            return True
+        if isinstance(exc, self.non_retryable):
+            return False
+        # Unknown errors are treated as permanent so they fail fast
+        return False
+
+    def backoff(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """
+        Get the delay before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed, starting at 0
+            exc: The error that attempt raised
+
+        Returns:
+            Seconds to wait
+        """
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _next_delay(self, attempt: int, exc: BaseException, started: float, name: str) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if not self.is_retryable(exc):
+            logger.error(f"{name} failed with a permanent error: {exc}")
+            return None
+        if attempt + 1 >= self.max_attempts:
+            logger.error(f"{name} failed after {self.max_attempts} attempts: {exc}")
+            return None
+
+        delay = self.backoff(attempt, exc)
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            logger.error(f"{name} failed; retry deadline of {self.deadline:.0f}s reached: {exc}")
+            return None
+
+        logger.warning(f"Attempt {attempt + 1} of {name} failed: {exc}. Retrying in {delay:.2f}s...")
+        return delay
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call ``func``, retrying transient failures.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of ``func``
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started, func.__name__)
+                if delay is None:
+                    raise
+                cancellation.sleep(delay)
+                attempt += 1
+
+    async def call_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Await ``func``, retrying transient failures.
+
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of ``func``
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started, func.__name__)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+
+def retrying(func):
+    """
+    Decorator that runs a method under ``self.retry_policy``.
+
+    Works on both regular methods and coroutine methods.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            return await self.retry_policy.call_async(func, self, *args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return self.retry_policy.call(func, self, *args, **kwargs)
+
+    return wrapper
@@ -6,7 +6,9 @@ import os
 import sys
 import time
 import json
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
@@ -16,20 +18,95 @@ if str(_backend_dir) not in sys.path:
     sys.path.insert(0, str(_backend_dir))
 
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from linkedin_api import Linkedin
 
 # Import utils from backend directory
 from utils import (
-    rate_limit,
     get_random_user_agent,
     sanitize_url,
     extract_linkedin_id,
     clean_text,
-    retry_on_failure,
+    format_epoch_dates,
+    encode_cursor,
+    decode_cursor,
 )
+from rate_limiter import RateLimiter, AdaptiveRateController, detect_throttle, rate_limited
+from retry import RetryPolicy, retrying, is_caller_error
+from circuit_breaker import CircuitBreakerRegistry
+from errors import CircuitOpenError, ToolCancelledError
+from cache import ResponseCache, SearchResultCache, validate_cache_policy
+from singleflight import SingleFlight, flight_key
+from extractors import PROFILE_EXTRACTOR
+from session_store import SessionStore, create_api_client
+from account_pool import AccountPool, SESSION_REJECTED_URL_MARKERS
+from proxy_pool import ProxyPool
+from transport import Revalidator, transport_from_env
+from records import ProfileRecord, JobRecord, CompanyRecord, PersonRecord
+
+
+# Bytes read at a time when streaming a profile page
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Jobs requested per page by iter_jobs (LinkedIn serves at most 49 per request)
+JOB_PAGE_SIZE = 25
+
+# Record type of each persistent cache namespace (entries are stored as dictionaries)
+CACHED_RECORD_TYPES = {"profile": ProfileRecord, "company": CompanyRecord}
+
+
+def _job_query(keywords, location, job_type, experience_level):
+    """Key identifying a job search, independent of paging."""
+    return flight_key(
+        "jobs", keywords=keywords, location=location, job_type=job_type,
+        experience_level=experience_level,
+    )
+
+
+def _job_page_key(query, offset, count):
+    """Search-result cache key of one page of a job search (see _job_query)."""
+    return (*query, ("page", offset, count))
+
+
+def job_cursor(
+    offset: int,
+    keywords: str,
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    experience_level: Optional[str] = None
+) -> str:
+    """
+    Get the cursor that resumes a job search at ``offset``.
+    
+    Lets a caller continue with iter_jobs after the first ``offset`` results
+    came from search_jobs.
+    
+    Returns:
+        Cursor for iter_jobs
+    """
+    return encode_cursor(offset, _job_query(keywords, location, job_type, experience_level))
+
+
+def job_cursor_offset(
+    cursor: str,
+    keywords: str,
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    experience_level: Optional[str] = None
+) -> int:
+    """
+    Get the offset a job search cursor resumes at.
+    
+    Lets a caller reject a bad cursor before it starts iterating.
+    
+    Returns:
+        Position of the next result
+        
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another search
+    """
+    return decode_cursor(cursor, _job_query(keywords, location, job_type, experience_level))
 
 
 class LinkedInScraper:
@@ -37,18 +114,59 @@ class LinkedInScraper:
     A scraper for extracting data from LinkedIn.
     """
     
-    def __init__(self, email: Optional[str] = None, password: Optional[str] = None):
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
         """
         Initialize the LinkedIn scraper.
         
         Args:
             email: LinkedIn account email
             password: LinkedIn account password
+            rate_limiter: Per-endpoint rate limiter (configured from the
+                environment if not given)
+            retry_policy: Retry policy for LinkedIn calls (configured from
+                the environment if not given)
+        
+        If LINKEDIN_ACCOUNTS_FILE is set, calls are spread over a pool of
+        accounts instead of the single ``email`` account. If LINKEDIN_PROXIES
+        is set, web requests are spread over a pool of egress proxies. The
+        default rate limiter's budget is multiplied by the size of the larger
+        pool, since each account and each egress IP has its own budget.
         """
         self.email = email or os.getenv("LINKEDIN_EMAIL")
         self.password = password or os.getenv("LINKEDIN_PASSWORD")
         self.session = requests.Session()
-        self.api_client = None
+        self._api_client = None
+        self._api_client_future: Optional[Future] = None
+        self.login_timeout = float(os.getenv("LINKEDIN_LOGIN_TIMEOUT", 120))
+        self.account_pool = AccountPool.from_env(Linkedin)
+        self.proxy_pool = ProxyPool.from_env()
+        self.rate_limiter = rate_limiter or RateLimiter.from_env(
+            capacity=max(len(self.account_pool or ()), len(self.proxy_pool or ()), 1)
+        )
+        self.rate_controller = AdaptiveRateController.from_env(self.rate_limiter)
+        self.retry_policy = retry_policy or RetryPolicy.from_env()
+        self.circuit_breakers = CircuitBreakerRegistry.from_env()
+        self.cache = ResponseCache.from_env()
+        self.search_cache = SearchResultCache.from_env()
+        self._flights = SingleFlight()
+        # Background refreshes of stale searches (threads start on first use)
+        self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
+        self.session_store = SessionStore.from_env(self.password) if self.email else None
+        self._login_lock = threading.Lock()
+        self._last_login = 0.0
+        self._api_state = threading.local()
+        
+        # Profile page fields the web fallback waits for before it stops
+        # reading (all of them unless WEB_PROFILE_FIELDS lists a subset)
+        self.web_profile_fields = [
+            field.strip() for field in os.getenv("WEB_PROFILE_FIELDS", "").split(",") if field.strip()
+        ] or None
         
         # Set up session headers
         self.session.headers.update({
@@ -58,24 +176,214 @@ class LinkedInScraper:
             "Connection": "keep-alive",
         })
         
-        # Initialize API client if credentials are provided
-        if self.email and self.password:
+        # Adapt the request rate to how LinkedIn responds
+        self.session.hooks["response"].append(self.rate_controller.requests_hook)
+        
+        # Page fetches go through a pluggable transport that revalidates
+        # pages fetched before instead of downloading them again
+        self.revalidator = Revalidator(self.cache) if self.cache is not None else None
+        self.transport = transport_from_env(
+            self.session, self.proxy_pool, self.revalidator, hooks=[self.rate_controller.requests_hook]
+        )
+        
+        # Initialize API client in the background if credentials are provided,
+        # so construction does not wait on the LinkedIn login
+        if self.account_pool is not None:
+            self._api_client_future = Future()
+            self.account_pool.start()
+            threading.Thread(
+                target=self._initialize_account_pool,
+                args=(self._api_client_future, self.account_pool),
+                name="linkedin-login",
+                daemon=True,
+            ).start()
+        elif self.email and self.password:
+            self._api_client_future = Future()
+            threading.Thread(
+                target=self._initialize_api_client,
+                args=(self._api_client_future, Linkedin),
+                name="linkedin-login",
+                daemon=True,
+            ).start()
+    
+    @property
+    def api_client(self) -> Optional[Linkedin]:
+        """
+        The LinkedIn API client, or None if unavailable.
+        
+        Waits (up to ``login_timeout`` seconds) for the background login
+        started by the constructor.
+        """
+        future = self._api_client_future
+        if future is not None:
             try:
-                logger.info("Initializing LinkedIn API client...")
-                self.api_client = Linkedin(self.email, self.password)
-                logger.success("LinkedIn API client initialized successfully")
-            except Exception as e:
-                logger.warning(f"Could not initialize LinkedIn API client: {e}")
-                logger.info("Will fallback to web scraping methods")
+                api_client = future.result(timeout=self.login_timeout)
+            except FutureTimeoutError:
+                logger.warning("LinkedIn login is still in progress. Continuing without the API client.")
+                return None
+            if self._api_client_future is future:
+                self._api_client = api_client
+                self._api_client_future = None
+        return self._api_client
+    
+    @api_client.setter
+    def api_client(self, api_client: Optional[Linkedin]):
+        # Replaces the client of any login still in progress
+        self._api_client_future = None
+        self._api_client = api_client
+    
+    @property
+    def login_pending(self) -> Optional[Future]:
+        """The future of the background login while it is in progress, else None."""
+        return self._api_client_future
+    
+    def _initialize_api_client(self, future: Future, factory):
+        """
+        Log in and resolve ``future`` with the API client (or None on failure).
+        
+        Runs in the background login thread. ``factory`` is the client class,
+        captured when the scraper was constructed.
+        """
+        api_client = None
+        try:
+            logger.info("Initializing LinkedIn API client...")
+            api_client = self._create_api_client(factory)
+            logger.success("LinkedIn API client initialized successfully")
+        except Exception as e:
+            logger.warning(f"Could not initialize LinkedIn API client: {e}")
+            logger.info("Will fallback to web scraping methods")
+        finally:
+            future.set_result(api_client)
+    
+    def _initialize_account_pool(self, future: Future, pool: AccountPool):
+        """
+        Resolve ``future`` with the account pool once an account has logged in.
+        
+        Resolves it with None if every login failed, so the scraper falls
+        back to web scraping. Accounts still logging in join the pool later.
+        """
+        if pool.wait_ready():
+            logger.success(f"LinkedIn account pool ready ({len(pool)} accounts)")
+            future.set_result(pool)
+        else:
+            logger.warning("No LinkedIn account of the pool could log in")
+            logger.info("Will fallback to web scraping methods")
+            future.set_result(None)
     
-    @rate_limit(delay=2.0)
-    @retry_on_failure(max_retries=3)
-    def scrape_profile(self, profile_url: str) -> Dict[str, Any]:
+    def _create_api_client(self, factory) -> Linkedin:
+        """
+        Create an authenticated API client.
+        
+        A saved session is reused when there is one, which skips the login
+        request entirely; otherwise the client logs in and its session is
+        saved for the next start.
+        
+        Args:
+            factory: LinkedIn API client class
+        
+        Returns:
+            LinkedIn API client
+        """
+        saved = self.session_store.load(self.email) if self.session_store else None
+        if saved:
+            cookies, metadata = saved
+            api_client = create_api_client(factory, self.email, self.password, cookies=cookies)
+            api_client.client.metadata.update(metadata)
+            logger.info("Reusing saved LinkedIn session")
+        else:
+            api_client = create_api_client(factory, self.email, self.password)
+            self._last_login = time.monotonic()
+            self._save_session(api_client)
+        
+        api_client.client.session.hooks["response"].append(self.rate_controller.requests_hook)
+        api_client.client.session.hooks["response"].append(self._session_hook)
+        return api_client
+    
+    def _save_session(self, api_client: Linkedin):
+        """Save the API client's session, if sessions are stored."""
+        if self.session_store is None:
+            return
+        try:
+            self.session_store.save(self.email, api_client.client.cookies, api_client.client.metadata)
+        except Exception as e:
+            logger.warning(f"Could not save LinkedIn session: {e}")
+    
+    def _session_hook(self, response, *args, **kwargs):
+        """Notice LinkedIn rejecting the API session (requests response hook)."""
+        if response.status_code == 401 or any(marker in str(response.url) for marker in SESSION_REJECTED_URL_MARKERS):
+            self._api_state.session_rejected = True
+    
+    def _refresh_login(self):
+        """Log the API client in again after its session was rejected."""
+        with self._login_lock:
+            # Another thread may have just logged in for the same rejection
+            if time.monotonic() - self._last_login < 60:
+                return
+            
+            logger.warning("LinkedIn rejected the saved session; logging in again")
+            if self.session_store is not None:
+                self.session_store.clear(self.email)
+            client = self.api_client.client
+            client._do_authentication_request(self.email, self.password)
+            client._fetch_metadata()
+            self._last_login = time.monotonic()
+            self._save_session(self.api_client)
+    
+    def _call_api(self, func, *args, **kwargs):
+        """
+        Call the API client, logging in again once if the session was rejected.
+        
+        Args:
+            func: API client method
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+            
+        Returns:
+            The result of ``func``
+        """
+        self._api_state.session_rejected = False
+        try:
+            result = func(*args, **kwargs)
+            if not self._api_state.session_rejected:
+                return result
+        except Exception:
+            if not self._api_state.session_rejected:
+                raise
+        
+        self._refresh_login()
+        self._api_state.session_rejected = False
+        return func(*args, **kwargs)
+    
+    def scrape_profile(self, profile_url: str, cache_policy: str = "use") -> Dict[str, Any]:
         """
         Scrape a LinkedIn profile.
         
         Args:
             profile_url: LinkedIn profile URL
+            cache_policy: "use" to serve a fresh cached copy, "refresh" to
+                re-fetch and update the cache, "bypass" to skip the cache
+            
+        Returns:
+            Dictionary containing profile information
+        """
+        validate_cache_policy(cache_policy)
+        profile_url = sanitize_url(profile_url)
+        profile_id = extract_linkedin_id(profile_url)
+        
+        if not profile_id:
+            raise ValueError("Could not extract profile ID from URL")
+        
+        return self._cached("profile", profile_id.lower(), cache_policy, self._fetch_profile, profile_url, profile_id)
+    
+    @retrying
+    @rate_limited("profile")
+    def _fetch_profile(self, profile_url: str, profile_id: str) -> Dict[str, Any]:
+        """
+        Fetch a profile from LinkedIn.
+        
+        Args:
+            profile_url: Sanitized LinkedIn profile URL
+            profile_id: Public profile ID from the URL
             
         Returns:
             Dictionary containing profile information
@@ -83,28 +391,177 @@ class LinkedInScraper:
         logger.info(f"Scraping profile: {profile_url}")
         
         try:
-            profile_url = sanitize_url(profile_url)
-            profile_id = extract_linkedin_id(profile_url)
-            
-            if not profile_id:
-                raise ValueError("Could not extract profile ID from URL")
-            
             # Try using API client first
             if self.api_client:
                 try:
                     logger.debug("Using LinkedIn API client")
-                    profile_data = self.api_client.get_profile(profile_id)
+                    profile_data = self._guarded("linkedin_api", "profile", self.api_client.get_profile, profile_id)
                     return self._format_profile_data(profile_data, profile_url)
+                except CircuitOpenError as e:
+                    logger.debug(f"{e}. Using web scraping.")
                 except Exception as e:
                     logger.warning(f"API client failed: {e}. Falling back to web scraping.")
             
             # Fallback to web scraping
-            return self._scrape_profile_web(profile_url)
+            return self._guarded("web", "profile", self._scrape_profile_web, profile_url)
             
         except Exception as e:
             logger.error(f"Error scraping profile {profile_url}: {e}")
             raise
     
+    def _cached(self, namespace: str, key: str, cache_policy: str, fetch, *args, **kwargs):
+        """
+        Serve a lookup from the persistent cache, fetching on a miss.
+        
+        Concurrent fetches of the same entity share one upstream request.
+        
+        Args:
+            namespace: Entity type (profile, company)
+            key: Canonical entity identifier
+            cache_policy: "use", "refresh" or "bypass"
+            fetch: Function fetching the entity from LinkedIn
+            *args: Positional arguments for ``fetch``
+            **kwargs: Keyword arguments for ``fetch``
+            
+        Returns:
+            The cached or freshly fetched entity
+        """
+        if self.cache is None or cache_policy == "bypass":
+            return self._flights.do((namespace, key), fetch, *args, **kwargs)
+        
+        if cache_policy == "use":
+            cached = self._cache_lookup(namespace, key)
+            if cached is not None:
+                return cached
+        
+        result = self._flights.do((namespace, key), fetch, *args, **kwargs)
+        if "error" not in result:
+            self.cache.set(namespace, key, result)
+        return result
+    
+    def _cache_lookup(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Look up an entity in the persistent cache, as the record a fetch returns.
+        
+        Args:
+            namespace: Entity type (profile, company)
+            key: Canonical entity identifier
+            
+        Returns:
+            The cached entity, or None on a miss or an entry that no longer
+            fits its record type
+        """
+        cached = self.cache.get(namespace, key)
+        if cached is None:
+            return None
+        
+        record_type = CACHED_RECORD_TYPES.get(namespace)
+        if record_type is not None:
+            try:
+                cached = record_type(**cached)
+            except TypeError as e:
+                logger.debug(f"Ignoring outdated cache entry for {namespace} {key}: {e}")
+                return None
+        logger.debug(f"Cache hit for {namespace} {key}")
+        return cached
+    
+    def _guarded(self, backend: str, operation: str, func, *args, **kwargs):
+        """
+        Call a backend through its circuit breaker.
+        
+        Every error counts as a breaker failure except the caller's own
+        (see is_caller_error) and cancellations, which say nothing about
+        the backend either way.
+        
+        Args:
+            backend: Backend name (linkedin_api, web)
+            operation: Operation name (profile, jobs, company, people)
+            func: Backend function to call
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+            
+        Returns:
+            The result of ``func``
+            
+        Raises:
+            CircuitOpenError: If the breaker is open and the call was skipped
+        """
+        breaker = self.circuit_breakers.get(backend, operation)
+        if not breaker.allow_request():
+            raise CircuitOpenError(backend, operation, breaker.retry_in)
+        
+        try:
+            if backend == "linkedin_api":
+                result = self._call_api(func, *args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
+        except ToolCancelledError:
+            breaker.record_ignored()
+            raise
+        except Exception as e:
+            if is_caller_error(e):
+                breaker.record_ignored()
+            else:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_ignored()
+            raise
+        
+        breaker.record_success()
+        return result
+    
+    def _cached_search(self, key, cache_policy: str, fetch, *args) -> List[Dict[str, Any]]:
+        """
+        Serve a search from the search-result cache, fetching on a miss.
+        
+        Stale results are returned immediately while a background refresh
+        brings the entry up to date.
+        
+        Args:
+            key: Normalized query key (see flight_key)
+            cache_policy: "use", "refresh" or "bypass"
+            fetch: Function running the search on LinkedIn
+            *args: Positional arguments for ``fetch``
+            
+        Returns:
+            The cached or freshly fetched results
+        """
+        if self.search_cache is None or cache_policy == "bypass":
+            return self._flights.do(key, fetch, *args)
+        
+        if cache_policy == "use":
+            cached, state = self.search_cache.get(key)
+            if state == SearchResultCache.STALE:
+                self._schedule_refresh(key, fetch, *args)
+            if cached is not None:
+                return cached
+        
+        result = self._flights.do(key, fetch, *args)
+        self._store_search(key, result)
+        return result
+    
+    def _store_search(self, key, result):
+        """Cache a search's results, unless the search could not run."""
+        # Without an API client the search answers [] without asking LinkedIn
+        if self.api_client:
+            self.search_cache.set(key, result)
+    
+    def _schedule_refresh(self, key, fetch, *args):
+        """Refresh a stale search in the background, once per key at a time."""
+        if not self.search_cache.begin_refresh(key):
+            return
+        
+        def refresh():
+            try:
+                self._store_search(key, self._flights.do(key, fetch, *args))
+            except Exception as e:
+                logger.warning(f"Background refresh of {key[0]} search failed: {e}")
+            finally:
+                self.search_cache.end_refresh(key)
+        
+        self._refresher.submit(refresh)
+    
     def _scrape_profile_web(self, profile_url: str) -> Dict[str, Any]:
         """
         Scrape profile using web scraping (fallback method).
@@ -117,37 +574,48 @@ class LinkedInScraper:
         """
         logger.debug(f"Web scraping profile: {profile_url}")
         
-        response = self.session.get(profile_url, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, "lxml")
-        
-        # Extract basic information
-        profile_data = {
-            "url": profile_url,
-            "profile_id": extract_linkedin_id(profile_url),
-            "scraped_at": datetime.now().isoformat(),
-            "method": "web_scraping",
-        }
-        
-        # Note: LinkedIn's structure changes frequently
-        # This is a basic example that may need updates
+        # Stream the body and stop reading once every field has been found
+        response = self.transport.get(profile_url, timeout=30, endpoint="profile")
+        try:
+            throttle = detect_throttle(response.status_code, response.headers, response.url)
+            if throttle:
+                raise throttle
+            response.raise_for_status()
+            
+            fields = PROFILE_EXTRACTOR.extract_stream(
+                response.iter_content(chunk_size=STREAM_CHUNK_SIZE), self.web_profile_fields
+            )
+        finally:
+            response.close()
         
-        # Try to extract name
-        name_elem = soup.find("h1", class_="text-heading-xlarge")
-        if name_elem:
-            profile_data["name"] = clean_text(name_elem.get_text())
+        return self._build_web_profile(fields, profile_url)
+    
+    def _build_web_profile(self, fields: Dict[str, Any], profile_url: str) -> ProfileRecord:
+        """
+        Build a profile from fields extracted from its page.
         
-        # Try to extract headline
-        headline_elem = soup.find("div", class_="text-body-medium")
-        if headline_elem:
-            profile_data["headline"] = clean_text(headline_elem.get_text())
+        Args:
+            fields: Fields found by the profile extractor
+            profile_url: LinkedIn profile URL
+            
+        Returns:
+            Profile record
+        """
+        # Note: LinkedIn's structure changes frequently; the selectors live
+        # in extractors.PROFILE_FIELDS
+        profile_data = ProfileRecord(
+            url=profile_url,
+            profile_id=extract_linkedin_id(profile_url),
+            scraped_at=datetime.now().isoformat(),
+            method="web_scraping",
+            **fields,
+        )
         
         logger.info(f"Successfully scraped profile (web method): {profile_data.get('name', 'Unknown')}")
         
         return profile_data
     
-    def _format_profile_data(self, api_data: Dict, profile_url: str) -> Dict[str, Any]:
+    def _format_profile_data(self, api_data: Dict, profile_url: str) -> ProfileRecord:
         """
         Format profile data from API response.
         
@@ -156,64 +624,84 @@ class LinkedInScraper:
             profile_url: Profile URL
             
         Returns:
-            Formatted profile data
-        """
-        formatted = {
-            "url": profile_url,
-            "profile_id": api_data.get("public_id"),
-            "first_name": api_data.get("firstName"),
-            "last_name": api_data.get("lastName"),
-            "headline": api_data.get("headline"),
-            "summary": api_data.get("summary"),
-            "location": api_data.get("geoLocationName"),
-            "industry": api_data.get("industryName"),
-            "connections": api_data.get("connections"),
-            "follower_count": api_data.get("followerCount"),
-            "scraped_at": datetime.now().isoformat(),
-            "method": "linkedin_api",
-        }
-        
-        # Clean up None values
-        formatted = {k: v for k, v in formatted.items() if v is not None}
+            Profile record (fields the API did not return are omitted)
+        """
+        formatted = ProfileRecord(
+            url=profile_url,
+            profile_id=api_data.get("public_id"),
+            first_name=api_data.get("firstName"),
+            last_name=api_data.get("lastName"),
+            headline=api_data.get("headline"),
+            summary=api_data.get("summary"),
+            location=api_data.get("geoLocationName"),
+            industry=api_data.get("industryName"),
+            connections=api_data.get("connections"),
+            follower_count=api_data.get("followerCount"),
+            scraped_at=datetime.now().isoformat(),
+            method="linkedin_api",
+        )
         
         logger.success(f"Successfully scraped profile (API): {formatted.get('first_name', '')} {formatted.get('last_name', '')}")
         
         return formatted
     
-    @rate_limit(delay=2.0)
-    @retry_on_failure(max_retries=3)
     def search_jobs(
         self,
         keywords: str,
         location: Optional[str] = None,
         job_type: Optional[str] = None,
         experience_level: Optional[str] = None,
-        limit: int = 10
-    ) -> List[Dict[str, Any]]:
+        limit: int = 10,
+        cache_policy: str = "use"
+    ) -> List[JobRecord]:
         """
         Search for jobs on LinkedIn.
         
+        Recent results are served from the search-result cache, and identical
+        searches already in flight are shared rather than repeated.
+        
         Args:
             keywords: Search keywords
             location: Job location
             job_type: Job type (full-time, part-time, contract, etc.)
             experience_level: Experience level (entry, mid, senior, etc.)
             limit: Maximum number of results
-            
+            cache_policy: "use" to serve cached results, "refresh" to re-run
+                the search and update the cache, "bypass" to skip the cache
+        
         Returns:
-            List of job dictionaries
+            List of job records
         """
+        validate_cache_policy(cache_policy)
+        key = flight_key(
+            "jobs", keywords=keywords, location=location, job_type=job_type,
+            experience_level=experience_level, limit=limit,
+        )
+        return self._cached_search(key, cache_policy, self._fetch_jobs, keywords, location, job_type, experience_level, limit)
+    
+    @retrying
+    @rate_limited("jobs")
+    def _fetch_jobs(
+        self,
+        keywords: str,
+        location: Optional[str],
+        job_type: Optional[str],
+        experience_level: Optional[str],
+        limit: int
+    ) -> List[JobRecord]:
+        """Fetch a job search from LinkedIn (see search_jobs)."""
         logger.info(f"Searching jobs: keywords='{keywords}', location='{location}'")
         
         try:
             if self.api_client:
                 logger.debug("Using LinkedIn API client for job search")
-                jobs = self.api_client.search_jobs(
+                jobs = self._guarded(
+                    "linkedin_api", "jobs", self.api_client.search_jobs,
                     keywords=keywords,
                     location_name=location,
                     limit=limit
                 )
-                return [self._format_job_data(job) for job in jobs]
+                return self._format_jobs(jobs)
             else:
                 logger.warning("API client not available. Job search requires authentication.")
                 return []
@@ -222,7 +710,83 @@ class LinkedInScraper:
             logger.error(f"Error searching jobs: {e}")
             raise
     
-    def _format_job_data(self, job_data: Dict) -> Dict[str, Any]:
+    def iter_jobs(
+        self,
+        keywords: str,
+        location: Optional[str] = None,
+        job_type: Optional[str] = None,
+        experience_level: Optional[str] = None,
+        page_size: int = JOB_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        max_results: Optional[int] = None,
+        cache_policy: str = "use"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Page through a job search lazily.
+        
+        Each page is fetched and formatted only when the caller asks for it,
+        so results can be shown while later pages load, and a caller can stop
+        at any point and resume later from the last ``next_cursor``. Pages
+        are cached in the search-result cache like search_jobs results.
+        
+        Args:
+            keywords: Search keywords
+            location: Job location
+            job_type: Job type (full-time, part-time, contract, etc.)
+            experience_level: Experience level (entry, mid, senior, etc.)
+            page_size: Jobs per page (at most 49)
+            cursor: ``next_cursor`` of a previous page to resume from
+            max_results: Stop after this many jobs (unbounded if None)
+            cache_policy: "use" to serve cached pages, "refresh" to re-fetch
+                them and update the cache, "bypass" to skip the cache
+        
+        Yields:
+            Pages with ``jobs``, and ``next_cursor`` (None on the last page)
+        """
+        if not 1 <= page_size <= 49:
+            raise ValueError("page_size must be between 1 and 49")
+        validate_cache_policy(cache_policy)
+        
+        query = _job_query(keywords, location, job_type, experience_level)
+        offset = decode_cursor(cursor, query) if cursor else 0
+        remaining = max_results
+        
+        while remaining is None or remaining > 0:
+            count = page_size if remaining is None else min(page_size, remaining)
+            jobs = self._cached_search(
+                _job_page_key(query, offset, count), cache_policy,
+                self._fetch_jobs_page, keywords, location, offset, count,
+            )
+            offset += len(jobs)
+            if remaining is not None:
+                remaining -= len(jobs)
+            
+            # A short page means LinkedIn has no more results
+            next_cursor = encode_cursor(offset, query) if len(jobs) == count else None
+            yield {"jobs": jobs, "next_cursor": next_cursor}
+            if next_cursor is None:
+                return
+    
+    @retrying
+    @rate_limited("jobs")
+    def _fetch_jobs_page(self, keywords: str, location: Optional[str], offset: int, count: int) -> List[JobRecord]:
+        """Fetch and format one page of a job search (see iter_jobs)."""
+        logger.info(f"Fetching jobs page: keywords='{keywords}', offset={offset}")
+        
+        if not self.api_client:
+            logger.warning("API client not available. Job search requires authentication.")
+            return []
+        
+        jobs = self._guarded(
+            "linkedin_api", "jobs", self.api_client.search_jobs,
+            keywords=keywords,
+            location_name=location,
+            limit=count,
+            offset=offset
+        )
+        return self._format_jobs(jobs)
+    
+    def _format_job_data(self, job_data: Dict) -> JobRecord:
         """
         Format job data from API response.
         
@@ -230,46 +794,83 @@ class LinkedInScraper:
             job_data: Raw job data
             
         Returns:
-            Formatted job dictionary
-        """
-        # Extract company name from various possible fields
-        company_name = (
-            job_data.get("companyName") or
-            job_data.get("company", {}).get("name") if isinstance(job_data.get("company"), dict) else job_data.get("company") or
-            job_data.get("companyDetails", {}).get("name") if isinstance(job_data.get("companyDetails"), dict) else None or
-            "Company Information Available"
-        )
+            Job record
+        """
+        return self._format_jobs([job_data])[0]
+    
+    def _format_jobs(self, jobs: List[Dict]) -> List[JobRecord]:
+        """
+        Format a batch of jobs from a search response in one pass.
         
-        # Extract job ID
-        entity_urn = job_data.get("entityUrn", "")
-        job_id = entity_urn.split(":")[-1] if entity_urn else job_data.get("dashEntityUrn", "").split(":")[-1]
+        The batch shares one ``scraped_at`` and posting times are converted
+        together.
         
-        # Format posted time
-        posted_time = job_data.get("listedAt") or job_data.get("originalListedAt")
-        if posted_time and isinstance(posted_time, (int, float)):
-            from datetime import datetime as dt
-            posted_date = dt.fromtimestamp(posted_time / 1000).strftime("%Y-%m-%d")
-        else:
-            posted_date = posted_time or "Recently"
-        
-        return {
-            "job_id": job_id,
-            "title": job_data.get("title", "Position Title"),
-            "company": company_name,
-            "companyName": company_name,  # Include both keys for compatibility
-            "location": job_data.get("location", job_data.get("formattedLocation", "Location TBD")),
-            "description": clean_text(job_data.get("description", "")),
-            "posted_at": posted_date,
-            "job_url": f"https://www.linkedin.com/jobs/view/{job_id}/" if job_id else "https://www.linkedin.com/jobs/",
-            "scraped_at": datetime.now().isoformat(),
-        }
-    
-    @rate_limit(delay=2.0)
-    @retry_on_failure(max_retries=3)
-    def get_company_info(self, company_identifier: str) -> Dict[str, Any]:
+        Args:
+            jobs: Raw job data, as returned by the API client
+            
+        Returns:
+            Job records, in the order of ``jobs``
+        """
+        scraped_at = datetime.now().isoformat()
+        posted_times = [job.get("listedAt") or job.get("originalListedAt") for job in jobs]
+        posted_dates = format_epoch_dates(posted_times)
+        
+        records = []
+        for job_data, posted_time, posted_date in zip(jobs, posted_times, posted_dates):
+            # Extract company name from various possible fields, in order
+            company_name = job_data.get("companyName")
+            for field in ("company", "companyDetails"):
+                if company_name:
+                    break
+                value = job_data.get(field)
+                company_name = value.get("name") if isinstance(value, dict) else value
+            company_name = company_name or "Company Information Available"
+            
+            # Extract job ID
+            entity_urn = job_data.get("entityUrn", "")
+            job_id = entity_urn.split(":")[-1] if entity_urn else job_data.get("dashEntityUrn", "").split(":")[-1]
+            
+            records.append(JobRecord(
+                job_id=job_id,
+                title=job_data.get("title", "Position Title"),
+                company=company_name,
+                location=job_data.get("location", job_data.get("formattedLocation", "Location TBD")),
+                description=clean_text(job_data.get("description", "")),
+                posted_at=posted_date or posted_time or "Recently",
+                job_url=f"https://www.linkedin.com/jobs/view/{job_id}/" if job_id else "https://www.linkedin.com/jobs/",
+                scraped_at=scraped_at,
+            ))
+        return records
+    
+    def get_company_info(self, company_identifier: str, cache_policy: str = "use") -> Dict[str, Any]:
         """
         Get information about a company.
         
+        Args:
+            company_identifier: Company name or LinkedIn company ID
+            cache_policy: "use" to serve a fresh cached copy, "refresh" to
+                re-fetch and update the cache, "bypass" to skip the cache
+            
+        Returns:
+            Company information dictionary
+        """
+        validate_cache_policy(cache_policy)
+        key = company_identifier.strip().lower()
+        result = self._cached("company", key, cache_policy, self._fetch_company_info, company_identifier)
+        
+        # Also file the company under its canonical universalName
+        universal_name = (result.get("company_id") or "").lower()
+        if self.cache is not None and cache_policy != "bypass" and universal_name and universal_name != key:
+            self.cache.set("company", universal_name, result)
+        
+        return result
+    
+    @retrying
+    @rate_limited("company")
+    def _fetch_company_info(self, company_identifier: str) -> Dict[str, Any]:
+        """
+        Fetch company information from LinkedIn.
+        
         Args:
             company_identifier: Company name or LinkedIn company ID
             
@@ -281,7 +882,7 @@ class LinkedInScraper:
         try:
             if self.api_client:
                 logger.debug("Using LinkedIn API client for company info")
-                company_data = self.api_client.get_company(company_identifier)
+                company_data = self._guarded("linkedin_api", "company", self.api_client.get_company, company_identifier)
                 return self._format_company_data(company_data)
             else:
                 logger.warning("API client not available. Company info requires authentication.")
@@ -291,7 +892,7 @@ class LinkedInScraper:
             logger.error(f"Error fetching company info: {e}")
             raise
     
-    def _format_company_data(self, company_data: Dict) -> Dict[str, Any]:
+    def _format_company_data(self, company_data: Dict) -> CompanyRecord:
         """
         Format company data from API response.
         
@@ -299,48 +900,70 @@ class LinkedInScraper:
             company_data: Raw company data
             
         Returns:
-            Formatted company dictionary
-        """
-        return {
-            "company_id": company_data.get("universalName"),
-            "name": company_data.get("name"),
-            "description": clean_text(company_data.get("description", "")),
-            "industry": company_data.get("industries", []),
-            "company_size": company_data.get("staffCount"),
-            "headquarters": company_data.get("headquarter"),
-            "specialties": company_data.get("specialities", []),
-            "website": company_data.get("companyPageUrl"),
-            "follower_count": company_data.get("followingInfo", {}).get("followerCount"),
-            "scraped_at": datetime.now().isoformat(),
-        }
-    
-    @rate_limit(delay=2.0)
-    @retry_on_failure(max_retries=3)
+            Company record
+        """
+        return CompanyRecord(
+            company_id=company_data.get("universalName"),
+            name=company_data.get("name"),
+            description=clean_text(company_data.get("description", "")),
+            industry=company_data.get("industries", []),
+            company_size=company_data.get("staffCount"),
+            headquarters=company_data.get("headquarter"),
+            specialties=company_data.get("specialities", []),
+            website=company_data.get("companyPageUrl"),
+            follower_count=company_data.get("followingInfo", {}).get("followerCount"),
+            scraped_at=datetime.now().isoformat(),
+        )
+    
     def search_people(
         self,
         keywords: str,
         location: Optional[str] = None,
         current_company: Optional[str] = None,
-        limit: int = 10
-    ) -> List[Dict[str, Any]]:
+        limit: int = 10,
+        cache_policy: str = "use"
+    ) -> List[PersonRecord]:
         """
         Search for people on LinkedIn.
         
+        Recent results are served from the search-result cache, and identical
+        searches already in flight are shared rather than repeated.
+        
         Args:
             keywords: Search keywords
             location: Location filter
             current_company: Filter by current company
             limit: Maximum number of results
-            
+            cache_policy: "use" to serve cached results, "refresh" to re-run
+                the search and update the cache, "bypass" to skip the cache
+        
         Returns:
-            List of people profiles
+            List of person records
         """
+        validate_cache_policy(cache_policy)
+        key = flight_key(
+            "people", keywords=keywords, location=location,
+            current_company=current_company, limit=limit,
+        )
+        return self._cached_search(key, cache_policy, self._fetch_people, keywords, location, current_company, limit)
+    
+    @retrying
+    @rate_limited("people")
+    def _fetch_people(
+        self,
+        keywords: str,
+        location: Optional[str],
+        current_company: Optional[str],
+        limit: int
+    ) -> List[PersonRecord]:
+        """Fetch a people search from LinkedIn (see search_people)."""
         logger.info(f"Searching people: keywords='{keywords}'")
         
         try:
             if self.api_client:
                 logger.debug("Using LinkedIn API client for people search")
-                people = self.api_client.search_people(
+                people = self._guarded(
+                    "linkedin_api", "people", self.api_client.search_people,
                     keywords=keywords,
                     limit=limit
                 )
@@ -353,7 +976,7 @@ class LinkedInScraper:
             logger.error(f"Error searching people: {e}")
             raise
     
-    def _format_person_data(self, person_data: Dict) -> Dict[str, Any]:
+    def _format_person_data(self, person_data: Dict) -> PersonRecord:
         """
         Format person data from search results.
         
@@ -361,19 +984,32 @@ class LinkedInScraper:
             person_data: Raw person data
             
         Returns:
-            Formatted person dictionary
+            Person record
+        """
+        return PersonRecord(
+            profile_id=person_data.get("public_id"),
+            name=f"{person_data.get('firstName', '')} {person_data.get('lastName', '')}".strip(),
+            headline=person_data.get("headline"),
+            location=person_data.get("location"),
+            profile_url=f"https://www.linkedin.com/in/{person_data.get('public_id')}/",
+            scraped_at=datetime.now().isoformat(),
+        )
+    
+    def rate_metrics(self) -> Dict[str, Any]:
+        """
+        Get the current adaptive request rates.
+        
+        Returns:
+            Rate scale, effective per-endpoint rates and response counters
         """
-        return {
-            "profile_id": person_data.get("public_id"),
-            "name": f"{person_data.get('firstName', '')} {person_data.get('lastName', '')}".strip(),
-            "headline": person_data.get("headline"),
-            "location": person_data.get("location"),
-            "profile_url": f"https://www.linkedin.com/in/{person_data.get('public_id')}/",
-            "scraped_at": datetime.now().isoformat(),
-        }
+        return self.rate_controller.metrics()
     
     def close(self):
         """Close the session."""
+        self._refresher.shutdown(wait=False)
+        self.transport.close()
         self.session.close()
+        if self.cache is not None:
+            self.cache.close()
         logger.info("LinkedIn scraper session closed")
 
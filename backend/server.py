@@ -4,13 +4,20 @@ LinkedIn Scraper MCP Server
 
 This server provides LinkedIn scraping capabilities through the Model Context Protocol.
 It exposes tools for scraping profiles, searching jobs, getting company info, and searching people.
+
+The server runs on stdio (one client, which starts the server process) or as
+a long-lived HTTP server that many clients share:
+
+    python server.py --transport streamable-http --port 8001
 """
 
 import os
 import sys
 import json
 import asyncio
-from typing import Any, Optional
+import argparse
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
 from pathlib import Path
 
 # Add backend directory to path
@@ -21,8 +28,16 @@ if str(_backend_dir) not in sys.path:
 from dotenv import load_dotenv
 from loguru import logger
 
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+
 from mcp.server import Server
+from mcp.server.sse import SseServerTransport
 from mcp.server.stdio import stdio_server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.types import (
     Tool,
     TextContent,
@@ -31,28 +46,75 @@ from mcp.types import (
 )
 
 # Import scraper and utils from backend directory
-from scraper import LinkedInScraper
+from scraper import LinkedInScraper, job_cursor
+from async_scraper import AsyncLinkedInScraper
 from utils import setup_logging
+from cache import CACHE_POLICIES
+from records import json_default
+from tool_executor import ToolExecutor
 
 
 # Load environment variables
 load_dotenv()
 
-# Initialize logging
+# Logging is configured when the server runs as a program, so that
+# processes importing the tools (see GeminiMCPClient) keep their own setup
 log_level = os.getenv("LOG_LEVEL", "INFO")
 log_file = os.getenv("LOG_FILE", "logs/linkedin_scraper.log")
-setup_logging(log_level, log_file)
 
 # Initialize the MCP server
 app = Server("linkedin-scraper")
 
 # Initialize the LinkedIn scraper
 scraper: Optional[LinkedInScraper] = None
+async_scraper: Optional[AsyncLinkedInScraper] = None
+
+# Runs the blocking scraper calls off the event loop, so tool calls of one
+# connection run side by side
+tool_executor: Optional[ToolExecutor] = None
+
+# Names of the tools, for their TOOL_CONCURRENCY_<TOOL> limits
+TOOL_NAMES = (
+    "scrape_linkedin_profile",
+    "scrape_linkedin_profiles",
+    "search_linkedin_jobs",
+    "get_company_info",
+    "search_people",
+)
+
+# Transports the server can run on
+TRANSPORTS = ("stdio", "streamable-http", "sse")
+
+# Default address of the HTTP transports
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8001
+
+# Upper bounds for the bulk profile tool
+MAX_BULK_PROFILES = 100
+MAX_BULK_CONCURRENCY = 10
+
+# Upper bound for one job search; searches beyond 50 results are paged
+MAX_JOB_RESULTS = 1000
+
+# Callback reporting a tool's progress: items done so far, the expected
+# total (if known) and the items that just finished
+ProgressCallback = Callable[[int, Optional[int], List[Any]], Awaitable[None]]
+
+# Schema for the cache_policy argument shared by the cached tools
+CACHE_POLICY_SCHEMA = {
+    "type": "string",
+    "enum": list(CACHE_POLICIES),
+    "description": (
+        "How to use the local cache: 'use' returns cached data if fresh (default), "
+        "'refresh' re-fetches from LinkedIn and updates the cache, 'bypass' ignores the cache"
+    ),
+    "default": "use",
+}
 
 
 def initialize_scraper():
     """Initialize the LinkedIn scraper with credentials from environment."""
-    global scraper
+    global scraper, async_scraper, tool_executor
     
     email = os.getenv("LINKEDIN_EMAIL")
     password = os.getenv("LINKEDIN_PASSWORD")
@@ -64,6 +126,8 @@ def initialize_scraper():
         )
     
     scraper = LinkedInScraper(email=email, password=password)
+    async_scraper = AsyncLinkedInScraper(scraper=scraper)
+    tool_executor = ToolExecutor.from_env(TOOL_NAMES)
     logger.info("LinkedIn scraper initialized")
 
 
@@ -88,16 +152,44 @@ async def list_tools() -> list[Tool]:
                     "profile_url": {
                         "type": "string",
                         "description": "The LinkedIn profile URL to scrape (e.g., https://linkedin.com/in/username)",
-                    }
+                    },
+                    "cache_policy": CACHE_POLICY_SCHEMA,
                 },
                 "required": ["profile_url"],
             },
         ),
+        Tool(
+            name="scrape_linkedin_profiles",
+            description=(
+                "Scrape several LinkedIn profiles at once. Duplicate URLs are scraped once, and each "
+                "result reports either the profile or the error for that URL."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "profile_urls": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": f"LinkedIn profile URLs to scrape (max: {MAX_BULK_PROFILES})",
+                    },
+                    "concurrency": {
+                        "type": "number",
+                        "description": f"Profiles scraped at once (default: 5, max: {MAX_BULK_CONCURRENCY})",
+                        "default": 5,
+                    },
+                    "cache_policy": CACHE_POLICY_SCHEMA,
+                },
+                "required": ["profile_urls"],
+            },
+        ),
         Tool(
             name="search_linkedin_jobs",
             description=(
                 "Search for jobs on LinkedIn based on keywords, location, job type, and experience level. "
-                "Returns a list of job postings with details like title, company, location, and description."
+                "Returns job postings with details like title, company, location, and description, "
+                "and a next_cursor to continue the search from (null when there are no more results). "
+                "Progress notifications carry results page by page for searches beyond 50 results "
+                "or resumed with a cursor; other searches report all their results at once."
             ),
             inputSchema={
                 "type": "object",
@@ -120,9 +212,14 @@ async def list_tools() -> list[Tool]:
                     },
                     "limit": {
                         "type": "number",
-                        "description": "Maximum number of results to return (default: 10, max: 50)",
+                        "description": f"Maximum number of results to return (default: 10, max: {MAX_JOB_RESULTS})",
                         "default": 10,
                     },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor of a previous search with the same filters, to continue from",
+                    },
+                    "cache_policy": CACHE_POLICY_SCHEMA,
                 },
                 "required": ["keywords"],
             },
@@ -139,7 +236,8 @@ async def list_tools() -> list[Tool]:
                     "company_identifier": {
                         "type": "string",
                         "description": "Company name or LinkedIn company ID (e.g., 'google', 'microsoft')",
-                    }
+                    },
+                    "cache_policy": CACHE_POLICY_SCHEMA,
                 },
                 "required": ["company_identifier"],
             },
@@ -148,7 +246,8 @@ async def list_tools() -> list[Tool]:
             name="search_people",
             description=(
                 "Search for people on LinkedIn based on keywords, location, and current company. "
-                "Returns a list of profiles with basic information."
+                "Returns a list of profiles with basic information. "
+                "The results arrive in a single progress notification, not one by one."
             ),
             inputSchema={
                 "type": "object",
@@ -170,6 +269,7 @@ async def list_tools() -> list[Tool]:
                         "description": "Maximum number of results (default: 10, max: 50)",
                         "default": 10,
                     },
+                    "cache_policy": CACHE_POLICY_SCHEMA,
                 },
                 "required": ["keywords"],
             },
@@ -177,118 +277,223 @@ async def list_tools() -> list[Tool]:
     ]
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+async def execute_tool(name: str, arguments: Any, progress: Optional[ProgressCallback] = None) -> Any:
     """
-    Handle tool calls from the MCP client.
+    Run a tool and return its result as Python objects.
+    
+    This is the tool logic behind call_tool, which serializes the result
+    for MCP clients. Clients in the same process (see GeminiMCPClient's
+    in-process mode) call it directly and skip the JSON round trip.
+    
+    Blocking scraper calls run on the tool executor, within their tool's
+    concurrency limit and timeout. If the caller is cancelled, the call
+    stops at its next rate limit or retry wait.
+    
+    With a ``progress`` callback, the list tools report their results as
+    they finish: bulk profiles one by one, job searches beyond 50 results
+    page by page, and the other searches once, so the first results can be
+    shown before the whole list is ready.
     
     Args:
         name: Name of the tool to execute
         arguments: Arguments for the tool
+        progress: Callback receiving partial results
         
     Returns:
-        List of TextContent with the results
+        The tool's result: records, or lists and dicts of them
+        
+    Raises:
+        ValueError: If the tool is unknown or an argument is missing
     """
-    global scraper
-    
     if scraper is None:
         initialize_scraper()
     
-    try:
-        logger.info(f"Executing tool: {name}")
-        logger.debug(f"Arguments: {arguments}")
+    # The first call waits here for the background login, without
+    # holding up other requests on the event loop
+    await async_scraper.wait_for_login()
+    
+    logger.info(f"Executing tool: {name}")
+    logger.debug(f"Arguments: {arguments}")
+    
+    if name == "scrape_linkedin_profile":
+        profile_url = arguments.get("profile_url")
+        if not profile_url:
+            raise ValueError("profile_url is required")
         
-        if name == "scrape_linkedin_profile":
-            profile_url = arguments.get("profile_url")
-            if not profile_url:
-                raise ValueError("profile_url is required")
-            
-            result = scraper.scrape_profile(profile_url)
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+        return await tool_executor.run(
+            name,
+            scraper.scrape_profile,
+            profile_url,
+            cache_policy=arguments.get("cache_policy", "use"),
+        )
+    
+    elif name == "scrape_linkedin_profiles":
+        profile_urls = arguments.get("profile_urls")
+        if not profile_urls:
+            raise ValueError("profile_urls is required")
+        if len(profile_urls) > MAX_BULK_PROFILES:
+            raise ValueError(f"At most {MAX_BULK_PROFILES} profile URLs can be scraped per call")
+        
+        async def scrape_profiles():
+            results = []
+            async for result in async_scraper.scrape_profiles(
+                profile_urls,
+                concurrency=min(int(arguments.get("concurrency", 5)), MAX_BULK_CONCURRENCY),
+                cache_policy=arguments.get("cache_policy", "use"),
+            ):
+                results.append(result)
+                if progress:
+                    await progress(len(results), len(profile_urls), [result])
+            return results
+        
+        return await tool_executor.run_async(name, scrape_profiles)
+    
+    elif name == "search_linkedin_jobs":
+        keywords = arguments.get("keywords")
+        if not keywords:
+            raise ValueError("keywords is required")
+        
+        location = arguments.get("location")
+        job_type = arguments.get("job_type")
+        experience_level = arguments.get("experience_level")
+        limit = min(int(arguments.get("limit", 10)), MAX_JOB_RESULTS)
+        cursor = arguments.get("cursor")
+        cache_policy = arguments.get("cache_policy", "use")
         
-        elif name == "search_linkedin_jobs":
-            keywords = arguments.get("keywords")
-            if not keywords:
-                raise ValueError("keywords is required")
-            
-            location = arguments.get("location")
-            job_type = arguments.get("job_type")
-            experience_level = arguments.get("experience_level")
-            limit = min(arguments.get("limit", 10), 50)
-            
-            results = scraper.search_jobs(
+        if cursor is None and limit <= 50:
+            results = await tool_executor.run(
+                name,
+                scraper.search_jobs,
                 keywords=keywords,
                 location=location,
                 job_type=job_type,
                 experience_level=experience_level,
                 limit=limit,
+                cache_policy=cache_policy,
             )
-            
-            # Ensure each job has all required fields with fallbacks
-            formatted_results = []
-            for job in results:
-                formatted_job = {
-                    "job_id": job.get("job_id", ""),
-                    "title": job.get("title", "Position title not available"),
-                    "company": job.get("company") or job.get("companyName") or "Company not specified",
-                    "location": job.get("location", "Location not specified"),
-                    "description": job.get("description", "")[:200],  # Limit description
-                    "posted_at": job.get("posted_at", ""),
-                    "job_url": job.get("job_url", ""),
-                    "scraped_at": job.get("scraped_at", "")
-                }
-                formatted_results.append(formatted_job)
-            
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(formatted_results, indent=2),
-                )
-            ]
+            # Jobs are listed with short descriptions
+            jobs = [job.summary() for job in results]
+            if progress:
+                await progress(len(jobs), limit, jobs)
+            next_cursor = job_cursor(
+                len(results), keywords, location, job_type, experience_level
+            ) if len(results) == limit else None
+            return {"jobs": jobs, "next_cursor": next_cursor}
         
-        elif name == "get_company_info":
-            company_identifier = arguments.get("company_identifier")
-            if not company_identifier:
-                raise ValueError("company_identifier is required")
-            
-            result = scraper.get_company_info(company_identifier)
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
-        
-        elif name == "search_people":
-            keywords = arguments.get("keywords")
-            if not keywords:
-                raise ValueError("keywords is required")
-            
-            location = arguments.get("location")
-            current_company = arguments.get("current_company")
-            limit = min(arguments.get("limit", 10), 50)
-            
-            results = scraper.search_people(
-                keywords=keywords,
+        # Larger or resumed searches are paged
+        async def search_jobs():
+            jobs = []
+            next_cursor = None
+            async for page in async_scraper.iter_jobs(
+                keywords,
                 location=location,
-                current_company=current_company,
-                limit=limit,
-            )
-            
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(results, indent=2),
-                )
-            ]
+                job_type=job_type,
+                experience_level=experience_level,
+                cursor=cursor,
+                max_results=limit,
+                cache_policy=cache_policy,
+            ):
+                summaries = [job.summary() for job in page["jobs"]]
+                jobs.extend(summaries)
+                next_cursor = page["next_cursor"]
+                if progress:
+                    await progress(len(jobs), limit, summaries)
+            return {"jobs": jobs, "next_cursor": next_cursor}
+        
+        return await tool_executor.run_async(name, search_jobs)
+    
+    elif name == "get_company_info":
+        company_identifier = arguments.get("company_identifier")
+        if not company_identifier:
+            raise ValueError("company_identifier is required")
+        
+        return await tool_executor.run(
+            name,
+            scraper.get_company_info,
+            company_identifier,
+            cache_policy=arguments.get("cache_policy", "use"),
+        )
+    
+    elif name == "search_people":
+        keywords = arguments.get("keywords")
+        if not keywords:
+            raise ValueError("keywords is required")
+        
+        limit = min(int(arguments.get("limit", 10)), 50)
         
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+        people = await tool_executor.run(
+            name,
+            scraper.search_people,
+            keywords=keywords,
+            location=arguments.get("location"),
+            current_company=arguments.get("current_company"),
+            limit=limit,
+            cache_policy=arguments.get("cache_policy", "use"),
+        )
+        if progress:
+            await progress(len(people), limit, people)
+        return people
+    
+    else:
+        raise ValueError(f"Unknown tool: {name}")
+
+
+def _make_progress(context: Any, progress_token: Any) -> ProgressCallback:
+    """
+    Build a progress callback sending MCP progress notifications.
+    
+    Args:
+        context: Request context of the tool call
+        progress_token: Progress token the client sent with the request
+        
+    Returns:
+        Callback sending each batch of items as a progress notification
+    """
+    async def report(done: int, total: Optional[int], items: List[Any]):
+        await context.session.send_progress_notification(
+            progress_token,
+            done,
+            total,
+            message=json.dumps({"items": items}, default=json_default),
+            related_request_id=context.request_id,
+        )
+    
+    return report
+
+
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """
+    Handle tool calls from the MCP client.
+    
+    If the request carries a progressToken, partial results are sent as
+    progress notifications whose message is a JSON object with the
+    ``items`` that just finished.
+    
+    Args:
+        name: Name of the tool to execute
+        arguments: Arguments for the tool
+        
+    Returns:
+        List of TextContent with the results
+    """
+    try:
+        context = app.request_context
+        progress_token = context.meta.progressToken if context.meta else None
+    except LookupError:
+        # Called directly rather than for an MCP request
+        context = progress_token = None
+    report = _make_progress(context, progress_token) if progress_token is not None else None
+    
+    try:
+        result = await execute_tool(name, arguments, report)
+        # Records are converted to JSON only here
+        return [
+            TextContent(
+                type="text",
+                text=json.dumps(result, indent=2, default=json_default),
+            )
+        ]
     
     except Exception as e:
         logger.error(f"Error executing tool {name}: {e}")
@@ -304,28 +509,132 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         ]
 
 
-async def main():
-    """Main entry point for the MCP server."""
+async def close_scraper():
+    """Stop the tool executor and close the shared scrapers."""
+    if tool_executor:
+        tool_executor.shutdown()
+    # Also closes the shared sync scraper
+    if async_scraper:
+        await async_scraper.close()
+
+
+class _StreamableHTTPEndpoint:
+    """ASGI endpoint handing requests to the streamable HTTP session manager."""
+    
+    def __init__(self, session_manager: StreamableHTTPSessionManager):
+        self.session_manager = session_manager
+    
+    async def __call__(self, scope, receive, send):
+        await self.session_manager.handle_request(scope, receive, send)
+
+
+def create_http_app(transport: str = "streamable-http") -> Starlette:
+    """
+    Build the ASGI app serving the MCP server over HTTP.
+    
+    All connections share one scraper, so they share its LinkedIn login,
+    caches and rate limits. ``streamable-http`` serves the endpoint
+    ``/mcp``; ``sse`` serves the older HTTP+SSE transport at ``/sse``
+    (with messages posted to ``/messages/``).
+    
+    Args:
+        transport: ``streamable-http`` or ``sse``
+        
+    Returns:
+        Starlette app; the scraper starts and stops with its lifespan
+    """
+    if transport == "streamable-http":
+        session_manager = StreamableHTTPSessionManager(app=app)
+        routes = [Route("/mcp", endpoint=_StreamableHTTPEndpoint(session_manager))]
+        run_transport = session_manager.run
+    elif transport == "sse":
+        sse = SseServerTransport("/messages/")
+        
+        async def handle_sse(request: Request) -> Response:
+            async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+                await app.run(read_stream, write_stream, app.create_initialization_options())
+            return Response()
+        
+        routes = [
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+        ]
+        run_transport = None
+    else:
+        raise ValueError(f"Unknown HTTP transport: {transport}")
+    
+    @asynccontextmanager
+    async def lifespan(_: Starlette) -> AsyncIterator[None]:
+        initialize_scraper()
+        try:
+            if run_transport is None:
+                yield
+            else:
+                async with run_transport():
+                    yield
+        finally:
+            await close_scraper()
+    
+    return Starlette(routes=routes, lifespan=lifespan)
+
+
+async def main(transport: str = "stdio", host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+    """
+    Main entry point for the MCP server.
+    
+    Args:
+        transport: One of TRANSPORTS
+        host: Address the HTTP transports listen on
+        port: Port the HTTP transports listen on
+    """
     logger.info("Starting LinkedIn Scraper MCP Server")
     logger.info(f"Server name: linkedin-scraper")
     logger.info(f"Python version: {sys.version}")
     
-    # Initialize the scraper
+    if transport != "stdio":
+        logger.info(f"Server running on {transport} at http://{host}:{port}")
+        config = uvicorn.Config(
+            create_http_app(transport),
+            host=host,
+            port=port,
+            log_level=log_level.lower(),
+        )
+        await uvicorn.Server(config).serve()
+        return
+    
+    # Initialize the scraper; it logs in to LinkedIn in the background, so
+    # the MCP handshake does not wait for the login
     initialize_scraper()
     
     # Run the server
-    async with stdio_server() as (read_stream, write_stream):
-        logger.info("Server running on stdio")
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            logger.info("Server running on stdio")
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        await close_scraper()
 
 
 if __name__ == "__main__":
+    setup_logging(log_level, log_file)
+    
+    parser = argparse.ArgumentParser(description="LinkedIn Scraper MCP Server")
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=os.getenv("MCP_TRANSPORT", "stdio"),
+        help="stdio for a single client, or an HTTP transport shared by many clients",
+    )
+    parser.add_argument("--host", default=os.getenv("MCP_HOST", DEFAULT_HOST))
+    parser.add_argument("--port", type=int, default=int(os.getenv("MCP_PORT", DEFAULT_PORT)))
+    args = parser.parse_args()
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(args.transport, args.host, args.port))
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -335,4 +644,3 @@ if __name__ == "__main__":
         if scraper:
             scraper.close()
         logger.info("Server shutdown complete")
-
@@ -0,0 +1,232 @@
+"""
+Encrypted on-disk store for authenticated LinkedIn sessions.
+
+linkedin_api keeps its own copy of every session it logs in: an unencrypted
+pickle of the cookie jar in ~/.linkedin_api/cookies. API clients are created
+with create_api_client, which turns that copy off, so the SessionStore is
+the only place sessions are written to.
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+import linkedin_api.settings
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from loguru import logger
+from requests.cookies import RequestsCookieJar
+
+from utils import get_data_dir
+
+
+# PBKDF2 rounds for keys derived from the account password. Kept moderate
+# because the key is derived on every start; set LINKEDIN_SESSION_KEY to
+# skip derivation entirely.
+KDF_ITERATIONS = 100_000
+
+SALT_SIZE = 16
+
+
+class SessionStore:
+    """
+    Saves the cookie jar and client metadata of a logged-in account.
+
+    Each account's session is kept in its own file, encrypted with Fernet.
+    The key is LINKEDIN_SESSION_KEY if set, otherwise it is derived from the
+    account password with PBKDF2 and a random per-file salt. Sessions older
+    than ``max_age`` or whose ``li_at`` cookie has expired are not returned.
+    """
+
+    def __init__(self, directory: str, secret: Optional[str] = None, key: Optional[bytes] = None, max_age: float = 30 * 24 * 3600):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the session files
+            secret: Password to derive the encryption key from
+            key: Fernet key, used instead of ``secret``
+            max_age: Seconds after which a saved session is not reused
+        """
+        if key is None and not secret:
+            raise ValueError("A key or a secret is required to encrypt sessions")
+        self.directory = Path(directory)
+        self.secret = secret
+        self.key = key
+        self.max_age = max_age
+
+    @classmethod
+    def from_env(cls, password: Optional[str]) -> Optional["SessionStore"]:
+        """
+        Build a store from environment variables.
+
+        ``LINKEDIN_SESSION_DIR`` is the directory (defaulting to one in the
+        data directory), or ``off`` to disable saving sessions.
+        ``LINKEDIN_SESSION_KEY`` is an optional Fernet key, and
+        ``LINKEDIN_SESSION_MAX_AGE`` the maximum session age in seconds.
+
+        Args:
+            password: Account password, used to derive the key
+
+        Returns:
+            Configured SessionStore, or None if disabled or no key is available
+        """
+        directory = os.getenv("LINKEDIN_SESSION_DIR") or str(get_data_dir() / "sessions")
+        if directory == "off":
+            return None
+
+        key = os.getenv("LINKEDIN_SESSION_KEY")
+        if not key and not password:
+            return None
+        return cls(
+            directory,
+            secret=password,
+            key=key.encode() if key else None,
+            max_age=float(os.getenv("LINKEDIN_SESSION_MAX_AGE", 30 * 24 * 3600)),
+        )
+
+    def _path(self, account: str) -> Path:
+        """Get the session file of an account."""
+        digest = hashlib.sha256(account.lower().encode("utf-8")).hexdigest()[:16]
+        return self.directory / f"{digest}.session"
+
+    def _fernet(self, salt: bytes) -> Fernet:
+        """Get the cipher for a session file."""
+        if self.key is not None:
+            return Fernet(self.key)
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=KDF_ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(kdf.derive(self.secret.encode("utf-8"))))
+
+    def save(self, account: str, cookies: RequestsCookieJar, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Save an account's session.
+
+        Args:
+            account: Account email
+            cookies: Authenticated cookie jar
+            metadata: Client metadata to restore along with the cookies
+        """
+        state = {
+            "saved_at": time.time(),
+            "cookies": [
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": cookie.domain,
+                    "path": cookie.path,
+                    "expires": cookie.expires,
+                    "secure": cookie.secure,
+                }
+                for cookie in cookies
+            ],
+            "metadata": metadata or {},
+        }
+        salt = os.urandom(SALT_SIZE)
+        token = self._fernet(salt).encrypt(json.dumps(state).encode("utf-8"))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(account)
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(salt + token)
+        os.replace(tmp_path, path)
+        logger.debug("Saved LinkedIn session")
+
+    def load(self, account: str) -> Optional[Tuple[RequestsCookieJar, Dict[str, Any]]]:
+        """
+        Load an account's saved session.
+
+        Args:
+            account: Account email
+
+        Returns:
+            Tuple of (cookie jar, client metadata), or None if there is no
+            usable session
+        """
+        path = self._path(account)
+        try:
+            data = path.read_bytes()
+            state = json.loads(self._fernet(data[:SALT_SIZE]).decrypt(data[SALT_SIZE:]))
+        except FileNotFoundError:
+            return None
+        except (InvalidToken, ValueError) as e:
+            logger.warning(f"Ignoring unreadable saved session: {e or 'wrong key'}")
+            return None
+
+        now = time.time()
+        if now - state["saved_at"] > self.max_age:
+            logger.info("Saved LinkedIn session is too old; logging in again")
+            return None
+
+        cookies = RequestsCookieJar()
+        for cookie in state["cookies"]:
+            if cookie["expires"] is not None and cookie["expires"] < now:
+                continue
+            cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie["domain"], path=cookie["path"],
+                expires=cookie["expires"], secure=cookie["secure"],
+            )
+
+        if "li_at" not in cookies or "JSESSIONID" not in cookies:
+            logger.info("Saved LinkedIn session has expired; logging in again")
+            return None
+        return cookies, state["metadata"]
+
+    def clear(self, account: str):
+        """Delete an account's saved session."""
+        self._path(account).unlink(missing_ok=True)
+
+
+class _NoCookieRepository:
+    """Stands in for linkedin_api's CookieRepository, keeping no cookies on disk."""
+
+    def get(self, username: str) -> None:
+        return None
+
+    def save(self, cookies: RequestsCookieJar, username: str):
+        pass
+
+
+def create_api_client(factory, email: str, password: str, cookies: Optional[RequestsCookieJar] = None):
+    """
+    Create a LinkedIn API client that keeps no plaintext copy of its session.
+
+    The client's cookie repository is replaced before it logs in, so neither
+    the login nor a later re-login writes the pickled cookie jar, and a jar
+    left behind by an earlier version is deleted.
+
+    Args:
+        factory: LinkedIn API client class
+        email: Account email
+        password: Account password
+        cookies: Saved session cookies to use instead of logging in
+
+    Returns:
+        LinkedIn API client
+    """
+    jar = Path(f"{linkedin_api.settings.COOKIE_PATH}{email}.jr")
+    try:
+        jar.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not delete linkedin_api's plaintext cookie jar {jar}: {e}")
+
+    api_client = factory(email, password, authenticate=False)
+    api_client.client._cookie_repository = _NoCookieRepository()
+    if cookies:
+        api_client.client._set_session_cookies(cookies)
+    else:
+        api_client.client.authenticate(email, password)
+    return api_client
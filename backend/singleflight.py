@@ -0,0 +1,156 @@
+"""
+Single-flight coalescing of identical concurrent lookups.
+"""
+
+import sys
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from errors import ToolCancelledError
+
+
+def flight_key(operation: str, *args, **kwargs) -> Tuple:
+    """
+    Build a coalescing key from an operation and its arguments.
+
+    Strings are stripped, lower-cased and whitespace-collapsed, and keyword
+    arguments that are None are dropped, so trivially different spellings of
+    the same lookup share a key.
+
+    Args:
+        operation: Operation name (profile, jobs, company, people)
+        *args: Positional arguments of the lookup
+        **kwargs: Keyword arguments of the lookup
+
+    Returns:
+        Hashable key
+    """
+    def normalize(value):
+        if isinstance(value, str):
+            return " ".join(value.lower().split())
+        return value
+
+    return (
+        operation,
+        tuple(normalize(arg) for arg in args),
+        tuple(sorted((name, normalize(value)) for name, value in kwargs.items() if value is not None)),
+    )
+
+
+class _Call:
+    """An in-flight call that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # The leader's own caller cancelled it; the result is not theirs to share
+        self.cancelled = False
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls made from different threads.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result (or exception).
+    If the leader is cancelled (ToolCancelledError), that cancellation is
+    its caller's alone: a waiting caller takes over and runs the function.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run ``func`` unless an identical call is already in flight.
+
+        Args:
+            key: Coalescing key (see flight_key)
+            func: Function to call
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of the shared call
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+
+            if leader:
+                break
+            call.done.wait()
+            if call.cancelled:
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except ToolCancelledError:
+            call.cancelled = True
+            raise
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces identical concurrent coroutine calls on one event loop.
+
+    The shared call runs as its own task, so a caller that is cancelled does
+    not cancel the fetch the other callers are waiting on.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Await ``func`` unless an identical call is already in flight.
+
+        Args:
+            key: Coalescing key (see flight_key)
+            func: Coroutine function to call
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        return len(self._tasks)
@@ -0,0 +1,196 @@
+"""
+Bounded execution of MCP tool calls.
+
+The scraper is synchronous: a profile scrape can block for seconds on rate
+limit waits, retries and page downloads. The MCP server therefore runs each
+tool's blocking work on a bounded thread pool, so one slow call does not
+stall the event loop and the other requests of the connection. Each tool has
+its own concurrency limit, every call has a timeout, and a call that is
+cancelled (by the client or its timeout) stops at its next wait (see
+cancellation).
+"""
+
+import os
+import sys
+import asyncio
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from loguru import logger
+
+from cancellation import cancel_scope, check_cancelled
+
+
+class ToolExecutor:
+    """
+    Runs tool calls with per-tool concurrency limits and timeouts.
+
+    Blocking calls run on a shared thread pool of ``max_workers`` threads.
+    A call keeps its tool's concurrency slot until its thread is done, even
+    after it was cancelled, so abandoned calls cannot pile up on the pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        concurrency: Optional[Dict[str, int]] = None,
+        default_concurrency: int = 4,
+        timeout: Optional[float] = 120.0,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Threads running blocking tool calls
+            concurrency: Calls of a tool allowed at once, by tool name
+            default_concurrency: Limit of the tools not in ``concurrency``
+            timeout: Seconds a call may take, or None for no limit
+        """
+        self.max_workers = max_workers
+        self.concurrency = dict(concurrency or {})
+        self.default_concurrency = default_concurrency
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_env(cls, tools: Iterable[str] = ()) -> "ToolExecutor":
+        """
+        Build an executor from environment variables.
+
+        ``TOOL_WORKERS`` sets the thread pool size, ``TOOL_CONCURRENCY`` the
+        default per-tool limit and ``TOOL_CONCURRENCY_<TOOL>`` (e.g.
+        ``TOOL_CONCURRENCY_SEARCH_PEOPLE``) the limit of one tool.
+        ``TOOL_TIMEOUT`` is the per-call timeout in seconds (0 disables it).
+
+        Args:
+            tools: Names of the tools that may have their own limit
+
+        Returns:
+            Configured ToolExecutor
+        """
+        concurrency = {}
+        for tool in tools:
+            value = os.getenv(f"TOOL_CONCURRENCY_{tool.upper()}")
+            if value:
+                concurrency[tool] = int(value)
+        timeout = float(os.getenv("TOOL_TIMEOUT", 120))
+        return cls(
+            max_workers=int(os.getenv("TOOL_WORKERS", 8)),
+            concurrency=concurrency,
+            default_concurrency=int(os.getenv("TOOL_CONCURRENCY", 4)),
+            timeout=timeout or None,
+        )
+
+    def limit(self, tool: str) -> int:
+        """Calls of ``tool`` allowed at once."""
+        return self.concurrency.get(tool, self.default_concurrency)
+
+    def _semaphore(self, tool: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding the calls of a tool."""
+        semaphore = self._semaphores.get(tool)
+        if semaphore is None:
+            semaphore = self._semaphores[tool] = asyncio.Semaphore(self.limit(tool))
+        return semaphore
+
+    async def run(self, tool: str, func: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run a blocking call on the thread pool.
+
+        Args:
+            tool: Tool the call belongs to
+            func: Blocking function to call
+            *args: Positional arguments for ``func``
+            timeout: Seconds the call may take (defaults to ``self.timeout``)
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of ``func``
+
+        Raises:
+            TimeoutError: If the call took longer than its timeout
+            asyncio.CancelledError: If the awaiting task was cancelled
+        """
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(tool)
+        await semaphore.acquire()
+
+        event = threading.Event()
+        context = contextvars.copy_context()
+
+        def work():
+            with cancel_scope(event):
+                check_cancelled()
+                return func(*args, **kwargs)
+
+        def release(_):
+            # The loop may be gone if the pool is shut down with queued calls
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                pass
+
+        try:
+            future = self._executor.submit(context.run, work)
+        except BaseException:
+            semaphore.release()
+            raise
+        # Hold the slot until the thread is done, not just until we stop waiting
+        future.add_done_callback(release)
+
+        try:
+            # Cancelling the wrapper also drops the call if it has not started
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            event.set()
+            logger.warning(f"Tool {tool} timed out after {timeout:.0f}s; cancelling it")
+            raise TimeoutError(f"{tool} timed out after {timeout:.0f}s") from None
+        except asyncio.CancelledError:
+            event.set()
+            logger.info(f"Tool {tool} was cancelled")
+            raise
+
+    async def run_async(
+        self,
+        tool: str,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Await a coroutine function under the tool's limit and timeout.
+
+        Args:
+            tool: Tool the call belongs to
+            func: Coroutine function to call
+            *args: Positional arguments for ``func``
+            timeout: Seconds the call may take (defaults to ``self.timeout``)
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of ``func``
+
+        Raises:
+            TimeoutError: If the call took longer than its timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        async with self._semaphore(tool):
+            try:
+                return await asyncio.wait_for(func(*args, **kwargs), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Tool {tool} timed out after {timeout:.0f}s")
+                raise TimeoutError(f"{tool} timed out after {timeout:.0f}s") from None
+
+    def shutdown(self):
+        """Stop the thread pool without waiting for running calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
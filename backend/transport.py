@@ -0,0 +1,501 @@
+"""
+Pluggable HTTP transports for fetching LinkedIn pages.
+
+Page fetchers ask a transport for a streamed PageResponse and do not care
+which HTTP client produced it. RequestsTransport uses the scraper's
+requests session (HTTP/1.1). HttpxTransport multiplexes requests over one
+pooled HTTP/2 connection per origin; it needs the optional ``h2`` package
+(``pip install httpx[http2]``). Either can be wrapped in a
+ConditionalTransport, which revalidates previously fetched pages with their
+``ETag`` / ``Last-Modified`` validators and serves the stored copy when the
+server answers 304 Not Modified. Asyncio callers use get_async, which
+makes the same request without blocking the event loop.
+"""
+
+import os
+import sys
+import abc
+import asyncio
+import importlib.util
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Mapping, Optional
+
+# Add backend directory to path
+_backend_dir = Path(__file__).parent
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+import requests
+from loguru import logger
+
+from cache import ResponseCache
+from proxy_pool import ProxyPool
+from rate_limiter import detect_throttle
+
+
+# HTTP/2 needs the h2 package on top of httpx
+HTTP2_AVAILABLE = (
+    importlib.util.find_spec("httpx") is not None and importlib.util.find_spec("h2") is not None
+)
+
+# Transports selectable with HTTP_TRANSPORT ("auto" picks http2 when available)
+TRANSPORTS = ("auto", "requests", "http2")
+
+# Response cache namespace holding revalidatable pages
+HTTP_CACHE_NAMESPACE = "http"
+
+# Connection-specific headers, which HTTP/2 forbids
+HOP_BY_HOP_HEADERS = ("connection", "keep-alive", "transfer-encoding", "upgrade")
+
+
+class PageResponse:
+    """
+    A streamed page response, independent of the HTTP client that fetched it.
+
+    Offers the parts of requests.Response that page fetchers use.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        url: str,
+        chunks: Callable[[int], Iterator[bytes]],
+        close: Optional[Callable[[], None]] = None,
+        from_cache: bool = False,
+    ):
+        """
+        Initialize the response.
+
+        Args:
+            status_code: HTTP status
+            headers: Response headers (case-insensitive mapping)
+            url: Final URL (after redirects)
+            chunks: Function taking a chunk size and iterating over the body
+            close: Function releasing the connection
+            from_cache: Whether the body is a stored copy revalidated with a 304
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.url = str(url)
+        self.from_cache = from_cache
+        self._chunks = chunks
+        self._close = close
+
+    def iter_content(self, chunk_size: int = 16 * 1024) -> Iterator[bytes]:
+        """Iterate over the body in chunks."""
+        return self._chunks(chunk_size)
+
+    def raise_for_status(self):
+        """Raise requests.HTTPError for a 4xx or 5xx status."""
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+    def close(self):
+        """Release the connection, whether or not the body was read."""
+        if self._close is not None:
+            self._close()
+
+
+class AsyncPageResponse:
+    """
+    A PageResponse read from the event loop.
+
+    The body is read chunk by chunk in worker threads, so a slow connection
+    never blocks the loop.
+    """
+
+    def __init__(self, response: PageResponse):
+        """
+        Initialize the response.
+
+        Args:
+            response: Response fetched by a synchronous transport
+        """
+        self.response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = response.url
+        self.from_cache = response.from_cache
+
+    async def iter_content(self, chunk_size: int = 16 * 1024) -> AsyncIterator[bytes]:
+        """Iterate over the body in chunks."""
+        chunks = self.response.iter_content(chunk_size)
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    def raise_for_status(self):
+        """Raise requests.HTTPError for a 4xx or 5xx status."""
+        self.response.raise_for_status()
+
+    async def close(self):
+        """Release the connection, whether or not the body was read."""
+        await asyncio.to_thread(self.response.close)
+
+
+class Transport(abc.ABC):
+    """
+    Fetches pages as streamed PageResponses.
+    """
+
+    @abc.abstractmethod
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+        endpoint: str = "profile",
+    ) -> PageResponse:
+        """
+        Fetch a page.
+
+        Args:
+            url: Page URL
+            headers: Extra request headers
+            timeout: Seconds to wait for the server
+            endpoint: Endpoint whose rate budget the request draws from
+
+        Returns:
+            The response, with the body not yet read
+
+        Raises:
+            requests.ConnectionError: If the server could not be reached
+            requests.Timeout: If the server did not answer in time
+        """
+
+    async def get_async(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+        endpoint: str = "profile",
+    ) -> AsyncPageResponse:
+        """
+        Fetch a page without blocking the event loop.
+
+        The request is made by get in a worker thread, so it goes through
+        the same proxies, revalidation and response hooks.
+
+        Args:
+            url: Page URL
+            headers: Extra request headers
+            timeout: Seconds to wait for the server
+            endpoint: Endpoint whose rate budget the request draws from
+
+        Returns:
+            The response, with the body not yet read
+
+        Raises:
+            requests.ConnectionError: If the server could not be reached
+            requests.Timeout: If the server did not answer in time
+        """
+        fetch = asyncio.ensure_future(asyncio.to_thread(self.get, url, headers, timeout, endpoint))
+        try:
+            response = await asyncio.shield(fetch)
+        except asyncio.CancelledError:
+            # The thread cannot be stopped; release its response once it arrives
+            fetch.add_done_callback(lambda done: done.cancelled() or done.exception() or done.result().close())
+            raise
+        return AsyncPageResponse(response)
+
+    def close(self):
+        """Close the transport's connections."""
+
+
+class RequestsTransport(Transport):
+    """
+    Fetches pages with a requests session, over HTTP/1.1.
+    """
+
+    def __init__(self, session: requests.Session, proxy_pool: Optional[ProxyPool] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            session: Session the requests are made with
+            proxy_pool: Egress proxies to spread the requests over
+        """
+        self.session = session
+        self.proxy_pool = proxy_pool
+
+    def get(self, url, headers=None, timeout=30.0, endpoint="profile") -> PageResponse:
+        if self.proxy_pool is not None:
+            response = self.proxy_pool.request(
+                self.session, "GET", url, endpoint, headers=headers, timeout=timeout, stream=True
+            )
+        else:
+            response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+        return PageResponse(response.status_code, response.headers, response.url, response.iter_content, response.close)
+
+
+class HttpxTransport(Transport):
+    """
+    Fetches pages with httpx, multiplexed over pooled HTTP/2 connections.
+
+    Concurrent requests to the same origin share one connection. With a
+    proxy pool, each proxy gets its own client, and so its own connection.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Mapping[str, str]] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        hooks: Iterable[Callable[[Any], None]] = (),
+        http2: bool = True,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            headers: Headers sent with every request
+            proxy_pool: Egress proxies to spread the requests over
+            hooks: Functions called with every response (as requests hooks are)
+            http2: Negotiate HTTP/2 (needs the h2 package)
+        """
+        import httpx
+
+        self._httpx = httpx
+        self.headers = {
+            name: value for name, value in (headers or {}).items() if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+        self.proxy_pool = proxy_pool
+        self.hooks = list(hooks)
+        self.http2 = http2
+        self._clients: Dict[Optional[str], Any] = {}
+
+    def _client(self, proxy_url: Optional[str] = None):
+        """Get the client for an egress proxy (or direct), creating it on first use."""
+        client = self._clients.get(proxy_url)
+        if client is None:
+            client = self._clients[proxy_url] = self._httpx.Client(
+                http2=self.http2,
+                headers=self.headers,
+                proxy=proxy_url,
+                follow_redirects=True,
+                event_hooks={"response": self.hooks},
+            )
+        return client
+
+    def _send(self, url: str, headers: Optional[Dict[str, str]], timeout: float, proxy_url: Optional[str] = None):
+        """Send a request, translating httpx network errors to requests ones."""
+        client = self._client(proxy_url)
+        try:
+            return client.send(client.build_request("GET", url, headers=headers, timeout=timeout), stream=True)
+        except self._httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def get(self, url, headers=None, timeout=30.0, endpoint="profile") -> PageResponse:
+        if self.proxy_pool is not None:
+            response = self.proxy_pool.call(endpoint, lambda proxy: self._send(url, headers, timeout, proxy.url), self)
+        else:
+            response = self._send(url, headers, timeout)
+        return PageResponse(
+            response.status_code, response.headers, str(response.url),
+            lambda chunk_size: response.iter_bytes(chunk_size), response.close,
+        )
+
+    def close(self):
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+
+
+def page_validators(headers: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Get the revalidation validators of a response.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        ``etag`` and/or ``last_modified``, if the response carried them
+    """
+    validators = {}
+    if headers.get("ETag"):
+        validators["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["last_modified"] = headers["Last-Modified"]
+    return validators
+
+
+class Revalidator:
+    """
+    Stores revalidatable pages in the response cache.
+
+    A page is stored with its validators, keyed by URL. The next fetch of
+    the URL sends them as ``If-None-Match`` / ``If-Modified-Since``; a 304
+    answer means the stored body is still current.
+    """
+
+    def __init__(self, cache: ResponseCache):
+        """
+        Initialize the revalidator.
+
+        Args:
+            cache: Response cache holding the pages
+        """
+        self.cache = cache
+        self.revalidated = 0
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the stored page of a URL, if any."""
+        return self.cache.get(HTTP_CACHE_NAMESPACE, url)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build the conditional request headers for a stored page.
+
+        Args:
+            entry: Stored page (see lookup), or None
+
+        Returns:
+            ``If-None-Match`` / ``If-Modified-Since`` headers
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, validators: Dict[str, str], final_url: str, body: bytes):
+        """
+        Store a page and its validators.
+
+        Args:
+            url: Requested URL
+            validators: Validators of the response (see page_validators)
+            final_url: Final URL of the response (after redirects)
+            body: Complete page content
+        """
+        self.cache.set(HTTP_CACHE_NAMESPACE, url, {**validators, "url": final_url, "body": body.decode("latin-1")})
+
+    def not_modified(self, url: str, entry: Dict[str, Any]) -> bytes:
+        """
+        Record a 304 answer for a stored page and get its body.
+
+        The entry is stored again, so it lives for another cache TTL.
+
+        Args:
+            url: Requested URL
+            entry: Stored page (see lookup)
+
+        Returns:
+            The stored page content
+        """
+        self.revalidated += 1
+        self.cache.set(HTTP_CACHE_NAMESPACE, url, entry)
+        logger.debug(f"Page unchanged, using stored copy: {url}")
+        return entry["body"].encode("latin-1")
+
+
+class ConditionalTransport(Transport):
+    """
+    Revalidates previously fetched pages instead of downloading them again.
+
+    A response carrying validators is stored once the caller has read it to
+    the end. A caller that stops reading early keeps its early stop: the
+    rest of the page is not downloaded, and the page is not stored. Pages
+    without validators are passed through untouched.
+    """
+
+    def __init__(self, transport: Transport, revalidator: Revalidator):
+        """
+        Initialize the transport.
+
+        Args:
+            transport: Transport making the requests
+            revalidator: Store of revalidatable pages
+        """
+        self.transport = transport
+        self.revalidator = revalidator
+
+    def get(self, url, headers=None, timeout=30.0, endpoint="profile") -> PageResponse:
+        entry = self.revalidator.lookup(url)
+        request_headers = {**(headers or {}), **self.revalidator.conditional_headers(entry)}
+        response = self.transport.get(url, request_headers, timeout, endpoint)
+
+        if entry is not None and response.status_code == 304:
+            response.close()
+            body = self.revalidator.not_modified(url, entry)
+            return PageResponse(
+                200, response.headers, entry["url"],
+                lambda chunk_size: (body[i:i + chunk_size] for i in range(0, len(body), chunk_size)),
+                from_cache=True,
+            )
+
+        validators = page_validators(response.headers)
+        if response.status_code != 200 or not validators or detect_throttle(200, {}, response.url):
+            return response
+        return self._recording(url, response, validators)
+
+    def _recording(self, url: str, response: PageResponse, validators: Dict[str, str]) -> PageResponse:
+        """Wrap a response so that its body is stored if it was read to the end."""
+        body = bytearray()
+        complete = []
+
+        def chunks(chunk_size: int) -> Iterator[bytes]:
+            for chunk in response.iter_content(chunk_size):
+                body.extend(chunk)
+                yield chunk
+            complete.append(True)
+
+        def close():
+            try:
+                if complete:
+                    self.revalidator.store(url, validators, response.url, bytes(body))
+            except Exception as e:
+                logger.debug(f"Could not store page for revalidation: {e}")
+            finally:
+                response.close()
+
+        return PageResponse(response.status_code, response.headers, response.url, chunks, close)
+
+    def close(self):
+        self.transport.close()
+
+
+def transport_from_env(
+    session: requests.Session,
+    proxy_pool: Optional[ProxyPool] = None,
+    revalidator: Optional[Revalidator] = None,
+    hooks: Iterable[Callable[[Any], None]] = (),
+) -> Transport:
+    """
+    Build the page transport from environment variables.
+
+    ``HTTP_TRANSPORT`` is ``requests``, ``http2`` or ``auto`` (the default:
+    http2 if the h2 package is installed, else requests).
+
+    Args:
+        session: Session used by the requests transport, whose headers the
+            http2 transport sends as well
+        proxy_pool: Egress proxies to spread the requests over
+        revalidator: Store of revalidatable pages, or None to always
+            download pages in full
+        hooks: Functions called with every response of the http2 transport
+
+    Returns:
+        Configured Transport
+    """
+    name = os.getenv("HTTP_TRANSPORT", "auto")
+    if name not in TRANSPORTS:
+        raise ValueError(f"HTTP_TRANSPORT must be one of {', '.join(TRANSPORTS)}")
+    if name == "http2" and not HTTP2_AVAILABLE:
+        logger.warning("HTTP/2 needs the h2 package (pip install httpx[http2]); using requests")
+
+    if name != "requests" and HTTP2_AVAILABLE:
+        transport: Transport = HttpxTransport(session.headers, proxy_pool=proxy_pool, hooks=hooks)
+    else:
+        transport = RequestsTransport(session, proxy_pool=proxy_pool)
+
+    if revalidator is not None:
+        transport = ConditionalTransport(transport, revalidator)
+    return transport
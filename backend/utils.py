@@ -3,11 +3,13 @@ Utility functions for the LinkedIn scraper.
 """
 
 import os
-import time
-import random
-from typing import Optional, Dict, Any
+import json
+import base64
+import hashlib
+from typing import Optional, Dict, Any, List, Sequence
 from datetime import datetime
-from functools import wraps
+from pathlib import Path
+
 from loguru import logger
 from fake_useragent import UserAgent
 
@@ -43,30 +45,18 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     logger.info(f"Logging initialized at {log_level} level")
 
 
-def rate_limit(delay: float = 2.0):
+def get_data_dir() -> Path:
     """
-    Decorator to add rate limiting to functions.
+    Get the directory for state shared between scraper processes.
     
-    Args:
-        delay: Minimum seconds to wait between calls
+    Uses LINKEDIN_SCRAPER_DATA_DIR, defaulting to ~/.cache/linkedin-scraper.
+    
+    Returns:
+        Path to the (created) data directory
     """
-    def decorator(func):
-        last_called = [0.0]
-        
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_called[0]
-            if elapsed < delay:
-                sleep_time = delay - elapsed + random.uniform(0, 0.5)
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-            
-            result = func(*args, **kwargs)
-            last_called[0] = time.time()
-            return result
-        
-        return wrapper
-    return decorator
+    data_dir = Path(os.getenv("LINKEDIN_SCRAPER_DATA_DIR", Path.home() / ".cache" / "linkedin-scraper"))
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
 
 
 def get_random_user_agent() -> str:
@@ -173,31 +163,6 @@ def parse_experience_duration(duration_text: str) -> Dict[str, Any]:
     return result
 
 
-def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
-    """
-    Decorator to retry a function on failure.
-    
-    Args:
-        max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
-    """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        logger.error(f"Function {func.__name__} failed after {max_retries} attempts: {e}")
-                        raise
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
-                    time.sleep(delay * (attempt + 1))  # Exponential backoff
-            
-        return wrapper
-    return decorator
-
-
 def format_timestamp(timestamp: Optional[datetime] = None) -> str:
     """
     Format a timestamp for logging or display.
@@ -235,6 +200,77 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
+def format_epoch_dates(timestamps: Sequence[Any], fmt: str = "%Y-%m-%d") -> List[Optional[str]]:
+    """
+    Format a batch of epoch-millisecond timestamps as local dates.
+    
+    The numeric timestamps are converted in one vectorized pass; anything
+    else (missing values, already formatted strings) comes back as None.
+    
+    Args:
+        timestamps: Epoch timestamps in milliseconds
+        fmt: strftime format of the dates
+        
+    Returns:
+        Formatted date, or None, for each timestamp
+    """
+    dates: List[Optional[str]] = [None] * len(timestamps)
+    positions = [
+        i for i, value in enumerate(timestamps)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value
+    ]
+    if positions:
+        # pandas is slow to import; only pay for it once there are dates to convert
+        import pandas as pd
+        from dateutil.tz import tzlocal
+        
+        converted = pd.to_datetime([timestamps[i] for i in positions], unit="ms", utc=True)
+        for i, date in zip(positions, converted.tz_convert(tzlocal()).strftime(fmt)):
+            dates[i] = date
+    return dates
+
+
+def encode_cursor(offset: int, scope: Any) -> str:
+    """
+    Build an opaque pagination cursor.
+    
+    Args:
+        offset: Position of the next result
+        scope: Query the cursor belongs to (any value with a stable repr)
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {"offset": offset, "scope": hashlib.sha1(repr(scope).encode()).hexdigest()[:12]}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: Any) -> int:
+    """
+    Read the offset from a pagination cursor.
+    
+    Args:
+        cursor: Cursor from encode_cursor
+        scope: Query the cursor is used with
+        
+    Returns:
+        Position of the next result
+        
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset = int(payload["offset"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+    
+    if payload.get("scope") != hashlib.sha1(repr(scope).encode()).hexdigest()[:12]:
+        raise ValueError("Cursor belongs to a different query")
+    return offset
+
+
 def validate_config(config: Dict[str, Any], required_keys: list) -> bool:
     """
     Validate that all required configuration keys are present.
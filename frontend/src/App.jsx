@@ -37,8 +37,20 @@ function App() {
         
         if (data.type === 'session_id') {
           setSessionId(data.session_id)
+        } else if (data.type === 'progress') {
+          // Partial results of a running tool, replaced by the final answer
+          setMessages(prev => {
+            const partial = prev.find(message => message.type === 'progress')
+            const items = [...(partial ? partial.content : []), ...data.items]
+            return [...prev.filter(message => message.type !== 'progress'), {
+              id: partial ? partial.id : Date.now(),
+              type: 'progress',
+              content: items,
+              timestamp: new Date()
+            }]
+          })
         } else if (data.type === 'response') {
-          setMessages(prev => [...prev, {
+          setMessages(prev => [...prev.filter(message => message.type !== 'progress'), {
             id: Date.now(),
             type: 'assistant',
             content: data.content,
@@ -46,7 +58,7 @@ function App() {
           }])
           setIsLoading(false)
         } else if (data.type === 'error') {
-          setMessages(prev => [...prev, {
+          setMessages(prev => [...prev.filter(message => message.type !== 'progress'), {
             id: Date.now(),
             type: 'error',
             content: data.message || 'An error occurred',
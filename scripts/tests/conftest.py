@@ -0,0 +1,19 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+
+import pytest
+
+
+# Keep the MCP server's log file out of the working tree when tests import it
+os.environ.setdefault("LOG_FILE", "")
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """Keep the shared rate-limit store and cache of each test in a temporary directory."""
+    monkeypatch.setenv("LINKEDIN_SCRAPER_DATA_DIR", str(tmp_path / "data"))
+    # Fetch pages through the scraper's requests session, which tests may mock
+    monkeypatch.setenv("HTTP_TRANSPORT", "requests")
@@ -0,0 +1,158 @@
+"""
+Unit tests for the multi-account pool.
+"""
+
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from account_pool import Account, AccountPool, load_accounts
+import cancellation
+from errors import ThrottledError, ToolCancelledError
+from rate_limiter import RateLimiter
+from scraper import LinkedInScraper
+
+
+def make_client(email, *args, **kwargs):
+    """A fake API client whose get_profile reports which account served it."""
+    client = MagicMock(name=email)
+    client.client.session.hooks = {"response": []}
+    client.get_profile.side_effect = lambda profile_id: {"account": email, "id": profile_id}
+    return client
+
+
+def make_pool(count, rate=100.0, burst=10, **kwargs):
+    accounts = [
+        Account(f"user{i}@example.com", "password123", RateLimiter({"profile": (rate, burst)}))
+        for i in range(count)
+    ]
+    pool = AccountPool(accounts, make_client, **kwargs)
+    pool.start()
+    assert pool.wait_ready(5)
+    for account in accounts:
+        account.login.result(5)
+    return pool
+
+
+def respond(client, status_code, url="https://www.linkedin.com/voyager/api/identity/profiles", headers=None):
+    """Make the client's next call run its response hooks with the given response."""
+    response = SimpleNamespace(status_code=status_code, headers=headers or {}, url=url)
+
+    def get_profile(profile_id):
+        for hook in client.client.session.hooks["response"]:
+            hook(response)
+        return {}
+
+    client.get_profile.side_effect = get_profile
+
+
+def test_load_accounts(tmp_path):
+    path = tmp_path / "accounts.json"
+    path.write_text(json.dumps([{"email": "a@example.com", "password": "x"}]))
+    assert load_accounts(str(path)) == [("a@example.com", "x")]
+
+    path.write_text(json.dumps([{"email": "a@example.com"}]))
+    with pytest.raises(ValueError):
+        load_accounts(str(path))
+
+
+def test_routes_to_least_loaded_account():
+    pool = make_pool(3)
+    pool.accounts[0].in_flight = 2
+    pool.accounts[1].in_flight = 1
+    assert pool.get_profile("jane")["account"] == "user2@example.com"
+
+
+def test_skips_accounts_without_budget():
+    pool = make_pool(2, rate=0.01, burst=1)
+    served = {pool.get_profile("jane")["account"] for _ in range(2)}
+    assert served == {"user0@example.com", "user1@example.com"}
+
+
+def test_cancelled_checkout_is_not_counted():
+    pool = make_pool(1, rate=0.01, burst=1)
+    pool.get_profile("jane")
+    cancel = threading.Event()
+    cancel.set()
+    with cancellation.cancel_scope(cancel), pytest.raises(ToolCancelledError):
+        pool.get_profile("jane")
+    assert pool.accounts[0].in_flight == 0 and pool.accounts[0].requests == 1
+
+
+def test_throttled_account_cools_down_and_call_moves_on():
+    pool = make_pool(2)
+    throttled = pool.accounts[0]
+    respond(throttled.client, 429)
+
+    result = pool.get_profile("jane")
+    assert result["account"] == "user1@example.com"
+    assert throttled.cooldown_until > time.monotonic()
+    assert pool.stats()[0]["state"] == "cooling_down"
+    for _ in range(3):
+        assert pool.get_profile("jane")["account"] == "user1@example.com"
+
+
+def test_repeated_failures_cool_account_down():
+    pool = make_pool(1, failure_threshold=2)
+    pool.accounts[0].client.get_profile.side_effect = RuntimeError("boom")
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            pool.get_profile("jane")
+
+    with pytest.raises(ThrottledError) as excinfo:
+        pool.get_profile("jane")
+    assert excinfo.value.retry_after > 0
+
+
+def test_rejected_session_logs_in_again():
+    pool = make_pool(2)
+    rejected = pool.accounts[0]
+    old_client = rejected.client
+    respond(old_client, 200, url="https://www.linkedin.com/uas/login")
+
+    assert pool.get_profile("jane")["account"] == "user1@example.com"
+    assert rejected.login.result(5)
+    assert rejected.client is not None and rejected.client is not old_client
+
+
+def test_throughput_scales_with_accounts():
+    def run(count):
+        pool = make_pool(count, rate=20.0, burst=1)
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(pool.get_profile, ["jane"] * 21))
+        return time.monotonic() - started
+
+    # 20 refills at 20/s per account: ~1s for one account, ~0.33s for three
+    one, three = run(1), run(3)
+    assert three < one / 2
+
+
+@patch("scraper.Linkedin", side_effect=make_client)
+def test_scraper_uses_pool(mock_linkedin, tmp_path, monkeypatch):
+    path = tmp_path / "accounts.json"
+    path.write_text(json.dumps([
+        {"email": "a@example.com", "password": "x"},
+        {"email": "b@example.com", "password": "y"},
+    ]))
+    monkeypatch.setenv("LINKEDIN_ACCOUNTS_FILE", str(path))
+    monkeypatch.setenv("LINKEDIN_SESSION_DIR", "off")
+    monkeypatch.setenv("RATE_LIMIT_STORE", "memory")
+
+    scraper = LinkedInScraper()
+    assert scraper.api_client is scraper.account_pool
+    assert scraper.rate_limiter.limits["profile"] == tuple(2 * value for value in RateLimiter.from_env().limits["profile"])
+
+    result = scraper.scrape_profile("https://linkedin.com/in/jane", cache_policy="bypass")
+    assert result
+    assert mock_linkedin.call_count == 2
@@ -0,0 +1,86 @@
+"""
+Unit tests for the asyncio LinkedIn scraper.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from rate_limiter import RateLimiter
+from scraper import LinkedInScraper
+from async_scraper import AsyncLinkedInScraper
+
+
+@pytest.fixture
+def async_scraper():
+    """Fixture to create an async scraper backed by a mocked API client."""
+    scraper = LinkedInScraper()
+    scraper.api_client = MagicMock()
+    return AsyncLinkedInScraper(scraper=scraper)
+
+
+def test_scrape_profile_uses_api_client(async_scraper):
+    """Profiles are fetched through the API client off the event loop."""
+    async_scraper.api_client.get_profile.return_value = {
+        "public_id": "john-doe",
+        "firstName": "John",
+        "lastName": "Doe",
+    }
+
+    result = asyncio.run(async_scraper.scrape_profile("https://linkedin.com/in/john-doe"))
+
+    async_scraper.api_client.get_profile.assert_called_once_with("john-doe")
+    assert result["first_name"] == "John"
+    assert result["method"] == "linkedin_api"
+
+
+def test_search_people(async_scraper):
+    """People search results are formatted like the sync scraper."""
+    async_scraper.api_client.search_people.return_value = [
+        {"public_id": "jane-smith", "firstName": "Jane", "lastName": "Smith"}
+    ]
+
+    results = asyncio.run(async_scraper.search_people(keywords="Data Scientist"))
+
+    assert results[0]["name"] == "Jane Smith"
+
+
+def test_close_without_requests(async_scraper):
+    """Closing before any web request does not raise."""
+    asyncio.run(async_scraper.close())
+
+
+def test_scrape_profiles_dedupes_and_reports_errors():
+    """Bulk scraping fetches each profile once and reports per-item failures."""
+    scraper = LinkedInScraper(rate_limiter=RateLimiter({"profile": (100.0, 10)}))
+    scraper.api_client = MagicMock()
+    scraper.api_client.get_profile.side_effect = lambda profile_id: (
+        {"public_id": profile_id, "firstName": profile_id.title()} if profile_id != "ghost" else None
+    )
+    async_scraper = AsyncLinkedInScraper(scraper=scraper)
+    async_scraper._scrape_profile_web = AsyncMock(side_effect=ValueError("Profile not found"))
+
+    async def collect():
+        urls = [
+            "https://linkedin.com/in/john",
+            "linkedin.com/in/John/?trk=x",
+            "https://linkedin.com/in/jane",
+            "https://linkedin.com/in/ghost",
+            "https://example.com/nobody",
+        ]
+        return [result async for result in async_scraper.scrape_profiles(urls, concurrency=2, cache_policy="bypass")]
+
+    results = asyncio.run(collect())
+    by_id = {result["profile_id"]: result for result in results}
+
+    assert len(results) == 4
+    assert scraper.api_client.get_profile.call_count == 3
+    assert by_id["john"]["success"] and by_id["jane"]["profile"]["first_name"] == "Jane"
+    assert not by_id["ghost"]["success"] and "not found" in by_id["ghost"]["error"]
+    assert not by_id[None]["success"]
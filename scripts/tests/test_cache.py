@@ -0,0 +1,160 @@
+"""
+Unit tests for the persistent response cache and the search-result cache.
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from cache import ResponseCache, SearchResultCache
+from scraper import LinkedInScraper
+from singleflight import flight_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A cache in a temporary file."""
+    return ResponseCache(str(tmp_path / "cache.sqlite3"), max_entries=3)
+
+
+class TestResponseCache:
+    """Test ResponseCache."""
+
+    def test_round_trip(self, cache):
+        cache.set("profile", "john-doe", {"first_name": "John", "skills": ["Python"]})
+        assert cache.get("profile", "john-doe") == {"first_name": "John", "skills": ["Python"]}
+        assert cache.get("company", "john-doe") is None
+
+    def test_expired_entry_is_a_miss(self, cache):
+        cache.set("profile", "john-doe", {"first_name": "John"}, ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("profile", "john-doe") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, cache):
+        for key in ("a", "b", "c"):
+            cache.set("profile", key, {"key": key})
+            time.sleep(0.001)
+        cache.get("profile", "a")  # "b" is now least recently used
+        cache.set("profile", "d", {"key": "d"})
+
+        assert len(cache) == 3
+        assert cache.get("profile", "b") is None
+        assert cache.get("profile", "a") == {"key": "a"}
+
+    def test_shared_between_instances(self, cache):
+        cache.set("company", "google", {"name": "Google"})
+        other = ResponseCache(cache.path)
+        assert other.get("company", "google") == {"name": "Google"}
+
+    def test_from_env_off(self, monkeypatch):
+        monkeypatch.setenv("CACHE_PATH", "off")
+        assert ResponseCache.from_env() is None
+
+
+class TestSearchResultCache:
+    """Test SearchResultCache freshness and eviction."""
+
+    def test_fresh_stale_and_expired(self):
+        cache = SearchResultCache(ttl=0.02, stale_ttl=0.05)
+        assert cache.get("q") == (None, SearchResultCache.MISS)
+        cache.set("q", ["job"])
+        assert cache.get("q") == (["job"], SearchResultCache.FRESH)
+        time.sleep(0.03)
+        assert cache.get("q") == (["job"], SearchResultCache.STALE)
+        time.sleep(0.03)
+        assert cache.get("q") == (None, SearchResultCache.MISS)
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 1, 2)
+        assert stats["size"] == 0
+
+    def test_lru_eviction(self):
+        cache = SearchResultCache(max_entries=2)
+        cache.set("a", [1])
+        cache.set("b", [2])
+        cache.get("a")
+        cache.set("c", [3])
+        assert cache.get("b")[1] == SearchResultCache.MISS
+        assert cache.get("a")[0] == [1]
+
+    def test_one_refresh_per_key(self):
+        cache = SearchResultCache()
+        assert cache.begin_refresh("q")
+        assert not cache.begin_refresh("q")
+        cache.end_refresh("q")
+        assert cache.begin_refresh("q")
+
+    def test_from_env_disabled(self, monkeypatch):
+        monkeypatch.setenv("SEARCH_CACHE_SIZE", "0")
+        assert SearchResultCache.from_env() is None
+
+
+class TestScraperCaching:
+    """Test cache policies on the scraper."""
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = LinkedInScraper()
+        scraper.api_client = MagicMock()
+        scraper.api_client.get_profile.return_value = {"public_id": "john-doe", "firstName": "John"}
+        scraper.api_client.get_company.return_value = {"universalName": "google", "name": "Google"}
+        scraper.api_client.search_people.return_value = [{"public_id": "john-doe", "firstName": "John"}]
+        return scraper
+
+    def test_use_serves_cached_profile(self, scraper):
+        first = scraper.scrape_profile("https://linkedin.com/in/john-doe")
+        second = scraper.scrape_profile("linkedin.com/in/John-Doe/?trk=x")
+        assert second == first and type(second) is type(first)
+        assert scraper.api_client.get_profile.call_count == 1
+
+    def test_refresh_and_bypass_refetch(self, scraper):
+        scraper.scrape_profile("https://linkedin.com/in/john-doe")
+        scraper.scrape_profile("https://linkedin.com/in/john-doe", cache_policy="refresh")
+        scraper.scrape_profile("https://linkedin.com/in/john-doe", cache_policy="bypass")
+        assert scraper.api_client.get_profile.call_count == 3
+
+    def test_company_cached_under_universal_name(self, scraper):
+        first = scraper.get_company_info("Google")
+        second = scraper.get_company_info("google")
+        assert second == first and type(second) is type(first)
+        assert scraper.api_client.get_company.call_count == 1
+
+    def test_invalid_policy(self, scraper):
+        with pytest.raises(ValueError):
+            scraper.get_company_info("google", cache_policy="sometimes")
+
+    def test_repeated_search_served_from_cache(self, scraper):
+        first = scraper.search_people("Data Scientist", location="Berlin")
+        second = scraper.search_people("  data scientist ", location="berlin")
+        assert second == first
+        assert scraper.api_client.search_people.call_count == 1
+
+        scraper.search_people("data scientist", location="berlin", cache_policy="refresh")
+        assert scraper.api_client.search_people.call_count == 2
+
+    def test_unauthenticated_search_not_cached(self, scraper):
+        api_client, scraper.api_client = scraper.api_client, None
+        assert scraper.search_people("python") == []
+
+        scraper.api_client = api_client
+        assert scraper.search_people("python")[0]["profile_id"] == "john-doe"
+
+    def test_stale_search_refreshed_in_background(self, scraper):
+        scraper.search_cache = SearchResultCache(ttl=0, stale_ttl=60)
+        scraper.search_people("python")
+        scraper.api_client.search_people.return_value = [{"public_id": "jane-doe", "firstName": "Jane"}]
+
+        stale = scraper.search_people("python")
+        assert stale[0]["profile_id"] == "john-doe"
+        scraper._refresher.shutdown(wait=True)
+
+        cached, _ = scraper.search_cache.get(flight_key("people", keywords="python", limit=10))
+        assert cached[0]["profile_id"] == "jane-doe"
+        assert scraper.api_client.search_people.call_count == 2
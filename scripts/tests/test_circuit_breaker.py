@@ -0,0 +1,131 @@
+"""
+Unit tests for the circuit breakers.
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from linkedin_api.client import UnauthorizedException
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from errors import CircuitOpenError, ToolCancelledError
+from rate_limiter import RateLimiter
+from retry import RetryPolicy
+from scraper import LinkedInScraper
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("api/profile", failure_threshold=2, recovery_timeout=60)
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker("api/profile", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker("api/profile", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # only one probe at a time
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("api/profile", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_ignored_probe_frees_its_slot(self):
+        breaker = CircuitBreaker("api/profile", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow_request()
+        breaker.record_ignored()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+
+
+def test_registry_keys_by_backend_and_operation():
+    registry = CircuitBreakerRegistry()
+    assert registry.get("linkedin_api", "profile") is registry.get("linkedin_api", "profile")
+    assert registry.get("linkedin_api", "profile") is not registry.get("web", "profile")
+    assert registry.states() == {"linkedin_api/profile": "closed", "web/profile": "closed"}
+
+
+class TestScraperIntegration:
+    """Test routing around a broken API client."""
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = LinkedInScraper(rate_limiter=RateLimiter({"profile": (100.0, 10), "company": (100.0, 10)}))
+        scraper.api_client = MagicMock()
+        scraper.api_client.get_profile.side_effect = requests.ConnectionError("connection reset")
+        scraper.retry_policy = RetryPolicy(max_attempts=1)
+        scraper.circuit_breakers = CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=60)
+        scraper._scrape_profile_web = MagicMock(return_value={"method": "web_scraping"})
+        return scraper
+
+    def test_open_circuit_skips_api_client(self, scraper):
+        for _ in range(3):
+            result = scraper.scrape_profile("https://linkedin.com/in/john-doe", cache_policy="bypass")
+            assert result["method"] == "web_scraping"
+
+        assert scraper.api_client.get_profile.call_count == 2
+
+    def test_open_circuit_without_fallback_fails_fast(self, scraper):
+        scraper.api_client.get_company.side_effect = requests.ConnectionError("blocked")
+        for _ in range(2):
+            with pytest.raises(requests.ConnectionError):
+                scraper.get_company_info("google")
+
+        with pytest.raises(CircuitOpenError):
+            scraper.get_company_info("google")
+        assert scraper.api_client.get_company.call_count == 2
+
+    def test_auth_errors_open_circuit(self, scraper):
+        scraper.api_client.get_profile.side_effect = UnauthorizedException()
+        for _ in range(3):
+            scraper.scrape_profile("https://linkedin.com/in/john-doe", cache_policy="bypass")
+
+        assert scraper.circuit_breakers.states()["linkedin_api/profile"] == "open"
+        assert scraper.api_client.get_profile.call_count == 2
+
+    def test_caller_errors_and_cancellations_are_ignored(self, scraper):
+        errors = [
+            requests.ConnectionError("reset"),
+            ValueError("bad company identifier"),
+            ToolCancelledError("Call was cancelled"),
+        ]
+        for error in errors:
+            scraper.api_client.get_company.side_effect = error
+            with pytest.raises(type(error)):
+                scraper.get_company_info("google")
+        assert scraper.circuit_breakers.states()["linkedin_api/company"] == "closed"
+
+        # Neither reset the count of consecutive failures
+        scraper.api_client.get_company.side_effect = requests.ConnectionError("reset")
+        with pytest.raises(requests.ConnectionError):
+            scraper.get_company_info("google")
+        assert scraper.circuit_breakers.states()["linkedin_api/company"] == "open"
@@ -0,0 +1,132 @@
+"""
+Unit tests for the declarative profile extractor.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from extractors import Extractor, FieldSpec, PROFILE_EXTRACTOR, has_class
+from scraper import LinkedInScraper
+
+
+PUBLIC_PROFILE_HTML = b"""
+<html><body>
+  <section class="top-card-layout">
+    <h1 class="top-card-layout__title">  Jane
+      Smith </h1>
+    <h2 class="top-card-layout__headline">Data Scientist at Acme</h2>
+    <div class="top-card-layout__first-subline">
+      <span class="top-card__subline-item">Berlin, Germany</span>
+      <span class="top-card__subline-item">500+ connections</span>
+    </div>
+  </section>
+  <section class="summary">
+    <h2>About</h2>
+    <div class="core-section-container__content"><p>I build models.</p></div>
+  </section>
+  <ul>
+    <li class="experience-item">
+      <h3>Data Scientist</h3><h4>Acme</h4>
+      <span class="date-range">2021 - Present</span>
+      <p class="experience-item__location">Berlin</p>
+    </li>
+    <li class="experience-item"><h3>Analyst</h3><h4>Globex</h4></li>
+  </ul>
+  <ul><li class="education__list-item"><h3>TU Berlin</h3><h4>MSc, Statistics</h4></li></ul>
+</body></html>
+"""
+
+
+def test_extracts_public_profile_fields():
+    data = PROFILE_EXTRACTOR.extract_html(PUBLIC_PROFILE_HTML)
+
+    assert data["name"] == "Jane Smith"
+    assert data["headline"] == "Data Scientist at Acme"
+    assert data["location"] == "Berlin, Germany"
+    assert data["about"] == "I build models."
+    assert data["experience"] == [
+        {"title": "Data Scientist", "company": "Acme", "date_range": "2021 - Present", "location": "Berlin"},
+        {"title": "Analyst", "company": "Globex"},
+    ]
+    assert data["education"] == [{"school": "TU Berlin", "degree": "MSc, Statistics"}]
+
+
+def test_extracts_signed_in_layout():
+    html = b'<h1 class="text-heading-xlarge inline">John Doe</h1><div class="text-body-medium break-words">Engineer</div>'
+    assert PROFILE_EXTRACTOR.extract_html(html) == {"name": "John Doe", "headline": "Engineer"}
+
+
+def test_missing_fields_and_empty_page():
+    assert PROFILE_EXTRACTOR.extract_html(b"<html><body><p>Sign in</p></body></html>") == {}
+    assert PROFILE_EXTRACTOR.extract_html(b"") == {}
+
+
+def test_custom_extractor():
+    extractor = Extractor([FieldSpec("tags", f"span[{has_class('tag')}]", many=True)])
+    html = b'<span class="tag">a</span><span class="tags">x</span><span class="tag big">b</span>'
+    assert extractor.extract_html(html) == {"tags": ["a", "b"]}
+
+
+def test_scraper_builds_web_profile():
+    fields = PROFILE_EXTRACTOR.extract_html(PUBLIC_PROFILE_HTML)
+    profile = LinkedInScraper()._build_web_profile(fields, "https://www.linkedin.com/in/jane-smith")
+    assert profile["method"] == "web_scraping"
+    assert profile["profile_id"] == "jane-smith"
+    assert profile["education"][0]["school"] == "TU Berlin"
+
+
+def chunked(html: bytes, size: int, consumed: list):
+    """Yield ``html`` in chunks, recording how many were read."""
+    for start in range(0, len(html), size):
+        consumed.append(start)
+        yield html[start:start + size]
+
+
+class TestStreaming:
+    """Test extracting pages while they download."""
+
+    PAGE = PUBLIC_PROFILE_HTML.replace(b"</body>", b"<div><p>filler</p></div>" * 2000 + b"</body>")
+
+    def test_stops_reading_once_fields_found(self):
+        consumed = []
+        data = PROFILE_EXTRACTOR.extract_stream(chunked(self.PAGE, 256, consumed), ["name", "headline", "experience"])
+
+        assert data["name"] == "Jane Smith"
+        assert len(data["experience"]) == 2
+        assert len(consumed) * 256 < len(self.PAGE) // 10
+
+    def test_all_fields_match_full_parse(self):
+        consumed = []
+        assert PROFILE_EXTRACTOR.extract_stream(chunked(self.PAGE, 100, consumed)) == PROFILE_EXTRACTOR.extract_html(self.PAGE)
+        assert len(consumed) * 100 < len(self.PAGE)
+
+    def test_reads_to_the_end_when_a_field_is_missing(self):
+        consumed = []
+        html = b'<h1 class="top-card-layout__title">Jane</h1>' + b"<p>filler</p>" * 100
+        assert PROFILE_EXTRACTOR.extract_stream(chunked(html, 100, consumed)) == {"name": "Jane"}
+        assert len(consumed) * 100 >= len(html)
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError):
+            PROFILE_EXTRACTOR.stream(["salary"])
+
+    def test_scraper_closes_response_early(self):
+        consumed = []
+        response = MagicMock(status_code=200, headers={}, url="https://www.linkedin.com/in/jane-smith")
+        response.iter_content.return_value = chunked(self.PAGE, 1024, consumed)
+
+        scraper = LinkedInScraper()
+        scraper.web_profile_fields = ["name", "headline"]
+        scraper.session.get = MagicMock(return_value=response)
+        profile = scraper._scrape_profile_web("https://www.linkedin.com/in/jane-smith")
+
+        assert profile["headline"] == "Data Scientist at Acme"
+        assert scraper.session.get.call_args.kwargs["stream"] is True
+        assert len(consumed) == 1
+        response.close.assert_called_once()
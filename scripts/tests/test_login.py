@@ -0,0 +1,75 @@
+"""
+Unit tests for the background LinkedIn login.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from async_scraper import AsyncLinkedInScraper
+from scraper import LinkedInScraper
+
+
+def slow_login(release: threading.Event):
+    """A client factory that blocks until ``release`` is set."""
+    def factory(*args, **kwargs):
+        release.wait(5)
+        return MagicMock(name="api_client")
+    return factory
+
+
+@patch("scraper.Linkedin")
+def test_constructor_does_not_wait_for_login(mock_linkedin):
+    release = threading.Event()
+    mock_linkedin.side_effect = slow_login(release)
+
+    started = time.monotonic()
+    scraper = LinkedInScraper(email="jane@example.com", password="password123")
+    assert time.monotonic() - started < 1
+    assert scraper.login_pending is not None
+
+    release.set()
+    assert scraper.api_client is not None
+    assert scraper.login_pending is None
+
+
+@patch("scraper.Linkedin")
+def test_assigned_client_replaces_pending_login(mock_linkedin):
+    release = threading.Event()
+    mock_linkedin.side_effect = slow_login(release)
+    scraper = LinkedInScraper(email="jane@example.com", password="password123")
+
+    replacement = MagicMock()
+    scraper.api_client = replacement
+    release.set()
+    assert scraper.api_client is replacement
+
+
+@patch("scraper.Linkedin")
+def test_failed_login_falls_back(mock_linkedin):
+    mock_linkedin.side_effect = RuntimeError("CHALLENGE")
+    scraper = LinkedInScraper(email="jane@example.com", password="password123")
+    assert scraper.api_client is None
+
+
+@patch("scraper.Linkedin")
+def test_async_wait_keeps_event_loop_free(mock_linkedin):
+    release = threading.Event()
+    mock_linkedin.side_effect = slow_login(release)
+    async_scraper = AsyncLinkedInScraper(scraper=LinkedInScraper(email="jane@example.com", password="password123"))
+
+    async def run():
+        waiter = asyncio.ensure_future(async_scraper.wait_for_login())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()  # the loop keeps running while the login is pending
+        release.set()
+        await waiter
+        return async_scraper.api_client
+
+    assert asyncio.run(run()) is not None
@@ -0,0 +1,136 @@
+"""
+Unit tests for the pre-started MCP session pool, against a minimal stdio server.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from mcp_pool import MCPSessionPool
+
+
+ECHO_SERVER = '''
+import anyio
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+from mcp.types import TextContent, Tool
+
+app = Server("echo")
+
+@app.list_tools()
+async def list_tools():
+    return [Tool(name="echo", description="Echo the text", inputSchema={"type": "object"})]
+
+@app.call_tool()
+async def call_tool(name, arguments):
+    return [TextContent(type="text", text=arguments.get("text", ""))]
+
+async def main():
+    async with stdio_server() as (read_stream, write_stream):
+        await app.run(read_stream, write_stream, app.create_initialization_options())
+
+anyio.run(main)
+'''
+
+
+@pytest.fixture
+def server_path(tmp_path):
+    path = tmp_path / "echo_server.py"
+    path.write_text(ECHO_SERVER)
+    return str(path)
+
+
+async def wait_for(condition, timeout=20):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.05)
+
+
+def test_checkout_uses_warm_session(server_path):
+    async def run():
+        pool = MCPSessionPool(server_path, min_idle=2, max_size=4)
+        pool.start()
+        try:
+            await wait_for(lambda: pool.stats()["idle"] == 2)
+            started = time.monotonic()
+            pooled = await pool.acquire()
+            checkout = time.monotonic() - started
+            assert [tool.name for tool in pooled.tools] == ["echo"]
+            result = await pooled.session.call_tool("echo", {"text": "hi"})
+            assert result.content[0].text == "hi"
+            # The pool starts another session to stay warm
+            await wait_for(lambda: pool.stats()["idle"] == 2)
+            assert pool.stats() == {"size": 3, "idle": 2, "warming": 0, "in_use": 1}
+            await pool.release(pooled)
+            assert pool.stats()["idle"] == 3
+            return checkout
+        finally:
+            await pool.close()
+
+    assert asyncio.run(run()) < 0.5
+
+
+def test_waits_when_pool_is_full(server_path):
+    async def run():
+        pool = MCPSessionPool(server_path, min_idle=0, max_size=1)
+        try:
+            first = await pool.acquire()
+            waiter = asyncio.create_task(pool.acquire())
+            await asyncio.sleep(0.2)
+            assert not waiter.done()
+            await pool.release(first)
+            assert await asyncio.wait_for(waiter, 5) is first
+            await pool.release(first)
+        finally:
+            await pool.close()
+
+    asyncio.run(run())
+
+
+def test_sessions_are_replaced(server_path):
+    async def run():
+        pool = MCPSessionPool(server_path, min_idle=0, max_size=2, max_uses=1)
+        try:
+            first = await pool.acquire()
+            await pool.release(first)
+            assert not first.alive
+            second = await pool.acquire()
+            assert second is not first
+
+            await pool.release(second, reset=True)
+            assert not second.alive
+            assert pool.stats()["size"] == 0
+        finally:
+            await pool.close()
+
+    asyncio.run(run())
+
+
+def test_dead_idle_session_is_skipped(server_path):
+    async def run():
+        pool = MCPSessionPool(server_path, min_idle=1, max_size=2)
+        pool.start()
+        try:
+            await wait_for(lambda: pool.stats()["idle"] == 1)
+            dead = pool._idle[0]
+            dead._task.cancel()
+            await wait_for(lambda: not dead.alive)
+            pooled = await pool.acquire()
+            assert pooled is not dead and pooled.alive
+            await pool.release(pooled)
+        finally:
+            await pool.close()
+
+    asyncio.run(run())
+
+
+def test_needs_a_server():
+    with pytest.raises(ValueError):
+        MCPSessionPool()
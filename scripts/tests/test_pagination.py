@@ -0,0 +1,100 @@
+"""
+Unit tests for paginated job search.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from async_scraper import AsyncLinkedInScraper
+from rate_limiter import RateLimiter
+from scraper import LinkedInScraper, job_cursor, job_cursor_offset
+from utils import decode_cursor, encode_cursor
+
+
+TOTAL_JOBS = 60
+
+
+def fake_search_jobs(keywords=None, location_name=None, limit=-1, offset=0):
+    """Serve slices of a fixed result set like the LinkedIn API does."""
+    end = TOTAL_JOBS if limit < 0 else min(TOTAL_JOBS, offset + limit)
+    return [
+        {"entityUrn": f"urn:li:fs_normalized_jobPosting:{i}", "title": f"Job {i}", "companyName": "Acme"}
+        for i in range(offset, end)
+    ]
+
+
+@pytest.fixture
+def scraper():
+    """A scraper with a fast rate limit and a fake job index."""
+    scraper = LinkedInScraper(rate_limiter=RateLimiter({"jobs": (1000.0, 100)}))
+    scraper.api_client = MagicMock()
+    scraper.api_client.search_jobs.side_effect = fake_search_jobs
+    return scraper
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(40, ("jobs", "python"))
+    assert decode_cursor(cursor, ("jobs", "python")) == 40
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, ("jobs", "java"))
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", ("jobs", "python"))
+
+
+def test_iter_jobs_pages_lazily(scraper):
+    pages = scraper.iter_jobs("Python", page_size=25)
+    first = next(pages)
+
+    assert [job["job_id"] for job in first["jobs"]] == [str(i) for i in range(25)]
+    assert scraper.api_client.search_jobs.call_count == 1
+
+    rest = list(pages)
+    assert [len(page["jobs"]) for page in rest] == [25, 10]
+    assert rest[-1]["next_cursor"] is None
+
+
+def test_iter_jobs_resumes_from_cursor(scraper):
+    first = next(scraper.iter_jobs("Python", page_size=20))
+    resumed = list(scraper.iter_jobs("python", cursor=first["next_cursor"], page_size=20, max_results=30))
+
+    assert resumed[0]["jobs"][0]["job_id"] == "20"
+    assert sum(len(page["jobs"]) for page in resumed) == 30
+    assert resumed[-1]["next_cursor"] is not None
+
+
+def test_search_jobs_continues_with_job_cursor(scraper):
+    jobs = scraper.search_jobs("Python", limit=10)
+    page = next(scraper.iter_jobs("Python", cursor=job_cursor(len(jobs), "Python")))
+    assert page["jobs"][0]["job_id"] == "10"
+
+
+def test_iter_jobs_caches_pages(scraper):
+    list(scraper.iter_jobs("Python", page_size=25, max_results=50))
+    list(scraper.iter_jobs("python", page_size=25, max_results=50))
+    assert scraper.api_client.search_jobs.call_count == 2
+
+    list(scraper.iter_jobs("Python", page_size=25, max_results=50, cache_policy="refresh"))
+    assert scraper.api_client.search_jobs.call_count == 4
+
+
+def test_job_cursor_offset():
+    cursor = job_cursor(10, "Python", location="Berlin")
+    assert job_cursor_offset(cursor, "python", location="Berlin") == 10
+    with pytest.raises(ValueError):
+        job_cursor_offset(cursor, "Python")
+
+
+def test_async_iter_jobs(scraper):
+    async def collect():
+        async_scraper = AsyncLinkedInScraper(scraper=scraper)
+        return [page async for page in async_scraper.iter_jobs("Python", page_size=49)]
+
+    pages = asyncio.run(collect())
+    assert [len(page["jobs"]) for page in pages] == [49, 11]
@@ -0,0 +1,181 @@
+"""
+Unit tests for the token-bucket rate limiter.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from rate_limiter import (
+    TokenBucket,
+    RateLimiter,
+    AdaptiveRateController,
+    detect_throttle,
+    parse_retry_after,
+)
+
+
+class TestTokenBucket:
+    """Test TokenBucket."""
+
+    def test_burst_is_available_immediately(self):
+        """A full bucket serves its whole burst without waiting."""
+        bucket = TokenBucket(rate=1.0, burst=3)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_try_acquire_when_empty(self):
+        """try_acquire fails instead of borrowing future tokens."""
+        bucket = TokenBucket(rate=1.0, burst=1)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+    def test_waits_for_refill(self):
+        """An empty bucket makes the caller wait for the next token."""
+        bucket = TokenBucket(rate=20.0, burst=1)
+        bucket.acquire()
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_concurrent_async_callers_are_queued(self):
+        """Concurrent coroutines each reserve a distinct future token."""
+        bucket = TokenBucket(rate=20.0, burst=1)
+
+        async def run():
+            return await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+
+        waits = sorted(asyncio.run(run()))
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(0.05, abs=0.01)
+        assert waits[2] == pytest.approx(0.10, abs=0.01)
+
+    def test_invalid_rate(self):
+        """A non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter:
+    """Test RateLimiter."""
+
+    def test_endpoints_have_separate_buckets(self):
+        """Draining one endpoint does not affect another."""
+        limiter = RateLimiter({"profile": (0.01, 1), "jobs": (0.01, 1)})
+        limiter.acquire("profile")
+        assert not limiter.bucket("profile").try_acquire()
+        assert limiter.bucket("jobs").try_acquire()
+
+    def test_from_env(self, monkeypatch):
+        """Rates and bursts can be overridden per endpoint."""
+        monkeypatch.setenv("RATE_LIMIT_JOBS_RATE", "4")
+        monkeypatch.setenv("RATE_LIMIT_JOBS_BURST", "10")
+        limiter = RateLimiter.from_env()
+        assert limiter.limits["jobs"] == (4.0, 10)
+
+    def test_shared_store_budget(self, tmp_path):
+        """Limiters on the same store (e.g. separate processes) share one budget."""
+        store = str(tmp_path / "limits.sqlite3")
+        first = RateLimiter({"profile": (0.01, 2)}, store=store)
+        second = RateLimiter({"profile": (0.01, 2)}, store=store)
+
+        assert first.bucket("profile").try_acquire()
+        assert second.bucket("profile").try_acquire()
+        assert not first.bucket("profile").try_acquire()
+        assert not second.bucket("profile").try_acquire()
+
+    def test_shared_store_is_not_used_on_event_loop(self, tmp_path):
+        limiter = RateLimiter({"profile": (100.0, 2)}, store=str(tmp_path / "limits.sqlite3"))
+        store = limiter.bucket("profile").store
+        threads = []
+        apply = store.apply
+
+        def recording_apply(*args):
+            threads.append(threading.current_thread())
+            return apply(*args)
+
+        store.apply = recording_apply
+        assert asyncio.run(limiter.acquire_async("profile")) == 0
+        assert threads and threading.current_thread() not in threads
+
+    def test_memory_store_from_env(self, monkeypatch):
+        """RATE_LIMIT_STORE=memory keeps buckets in process."""
+        monkeypatch.setenv("RATE_LIMIT_STORE", "memory")
+        limiter = RateLimiter.from_env()
+        assert limiter.store is None
+        assert type(limiter.bucket("jobs")) is TokenBucket
+
+
+class TestAdaptiveRateController:
+    """Test AIMD rate control."""
+
+    def test_additive_increase(self):
+        """Healthy responses raise the rate step by step up to the cap."""
+        limiter = RateLimiter({"jobs": (1.0, 1)})
+        controller = AdaptiveRateController(limiter, increase=0.5, max_scale=2.0)
+        for _ in range(5):
+            controller.observe(200, {})
+        assert limiter.scale == 2.0
+        assert limiter.bucket("jobs").rate == 2.0
+
+    def test_multiplicative_decrease(self):
+        """A throttling response halves the rate."""
+        limiter = RateLimiter({"jobs": (1.0, 1)})
+        controller = AdaptiveRateController(limiter, decrease=0.5)
+        error = controller.observe(999, {})
+        assert error is not None and error.status_code == 999
+        assert limiter.scale == 0.5
+        assert controller.metrics()["rates"]["jobs"] == 0.5
+
+    def test_burst_of_throttles_counts_once(self):
+        """Concurrent throttled responses only lower the rate once."""
+        limiter = RateLimiter()
+        controller = AdaptiveRateController(limiter, decrease=0.5, decrease_interval=60)
+        controller.observe(429, {})
+        controller.observe(429, {})
+        assert limiter.scale == 0.5
+        assert controller.throttles == 2
+
+    def test_scale_is_shared_through_store(self, tmp_path):
+        """A decrease in one process slows the shared buckets of every process."""
+        store = str(tmp_path / "limits.sqlite3")
+        first = RateLimiter({"jobs": (10.0, 1)}, store=store)
+        second = RateLimiter({"jobs": (10.0, 1)}, store=store)
+        AdaptiveRateController(first, decrease=0.1).observe(429, {})
+        assert second.scale == pytest.approx(0.1)
+
+        # The other process's successes build on the lowered scale
+        AdaptiveRateController(second, increase=0.1).observe(200, {})
+        assert first.scale == pytest.approx(0.2)
+
+        # Its bucket refills at the shared rate: 2 tokens/s, not 10
+        assert second.bucket("jobs").try_acquire()
+        time.sleep(0.2)
+        assert not second.bucket("jobs").try_acquire()
+
+    def test_retry_after_holds_back_buckets(self):
+        """Retry-After empties every bucket for that long."""
+        limiter = RateLimiter({"profile": (1.0, 3)})
+        controller = AdaptiveRateController(limiter, min_scale=1.0)
+        controller.observe(429, {"Retry-After": "5"})
+        assert not limiter.bucket("profile").try_acquire()
+        assert limiter.bucket("profile")._reserve() == pytest.approx(5.0, abs=0.1)
+
+
+def test_detect_throttle_challenge_page():
+    """A redirect to the security checkpoint counts as throttling."""
+    assert detect_throttle(200, {}, "https://www.linkedin.com/checkpoint/challenge/abc")
+    assert detect_throttle(200, {}, "https://www.linkedin.com/in/john-doe/") is None
+
+
+def test_parse_retry_after():
+    """Retry-After accepts seconds and rejects garbage."""
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,117 @@
+"""
+Unit tests for the slotted record types.
+"""
+
+import json
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from records import JobRecord, ProfileRecord, json_default, to_dict, to_dicts
+from scraper import LinkedInScraper
+from utils import clean_text, format_epoch_dates
+
+
+def make_job(i=0, **fields):
+    return JobRecord(
+        job_id=str(i), title="Engineer", company="Acme", location="Berlin",
+        description="x" * 500, posted_at="2025-01-01",
+        job_url=f"https://www.linkedin.com/jobs/view/{i}/", scraped_at="2025-01-01T00:00:00",
+        **fields,
+    )
+
+
+class TestRecord:
+    """Test the mapping view of records."""
+
+    def test_mapping_access(self):
+        job = make_job()
+        assert job["title"] == "Engineer"
+        assert job.get("company") == "Acme"
+        assert job.get("salary", "n/a") == "n/a"
+        assert "title" in job and "salary" not in job
+        with pytest.raises(KeyError):
+            job["salary"]
+
+    def test_unknown_field(self):
+        with pytest.raises(TypeError):
+            JobRecord(salary=100)
+
+    def test_omitted_none_fields(self):
+        profile = ProfileRecord(profile_id="jane", headline=None)
+        assert "headline" not in profile
+        assert profile.get("headline") is None
+        assert profile.to_dict() == {"profile_id": "jane"}
+        assert profile == {"profile_id": "jane"}
+
+    def test_no_instance_dict(self):
+        assert not hasattr(make_job(), "__dict__")
+
+    def test_json(self):
+        data = {"results": [make_job()], "profile": ProfileRecord(profile_id="jane")}
+        decoded = json.loads(json.dumps(data, default=json_default))
+        assert decoded["results"][0]["company"] == "Acme"
+        assert decoded["profile"] == {"profile_id": "jane"}
+        assert to_dict({"error": "x"}) == {"error": "x"}
+        assert to_dicts([make_job()])[0]["job_id"] == "0"
+
+    def test_job_summary_shortens_description(self):
+        summary = make_job().summary()
+        assert len(summary["description"]) == 200
+        assert "companyName" not in summary
+
+    def test_smaller_than_dicts(self):
+        def measure(build):
+            tracemalloc.start()
+            items = [build(i) for i in range(2000)]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            assert len(items) == 2000
+            return size
+
+        records = measure(make_job)
+        dicts = measure(lambda i: {**make_job(i).to_dict(), "companyName": "Acme"})
+        assert records < dicts
+
+
+@pytest.mark.parametrize("job_data, company", [
+    ({"companyName": "Tech Corp", "company": "Other"}, "Tech Corp"),
+    ({"company": {"name": "Tech Corp"}}, "Tech Corp"),
+    ({"company": "Tech Corp"}, "Tech Corp"),
+    ({"companyDetails": {"name": "Tech Corp"}}, "Tech Corp"),
+    ({"company": {}, "companyDetails": {"name": "Tech Corp"}}, "Tech Corp"),
+    ({}, "Company Information Available"),
+])
+def test_job_company_precedence(job_data, company):
+    job = LinkedInScraper()._format_job_data({"entityUrn": "urn:li:job:1", **job_data})
+    assert job["company"] == company
+
+
+def test_batch_job_formatter():
+    listed_at = 1735732800000
+    jobs = LinkedInScraper()._format_jobs([
+        {"entityUrn": "urn:li:job:1", "listedAt": listed_at, "description": "  Build \n\n things  " * 200},
+        {"entityUrn": "urn:li:job:2", "originalListedAt": "2 days ago"},
+        {"entityUrn": "urn:li:job:3"},
+    ])
+    assert [job.job_id for job in jobs] == ["1", "2", "3"]
+    assert len({job.scraped_at for job in jobs}) == 1
+    assert [job.posted_at for job in jobs] == [
+        datetime.fromtimestamp(listed_at / 1000).strftime("%Y-%m-%d"), "2 days ago", "Recently",
+    ]
+    # Records keep the whole description; only the summary shortens it
+    assert jobs[0].description == clean_text("  Build \n\n things  " * 200)
+    assert jobs[0].summary()["description"] == jobs[0].description[:200]
+    assert jobs[1].description == ""
+
+
+def test_format_epoch_dates():
+    assert format_epoch_dates([0, None, "today", 1735732800000.0]) == [
+        None, None, None, datetime.fromtimestamp(1735732800).strftime("%Y-%m-%d"),
+    ]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the retry policy.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from errors import ThrottledError
+from retry import RetryPolicy, is_caller_error
+
+
+def http_error(status_code: int) -> requests.HTTPError:
+    """Build a requests HTTPError carrying a status code."""
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+@pytest.fixture
+def policy():
+    """A policy with negligible delays."""
+    return RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001)
+
+
+class TestClassification:
+    """Test which errors are retried."""
+
+    def test_permanent_errors(self, policy):
+        assert not policy.is_retryable(ValueError("Could not extract profile ID"))
+        assert not policy.is_retryable(http_error(404))
+
+    def test_transient_errors(self, policy):
+        assert policy.is_retryable(requests.ConnectionError())
+        assert policy.is_retryable(ThrottledError("slow down", 429))
+        assert policy.is_retryable(http_error(503))
+
+
+class TestCall:
+    """Test running functions under the policy."""
+
+    def test_permanent_error_fails_fast(self, policy):
+        func = Mock(side_effect=ValueError("bad url"), __name__="func")
+        with pytest.raises(ValueError):
+            policy.call(func)
+        assert func.call_count == 1
+
+    def test_transient_error_is_retried(self, policy):
+        func = Mock(side_effect=[requests.Timeout(), "ok"], __name__="func")
+        assert policy.call(func) == "ok"
+        assert func.call_count == 2
+
+    def test_gives_up_after_max_attempts(self, policy):
+        func = Mock(side_effect=requests.ConnectionError(), __name__="func")
+        with pytest.raises(requests.ConnectionError):
+            policy.call(func)
+        assert func.call_count == 3
+
+    def test_retry_after_beyond_deadline_gives_up(self):
+        policy = RetryPolicy(max_attempts=5, deadline=1.0)
+        func = Mock(side_effect=ThrottledError("slow down", 429, retry_after=30), __name__="func")
+        with pytest.raises(ThrottledError):
+            policy.call(func)
+        assert func.call_count == 1
+
+    def test_call_async(self, policy):
+        attempts = []
+
+        async def func():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise asyncio.TimeoutError()
+            return "ok"
+
+        assert asyncio.run(policy.call_async(func)) == "ok"
+        assert len(attempts) == 2
+
+
+@pytest.mark.parametrize("exc, expected", [
+    (ValueError("bad url"), True),
+    (http_error(404), True),
+    (http_error(401), False),
+    (http_error(403), False),
+    (http_error(429), False),
+    (KeyError("profile"), False),
+    (requests.exceptions.JSONDecodeError("Expecting value", "", 0), False),
+])
+def test_is_caller_error(exc, expected):
+    assert is_caller_error(exc) is expected
+
+
+def test_backoff_is_jittered_and_capped():
+    """Backoff stays within the exponential ceiling and max_delay."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert 0 <= policy.backoff(1) <= 2.0
+    assert all(0 <= policy.backoff(10) <= 5.0 for _ in range(20))
+    assert policy.backoff(0, ThrottledError("wait", retry_after=7)) == 7
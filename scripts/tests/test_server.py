@@ -0,0 +1,210 @@
+"""
+Unit tests for the MCP server's shared HTTP transport and in-process tools.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import uvicorn
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+import server
+from gemini_client import GeminiMCPClient, streamable_http_client
+from mcp import ClientSession
+from mcp.shared.memory import create_connected_server_and_client_session
+from records import CompanyRecord, JobRecord, PersonRecord
+from scraper import job_cursor, job_cursor_offset
+from tool_executor import ToolExecutor
+
+
+@pytest.fixture
+def http_server(monkeypatch):
+    """Run the streamable HTTP server on a free local port."""
+    monkeypatch.delenv("LINKEDIN_EMAIL", raising=False)
+    monkeypatch.delenv("LINKEDIN_PASSWORD", raising=False)
+    started = []
+    initialize_scraper = server.initialize_scraper
+    monkeypatch.setattr(server, "initialize_scraper", lambda: started.append(1) or initialize_scraper())
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    config = uvicorn.Config(server.create_http_app("streamable-http"), host="127.0.0.1", port=port, log_level="warning")
+    http = uvicorn.Server(config)
+    thread = threading.Thread(target=http.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not http.started:
+        assert time.monotonic() < deadline, "server did not start"
+        time.sleep(0.05)
+
+    yield f"http://127.0.0.1:{port}/mcp", started
+    http.should_exit = True
+    thread.join(10)
+
+
+async def call_tool(url, name, arguments):
+    async with streamable_http_client(url) as (read_stream, write_stream, _):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            tools = await session.list_tools()
+            result = await session.call_tool(name, arguments)
+            return [tool.name for tool in tools.tools], json.loads(result.content[0].text)
+
+
+def test_clients_share_one_server(http_server):
+    url, started = http_server
+
+    async def run():
+        return await asyncio.gather(*(
+            call_tool(url, "get_company_info", {"company_identifier": ""}) for _ in range(3)
+        ))
+
+    for tools, result in asyncio.run(run()):
+        assert set(tools) == set(server.TOOL_NAMES)
+        assert result["error"] == "company_identifier is required"
+    # Every connection was served by the one scraper started with the server
+    assert started == [1]
+
+
+def test_importing_server_keeps_logging_setup(tmp_path):
+    log_file = tmp_path / "server.log"
+    subprocess.run(
+        [sys.executable, "-c", "import server"],
+        cwd=Path(server.__file__).parent,
+        env={**os.environ, "LOG_FILE": str(log_file)},
+        check=True,
+    )
+    assert not log_file.exists()
+
+
+def test_unknown_http_transport():
+    with pytest.raises(ValueError):
+        server.create_http_app("carrier-pigeon")
+
+
+class StubScraper:
+    """Stands in for the shared scrapers, answering without LinkedIn."""
+
+    def get_company_info(self, company_identifier, cache_policy="use"):
+        return CompanyRecord(company_id=company_identifier, name="Acme")
+
+    def search_jobs(self, keywords, location=None, job_type=None, experience_level=None, limit=10, cache_policy="use"):
+        return [JobRecord(job_id="1", title=keywords, description="x" * 500)]
+
+    async def iter_jobs(
+        self, keywords, location=None, job_type=None, experience_level=None, cursor=None, max_results=None,
+        cache_policy="use",
+    ):
+        start = job_cursor_offset(cursor, keywords, location, job_type, experience_level) if cursor else 0
+        for offset in range(start, start + max_results, 25):
+            end = min(offset + 25, start + max_results)
+            jobs = [JobRecord(job_id=str(i), title=keywords) for i in range(offset, end)]
+            yield {"jobs": jobs, "next_cursor": job_cursor(end, keywords, location, job_type, experience_level)}
+
+    def search_people(self, keywords, location=None, current_company=None, limit=10, cache_policy="use"):
+        return [PersonRecord(profile_id=str(i), name=keywords, location=location) for i in range(limit)]
+
+    async def wait_for_login(self):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    stub = StubScraper()
+    monkeypatch.setattr(server, "scraper", stub)
+    monkeypatch.setattr(server, "async_scraper", stub)
+    monkeypatch.setattr(server, "tool_executor", ToolExecutor())
+    yield
+    server.tool_executor.shutdown()
+
+
+def test_execute_tool_returns_objects(stub_server):
+    async def run():
+        company = await server.execute_tool("get_company_info", {"company_identifier": "acme"})
+        jobs = await server.execute_tool("search_linkedin_jobs", {"keywords": "Engineer"})
+        with pytest.raises(ValueError):
+            await server.execute_tool("get_company_info", {})
+        text = (await server.call_tool("get_company_info", {"company_identifier": "acme"}))[0].text
+        return company, jobs, text
+
+    company, jobs, text = asyncio.run(run())
+    assert isinstance(company, CompanyRecord) and company["name"] == "Acme"
+    assert jobs["jobs"][0]["title"] == "Engineer" and len(jobs["jobs"][0]["description"]) == 200
+    # Fewer results than asked for: the search is exhausted
+    assert jobs["next_cursor"] is None
+    assert json.loads(text) == company.to_dict()
+
+
+def test_gemini_client_runs_tools_in_process(stub_server):
+    client = GeminiMCPClient(api_key="test-key", in_process=True)
+
+    async def run():
+        await client.connect()
+        return await client.call_tool("get_company_info", {"company_identifier": "acme"})
+
+    result = asyncio.run(run())
+    assert type(result) is dict and result["name"] == "Acme"
+    assert len(client.function_declarations) == len(server.TOOL_NAMES)
+
+
+def test_large_searches_report_pages(stub_server):
+    reports = []
+
+    async def progress(done, total, items):
+        reports.append((done, total, len(items)))
+
+    async def run():
+        jobs = await server.execute_tool("search_linkedin_jobs", {"keywords": "Engineer", "limit": 60}, progress)
+        people = await server.execute_tool(
+            "search_people", {"keywords": "Jane", "location": "Berlin", "limit": 30}, progress
+        )
+        return jobs, people
+
+    jobs, people = asyncio.run(run())
+    assert len(jobs["jobs"]) == 60 and len(people) == 30
+    # People searches keep their filters and the search cache, and report once
+    assert people[0].location == "Berlin"
+    assert reports == [(25, 60, 25), (50, 60, 25), (60, 60, 10), (30, 30, 30)]
+
+
+def test_progress_notifications_reach_client(stub_server):
+    events = []
+
+    async def record(event):
+        events.append(event)
+
+    async def run():
+        async with create_connected_server_and_client_session(server.app) as session:
+            client = GeminiMCPClient(api_key="test-key")
+            client.attach_session(session, (await session.list_tools()).tools)
+            client.on_progress = record
+            return await client.call_tool("search_linkedin_jobs", {"keywords": "Engineer", "limit": 60})
+
+    jobs = asyncio.run(run())["jobs"]
+    assert len(jobs) == 60
+    assert [(event["progress"], event["total"]) for event in events] == [(25, 60), (50, 60), (60, 60)]
+    assert events[0]["type"] == "progress" and events[0]["tool"] == "search_linkedin_jobs"
+    assert [job["job_id"] for event in events for job in event["items"]] == [job["job_id"] for job in jobs]
+
+
+def test_job_search_continues_from_cursor(stub_server):
+    async def run():
+        first = await server.execute_tool("search_linkedin_jobs", {"keywords": "Engineer", "limit": 60})
+        return await server.execute_tool(
+            "search_linkedin_jobs", {"keywords": "Engineer", "limit": 10, "cursor": first["next_cursor"]}
+        )
+
+    resumed = asyncio.run(run())
+    assert [job["job_id"] for job in resumed["jobs"]] == [str(i) for i in range(60, 70)]
+    assert job_cursor_offset(resumed["next_cursor"], "Engineer") == 70
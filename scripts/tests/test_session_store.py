@@ -0,0 +1,121 @@
+"""
+Unit tests for the encrypted session store.
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import linkedin_api.settings
+import pytest
+from cryptography.fernet import Fernet
+from linkedin_api import Linkedin
+from requests.cookies import RequestsCookieJar
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from session_store import SessionStore, create_api_client
+from scraper import LinkedInScraper
+
+
+def session_cookies(expires=None) -> RequestsCookieJar:
+    """A cookie jar like the one of a logged-in client."""
+    cookies = RequestsCookieJar()
+    cookies.set("li_at", "secret-token", domain=".linkedin.com", path="/", expires=expires)
+    cookies.set("JSESSIONID", '"ajax:123"', domain=".www.linkedin.com", path="/")
+    return cookies
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path / "sessions"), secret="password123")
+
+
+class TestSessionStore:
+    """Test saving and loading sessions."""
+
+    def test_round_trip(self, store):
+        store.save("Jane@example.com", session_cookies(), {"clientPageInstanceId": "abc"})
+        cookies, metadata = store.load("jane@example.com")
+
+        assert cookies["li_at"] == "secret-token"
+        assert metadata == {"clientPageInstanceId": "abc"}
+
+    def test_file_is_encrypted(self, store):
+        store.save("jane@example.com", session_cookies())
+        (path,) = store.directory.iterdir()
+        assert b"secret-token" not in path.read_bytes()
+        assert path.stat().st_mode & 0o077 == 0
+
+    def test_wrong_secret_is_ignored(self, store):
+        store.save("jane@example.com", session_cookies())
+        assert SessionStore(str(store.directory), secret="other").load("jane@example.com") is None
+
+    def test_explicit_key(self, tmp_path):
+        store = SessionStore(str(tmp_path), key=Fernet.generate_key())
+        store.save("jane@example.com", session_cookies())
+        assert store.load("jane@example.com") is not None
+
+    def test_expired_session_is_not_reused(self, store):
+        store.save("jane@example.com", session_cookies(expires=int(time.time()) - 10))
+        assert store.load("jane@example.com") is None
+
+        store.max_age = 0
+        store.save("jane@example.com", session_cookies())
+        assert store.load("jane@example.com") is None
+
+    def test_clear(self, store):
+        store.save("jane@example.com", session_cookies())
+        store.clear("jane@example.com")
+        assert store.load("jane@example.com") is None
+
+
+class TestScraperSessions:
+    """Test session reuse by the scraper."""
+
+    @patch("scraper.Linkedin")
+    def test_saved_session_skips_login(self, mock_linkedin):
+        mock_linkedin.return_value.client.cookies = session_cookies()
+        mock_linkedin.return_value.client.metadata = {}
+        LinkedInScraper(email="jane@example.com", password="password123").api_client
+        mock_linkedin.return_value.client.authenticate.assert_called_once_with("jane@example.com", "password123")
+
+        mock_linkedin.reset_mock()
+        LinkedInScraper(email="jane@example.com", password="password123").api_client
+        mock_linkedin.return_value.client.authenticate.assert_not_called()
+        assert mock_linkedin.return_value.client._set_session_cookies.call_args.args[0]["li_at"] == "secret-token"
+
+    @patch("scraper.Linkedin")
+    def test_rejected_session_logs_in_again(self, mock_linkedin):
+        scraper = LinkedInScraper(email="jane@example.com", password="password123")
+        scraper.api_client
+        scraper._last_login = 0.0
+        rejected = MagicMock(status_code=401, url="https://www.linkedin.com/voyager/api/identity/profiles/x")
+
+        def get_profile(profile_id):
+            if not scraper.api_client.client._do_authentication_request.called:
+                scraper._session_hook(rejected)
+                raise ValueError("Expecting value")
+            return {"public_id": profile_id, "firstName": "John"}
+
+        scraper.api_client.get_profile.side_effect = get_profile
+        profile = scraper.scrape_profile("https://linkedin.com/in/john-doe", cache_policy="bypass")
+
+        assert profile["first_name"] == "John"
+        scraper.api_client.client._do_authentication_request.assert_called_once_with("jane@example.com", "password123")
+
+
+def test_api_client_keeps_no_plaintext_cookies(tmp_path, monkeypatch):
+    monkeypatch.setattr(linkedin_api.settings, "COOKIE_PATH", f"{tmp_path}/")
+    jar = tmp_path / "jane@example.com.jr"
+    jar.write_bytes(b"pickled cookies")
+
+    client = create_api_client(Linkedin, "jane@example.com", "password123", cookies=session_cookies())
+    assert not jar.exists()
+    assert client.client.cookies["li_at"] == "secret-token"
+
+    # What the client's logins save its cookies with
+    client.client._cookie_repository.save(client.client.cookies, "jane@example.com")
+    assert list(tmp_path.iterdir()) == []
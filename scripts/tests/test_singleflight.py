@@ -0,0 +1,144 @@
+"""
+Unit tests for single-flight request coalescing.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+import cancellation
+from errors import ToolCancelledError
+from singleflight import SingleFlight, AsyncSingleFlight, flight_key
+from scraper import LinkedInScraper
+
+
+def test_flight_key_normalizes_arguments():
+    assert flight_key("jobs", keywords=" Python  Developer", location=None) == flight_key(
+        "jobs", keywords="python developer"
+    )
+    assert flight_key("jobs", keywords="python") != flight_key("people", keywords="python")
+
+
+class TestSingleFlight:
+    """Test thread-based coalescing."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        flights = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return {"name": "Google"}
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(flights.do, "google", fetch) for _ in range(5)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result == {"name": "Google"} for result in results)
+        assert flights.in_flight == 0
+
+    def test_cancelled_leader_is_not_shared(self):
+        flights = SingleFlight()
+        calls = []
+        cancel = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                # The leader waits until its own caller gives up on it
+                cancellation.sleep(5)
+            return {"name": "Google"}
+
+        def leader():
+            with cancellation.cancel_scope(cancel):
+                return flights.do("google", fetch)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leading = pool.submit(leader)
+            time.sleep(0.05)
+            following = pool.submit(flights.do, "google", fetch)
+            time.sleep(0.05)
+            cancel.set()
+            with pytest.raises(ToolCancelledError):
+                leading.result(1)
+            assert following.result(1) == {"name": "Google"}
+
+        assert len(calls) == 2
+        assert flights.in_flight == 0
+
+    def test_errors_are_shared(self):
+        flights = SingleFlight()
+        release = threading.Event()
+
+        def fetch():
+            release.wait(1)
+            raise RuntimeError("upstream down")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flights.do, "google", fetch) for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError):
+                    future.result()
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flights = SingleFlight()
+        fetch = MagicMock(return_value=1)
+        flights.do("k", fetch)
+        flights.do("k", fetch)
+        assert fetch.call_count == 2
+
+
+def test_async_single_flight():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*(flights.do("k", fetch) for _ in range(4)))
+
+    assert asyncio.run(run()) == ["ok"] * 4
+    assert len(calls) == 1
+
+
+def test_scraper_coalesces_identical_searches():
+    scraper = LinkedInScraper()
+    release = threading.Event()
+    scraper.api_client = MagicMock()
+
+    def search_people(**kwargs):
+        release.wait(1)
+        return [{"public_id": "jane-smith", "firstName": "Jane", "lastName": "Smith"}]
+
+    scraper.api_client.search_people.side_effect = search_people
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(scraper.search_people, keywords=keywords)
+            for keywords in ("Data Scientist", "data scientist", " Data  Scientist ")
+        ]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert scraper.api_client.search_people.call_count == 1
+    assert all(result[0]["name"] == "Jane Smith" for result in results)
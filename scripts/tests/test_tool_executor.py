@@ -0,0 +1,136 @@
+"""
+Unit tests for the bounded tool executor and cooperative cancellation.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+import cancellation
+from errors import ThrottledError, ToolCancelledError
+from retry import RetryPolicy
+from tool_executor import ToolExecutor
+
+
+def test_blocking_calls_run_side_by_side():
+    executor = ToolExecutor(max_workers=4)
+
+    async def run():
+        started = time.monotonic()
+        ticks = []
+
+        async def tick():
+            # The event loop stays free while the tools block
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        results = await asyncio.gather(
+            executor.run("a", time.sleep, 0.2),
+            executor.run("b", time.sleep, 0.2),
+            tick(),
+        )
+        return time.monotonic() - started, ticks, results
+
+    elapsed, ticks, _ = asyncio.run(run())
+    executor.shutdown()
+    assert elapsed < 0.35
+    assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.15
+
+
+def test_per_tool_concurrency():
+    executor = ToolExecutor(max_workers=8, concurrency={"slow": 2})
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def work():
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    async def run():
+        await asyncio.gather(*(executor.run("slow", work) for _ in range(6)))
+
+    asyncio.run(run())
+    executor.shutdown()
+    assert max(peak) == 2
+    assert executor.limit("slow") == 2 and executor.limit("other") == 4
+
+
+def test_timeout_cancels_blocking_work():
+    executor = ToolExecutor(timeout=0.1)
+    finished = threading.Event()
+
+    def work():
+        try:
+            cancellation.sleep(5)
+        except ToolCancelledError:
+            finished.set()
+            raise
+
+    async def run():
+        with pytest.raises(TimeoutError):
+            await executor.run("profile", work)
+
+    asyncio.run(run())
+    assert finished.wait(1)
+    executor.shutdown()
+
+
+def test_cancelled_call_stops_retrying():
+    executor = ToolExecutor()
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        raise ThrottledError("slow down", status_code=429, retry_after=5)
+
+    policy = RetryPolicy(max_attempts=5, deadline=None)
+
+    async def run():
+        task = asyncio.create_task(executor.run("jobs", policy.call, flaky))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The slot is given back once the worker thread has stopped
+        for _ in range(50):
+            if executor._semaphore("jobs")._value == executor.limit("jobs"):
+                break
+            await asyncio.sleep(0.02)
+        return executor._semaphore("jobs")._value
+
+    started = time.monotonic()
+    assert asyncio.run(run()) == executor.limit("jobs")
+    assert time.monotonic() - started < 1.5
+    assert len(attempts) == 1
+    executor.shutdown()
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("TOOL_CONCURRENCY", "3")
+    monkeypatch.setenv("TOOL_CONCURRENCY_SEARCH_PEOPLE", "1")
+    monkeypatch.setenv("TOOL_TIMEOUT", "0")
+    executor = ToolExecutor.from_env(["search_people", "get_company_info"])
+    assert executor.limit("search_people") == 1
+    assert executor.limit("get_company_info") == 3
+    assert executor.timeout is None
+    executor.shutdown()
+
+
+def test_sleep_outside_a_call():
+    started = time.monotonic()
+    cancellation.sleep(0.01)
+    cancellation.check_cancelled()
+    assert time.monotonic() - started >= 0.01
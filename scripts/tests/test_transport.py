@@ -0,0 +1,246 @@
+"""
+Unit tests for the page transports and conditional revalidation.
+"""
+
+import asyncio
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from async_scraper import AsyncLinkedInScraper
+from cache import ResponseCache
+from scraper import LinkedInScraper
+from transport import (
+    ConditionalTransport,
+    HttpxTransport,
+    RequestsTransport,
+    Revalidator,
+    Transport,
+    transport_from_env,
+    HTTP2_AVAILABLE,
+)
+
+
+PAGE = (
+    b"<html><body><h1 class='top-card-layout__title'>Jane Doe</h1>"
+    + b"<p>filler</p>" * 2000
+    + b"</body></html>"
+)
+
+
+class PageServer:
+    """A local page server honouring If-None-Match and If-Modified-Since."""
+
+    def __init__(self, etag='"v1"', last_modified=None):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.statuses = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                unchanged = (
+                    (server.etag and self.headers.get("If-None-Match") == server.etag)
+                    or (server.last_modified and self.headers.get("If-Modified-Since") == server.last_modified)
+                )
+                self.send_response(304 if unchanged else 200)
+                if server.etag:
+                    self.send_header("ETag", server.etag)
+                if server.last_modified:
+                    self.send_header("Last-Modified", server.last_modified)
+                if unchanged:
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                else:
+                    self.send_header("Content-Length", str(len(PAGE)))
+                    self.end_headers()
+                    self.wfile.write(PAGE)
+                server.statuses.append(304 if unchanged else 200)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/in/jane-doe"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def page_server():
+    servers = []
+
+    def start(**kwargs):
+        server = PageServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture
+def revalidator(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    yield Revalidator(cache)
+    cache.close()
+
+
+def read(response, limit=None):
+    """Read a response's body (or its first ``limit`` bytes) and close it."""
+    body = b""
+    for chunk in response.iter_content(1024):
+        body += chunk
+        if limit and len(body) >= limit:
+            break
+    response.close()
+    return body
+
+
+def test_revalidates_with_etag(page_server, revalidator):
+    server = page_server()
+    transport = ConditionalTransport(RequestsTransport(requests.Session()), revalidator)
+
+    first = transport.get(server.url)
+    assert not first.from_cache
+    assert read(first) == PAGE
+
+    second = transport.get(server.url)
+    assert second.status_code == 200 and second.from_cache
+    assert read(second) == PAGE
+    assert server.statuses == [200, 304]
+    assert revalidator.revalidated == 1
+
+
+def test_revalidates_with_last_modified(page_server, revalidator):
+    server = page_server(etag=None, last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+    transport = ConditionalTransport(RequestsTransport(requests.Session()), revalidator)
+    read(transport.get(server.url))
+    assert read(transport.get(server.url)) == PAGE
+    assert server.statuses == [200, 304]
+
+
+def test_page_read_partially_is_not_stored(page_server, revalidator):
+    server = page_server()
+    transport = ConditionalTransport(RequestsTransport(requests.Session()), revalidator)
+    assert len(read(transport.get(server.url), limit=1024)) < len(PAGE)
+    assert revalidator.lookup(server.url) is None
+    assert read(transport.get(server.url)) == PAGE
+    assert read(transport.get(server.url)) == PAGE
+    assert server.statuses == [200, 200, 304]
+
+
+def test_changed_page_is_downloaded_again(page_server, revalidator):
+    server = page_server()
+    transport = ConditionalTransport(RequestsTransport(requests.Session()), revalidator)
+    read(transport.get(server.url))
+    server.etag = '"v2"'
+    response = transport.get(server.url)
+    assert not response.from_cache
+    assert read(response) == PAGE
+    assert server.statuses == [200, 200]
+
+
+def test_pages_without_validators_are_not_stored(page_server, revalidator):
+    server = page_server(etag=None)
+    transport = ConditionalTransport(RequestsTransport(requests.Session()), revalidator)
+    read(transport.get(server.url))
+    read(transport.get(server.url))
+    assert server.statuses == [200, 200]
+    assert revalidator.lookup(server.url) is None
+
+
+def test_httpx_transport(page_server, revalidator):
+    server = page_server()
+    transport = ConditionalTransport(HttpxTransport({"Connection": "keep-alive"}, http2=False), revalidator)
+    try:
+        assert read(transport.get(server.url)) == PAGE
+        assert transport.get(server.url).from_cache
+    finally:
+        transport.close()
+
+
+def test_httpx_transport_raises_requests_errors():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    transport = HttpxTransport(http2=False)
+    with pytest.raises(requests.ConnectionError):
+        transport.get(f"http://127.0.0.1:{port}/")
+    transport.close()
+
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+
+
+def test_async_fetch_goes_through_transport(page_server, revalidator):
+    server = page_server()
+    transport = ConditionalTransport(RequestsTransport(requests.Session()), revalidator)
+
+    async def read_async(limit=None):
+        response = await transport.get_async(server.url)
+        body = b""
+        try:
+            async for chunk in response.iter_content(1024):
+                body += chunk
+                if limit and len(body) >= limit:
+                    break
+        finally:
+            await response.close()
+        return response, body
+
+    # A page the reader stopped early is not stored; one read to the end is
+    assert asyncio.run(read_async(limit=1024))[1] == PAGE[:1024]
+    assert revalidator.lookup(server.url) is None
+    assert asyncio.run(read_async())[1] == PAGE
+    response, body = asyncio.run(read_async())
+    assert response.from_cache and body == PAGE
+    assert server.statuses == [200, 200, 304]
+
+
+def test_transport_from_env(monkeypatch, revalidator):
+    monkeypatch.setenv("HTTP_TRANSPORT", "requests")
+    transport = transport_from_env(requests.Session(), revalidator=revalidator)
+    assert isinstance(transport, ConditionalTransport)
+    assert isinstance(transport.transport, RequestsTransport)
+
+    monkeypatch.setenv("HTTP_TRANSPORT", "auto")
+    transport = transport_from_env(requests.Session())
+    assert isinstance(transport, HttpxTransport if HTTP2_AVAILABLE else RequestsTransport)
+    transport.close()
+
+    monkeypatch.setenv("HTTP_TRANSPORT", "carrier-pigeon")
+    with pytest.raises(ValueError):
+        transport_from_env(requests.Session())
+
+
+def test_scrapers_revalidate_profile_pages(page_server):
+    server = page_server()
+    scraper = LinkedInScraper()
+    assert scraper._scrape_profile_web(server.url)["name"] == "Jane Doe"
+    assert scraper._scrape_profile_web(server.url)["name"] == "Jane Doe"
+
+    async_scraper = AsyncLinkedInScraper(scraper=scraper)
+
+    async def run():
+        try:
+            return await async_scraper._scrape_profile_web(server.url)
+        finally:
+            await async_scraper.close()
+
+    assert asyncio.run(run())["name"] == "Jane Doe"
+    assert server.statuses == [200, 304, 304]